@@ -0,0 +1,38 @@
+"""add longitudinal_events activity indexes
+
+Revision ID: 7c1e4b2a9d31
+Revises: 825a6e002e17
+Create Date: 2026-10-17 09:00:00.000000
+
+Composite indexes backing the engagement/analytics aggregates:
+- (user_id, event_type, timestamp DESC): per-type max(timestamp) and windowed counts
+- (user_id, timestamp DESC): unfiltered last-activity lookups
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e4b2a9d31'
+down_revision: Union[str, None] = '825a6e002e17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_levent_user_type_ts',
+        'longitudinal_events',
+        ['user_id', 'event_type', sa.text('timestamp DESC')],
+    )
+    op.create_index(
+        'ix_levent_user_ts',
+        'longitudinal_events',
+        ['user_id', sa.text('timestamp DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_levent_user_ts', table_name='longitudinal_events')
+    op.drop_index('ix_levent_user_type_ts', table_name='longitudinal_events')
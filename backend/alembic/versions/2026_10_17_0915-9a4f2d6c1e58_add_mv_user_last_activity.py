@@ -0,0 +1,49 @@
+"""add mv_user_last_activity materialized view
+
+Revision ID: 9a4f2d6c1e58
+Revises: 7c1e4b2a9d31
+Create Date: 2026-10-17 09:15:00.000000
+
+Pre-aggregates per-user last-activity timestamps (any / writing / supervision)
+from longitudinal_events. The unique index on user_id allows
+REFRESH MATERIALIZED VIEW CONCURRENTLY.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4f2d6c1e58'
+down_revision: Union[str, None] = '7c1e4b2a9d31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_user_last_activity AS
+        SELECT
+            user_id,
+            max(timestamp) AS last_any,
+            max(timestamp) FILTER (
+                WHERE event_type IN ('document_uploaded')
+            ) AS last_writing,
+            max(timestamp) FILTER (
+                WHERE event_type IN ('supervision_logged', 'supervision_feedback_received')
+            ) AS last_supervision
+        FROM longitudinal_events
+        GROUP BY user_id
+        """
+    )
+    op.create_index(
+        'ux_mv_user_last_activity_user_id',
+        'mv_user_last_activity',
+        ['user_id'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ux_mv_user_last_activity_user_id', table_name='mv_user_last_activity')
+    op.execute("DROP MATERIALIZED VIEW mv_user_last_activity")
@@ -0,0 +1,32 @@
+"""add partial index on open timeline milestones
+
+Revision ID: b3e8d5f2a4c7
+Revises: 9a4f2d6c1e58
+Create Date: 2026-10-17 09:30:00.000000
+
+Partial index on timeline_milestones (timeline_stage_id) WHERE is_completed IS false,
+backing the grouped overdue-milestone count in institutional analytics.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e8d5f2a4c7'
+down_revision: Union[str, None] = '9a4f2d6c1e58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_tmilestone_open_stage',
+        'timeline_milestones',
+        ['timeline_stage_id'],
+        postgresql_where=sa.text('is_completed IS false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tmilestone_open_stage', table_name='timeline_milestones')
@@ -0,0 +1,33 @@
+"""add BRIN index on longitudinal_events.timestamp
+
+Revision ID: d1f6a9c3b7e2
+Revises: b3e8d5f2a4c7
+Create Date: 2026-10-17 09:45:00.000000
+
+longitudinal_events is append-only, so timestamp correlates with physical row
+order; a BRIN index serves the cohort-wide "timestamp >= now() - N days" scans
+in institutional analytics at a fraction of a btree's size.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1f6a9c3b7e2'
+down_revision: Union[str, None] = 'b3e8d5f2a4c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_levent_ts_brin',
+        'longitudinal_events',
+        ['timestamp'],
+        postgresql_using='brin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_levent_ts_brin', table_name='longitudinal_events')
@@ -0,0 +1,45 @@
+"""add unique per-day index on engagement reminders
+
+Revision ID: e4a7c2d9f813
+Revises: d1f6a9c3b7e2
+Create Date: 2026-10-17 10:00:00.000000
+
+At most one reminder per (user_id, kind, UTC day); monthly digests are excluded.
+Inactivity detection inserts with ON CONFLICT DO NOTHING against this index.
+Existing same-day duplicates are collapsed to the earliest row first.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a7c2d9f813'
+down_revision: Union[str, None] = 'd1f6a9c3b7e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        DELETE FROM engagement_events e
+        USING engagement_events d
+        WHERE e.kind <> 'monthly_digest'
+          AND e.user_id = d.user_id
+          AND e.kind = d.kind
+          AND (e.triggered_at AT TIME ZONE 'UTC')::date = (d.triggered_at AT TIME ZONE 'UTC')::date
+          AND (e.triggered_at, e.id) > (d.triggered_at, d.id)
+        """
+    )
+    op.create_index(
+        'ux_engagement_reminder_per_day',
+        'engagement_events',
+        ['user_id', 'kind', sa.text("((triggered_at AT TIME ZONE 'UTC')::date)")],
+        unique=True,
+        postgresql_where=sa.text("kind <> 'monthly_digest'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ux_engagement_reminder_per_day', table_name='engagement_events')
@@ -0,0 +1,44 @@
+"""add user_week_event_counts rollup
+
+Revision ID: f2b9e6a1c4d7
+Revises: e4a7c2d9f813
+Create Date: 2026-10-17 10:15:00.000000
+
+Per-user weekly event counts (UTC weeks starting Monday), maintained by the
+event store on append and read by the continuity signal. Backfilled from
+longitudinal_events.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b9e6a1c4d7'
+down_revision: Union[str, None] = 'e4a7c2d9f813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_week_event_counts',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('week_start', sa.Date(), nullable=False),
+        sa.Column('event_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('user_id', 'week_start'),
+    )
+    op.execute(
+        """
+        INSERT INTO user_week_event_counts (user_id, week_start, event_count)
+        SELECT user_id,
+               date_trunc('week', timestamp AT TIME ZONE 'UTC')::date,
+               count(*)
+        FROM longitudinal_events
+        GROUP BY 1, 2
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('user_week_event_counts')
@@ -0,0 +1,64 @@
+"""replace mv_user_last_activity with incrementally maintained user_activity_summary
+
+Revision ID: a6c3d8e2f915
+Revises: f2b9e6a1c4d7
+Create Date: 2026-10-17 10:30:00.000000
+
+user_activity_summary holds the same per-user last-activity timestamps as the
+materialized view, but is upserted by the event store on every append, so it
+never needs a refresh and per-user reads are current. Backfilled from
+longitudinal_events; the view is dropped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c3d8e2f915'
+down_revision: Union[str, None] = 'f2b9e6a1c4d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+LAST_ACTIVITY_SELECT = """
+    SELECT
+        user_id,
+        max(timestamp) AS last_any,
+        max(timestamp) FILTER (
+            WHERE event_type IN ('document_uploaded')
+        ) AS last_writing,
+        max(timestamp) FILTER (
+            WHERE event_type IN ('supervision_logged', 'supervision_feedback_received')
+        ) AS last_supervision
+    FROM longitudinal_events
+    GROUP BY user_id
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_activity_summary',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('last_any', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_writing', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_supervision', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+    op.execute(
+        "INSERT INTO user_activity_summary (user_id, last_any, last_writing, last_supervision)"
+        + LAST_ACTIVITY_SELECT
+    )
+    op.drop_index('ux_mv_user_last_activity_user_id', table_name='mv_user_last_activity')
+    op.execute("DROP MATERIALIZED VIEW mv_user_last_activity")
+
+
+def downgrade() -> None:
+    op.execute("CREATE MATERIALIZED VIEW mv_user_last_activity AS" + LAST_ACTIVITY_SELECT)
+    op.create_index(
+        'ux_mv_user_last_activity_user_id',
+        'mv_user_last_activity',
+        ['user_id'],
+        unique=True,
+    )
+    op.drop_table('user_activity_summary')
@@ -0,0 +1,32 @@
+"""add (user_id, event_date DESC, id DESC) index on progress_events
+
+Revision ID: c8d2f4a7b1e6
+Revises: a6c3d8e2f915
+Create Date: 2026-10-17 10:45:00.000000
+
+Backs ProgressService user event listings (filter by user, newest first, LIMIT):
+an index scan in order instead of sorting every event of the user. id is the
+deterministic tie-break for events sharing an event_date.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d2f4a7b1e6'
+down_revision: Union[str, None] = 'a6c3d8e2f915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_progress_events_user_date',
+        'progress_events',
+        ['user_id', sa.text('event_date DESC'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_progress_events_user_date', table_name='progress_events')
@@ -1,6 +1,6 @@
 """Document API endpoints. RBAC: Timeline/edit context — Researcher uploads for self only."""
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File, Form
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
@@ -13,7 +13,7 @@ from app.services.document_service import (
     DocumentServiceError,
     UnsupportedFileTypeError,
 )
-from app.services.stage_suggestion_service import StageSuggestionService
+from app.services.stage_suggestion_service import StageSuggestionService, regenerate_timeline
 
 router = APIRouter()
 
@@ -153,21 +153,28 @@ def accept_stage_suggestion(
 def override_stage_suggestion(
     document_id: UUID,
     body: StageOverrideBody,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> dict:
     """
     Override with user-chosen stage. Logs stage_override event, stores override_reason
     and system_suggested_stage, triggers timeline regeneration. Does not delete historical data.
+    Regeneration runs as a background task after the response is sent.
     """
     if not body.stage.strip():
         raise HTTPException(status_code=400, detail="stage is required")
     svc = StageSuggestionService(db)
     suggestion = svc.override_stage(
-        document_id, current_user.id, override_stage=body.stage.strip(), override_reason=body.reason or ""
+        document_id,
+        current_user.id,
+        override_stage=body.stage.strip(),
+        override_reason=body.reason or "",
+        regenerate=False,
     )
     if not suggestion:
         raise HTTPException(status_code=404, detail="Document or stage suggestion not found")
+    background_tasks.add_task(regenerate_timeline, current_user.id)
     return {
         "document_id": str(document_id),
         "override_stage": suggestion.override_stage,
@@ -10,7 +10,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 
 from app.database import get_db
 from app.core.security import get_current_user
@@ -147,7 +147,15 @@ def acknowledge_reminder(
     """Mark a reminder as acknowledged (e.g. when user dismisses in dashboard)."""
     from datetime import timezone
     from fastapi import HTTPException
-    r = db.query(EngagementEvent).filter(EngagementEvent.id == reminder_id, EngagementEvent.user_id == current_user.id).first()
+    r = (
+        db.query(EngagementEvent)
+        .options(defer(EngagementEvent.payload))
+        .filter(
+            EngagementEvent.id == reminder_id,
+            EngagementEvent.user_id == current_user.id,
+        )
+        .first()
+    )
     if not r:
         raise HTTPException(status_code=404, detail="Reminder not found")
     r.acknowledged_at = datetime.now(timezone.utc)
@@ -26,6 +26,8 @@ router = APIRouter()
 class EvidenceResponse(BaseModel):
     contributing_event_ids: List[str]
     time_window: dict
+    total_event_count: int = 0
+    truncated: bool = False
 
 
 class InterpretableSignalResponse(BaseModel):
@@ -71,6 +73,8 @@ def get_intelligence_signals(
                 evidence=EvidenceResponse(
                     contributing_event_ids=item["evidence"]["contributing_event_ids"],
                     time_window=item["evidence"]["time_window"],
+                    total_event_count=item["evidence"]["total_event_count"],
+                    truncated=item["evidence"]["truncated"],
                 ),
                 explanation=item["explanation"],
                 recommendation=item["recommendation"],
@@ -123,6 +127,8 @@ def get_single_signal(
         evidence=EvidenceResponse(
             contributing_event_ids=payload["evidence"]["contributing_event_ids"],
             time_window=payload["evidence"]["time_window"],
+            total_event_count=payload["evidence"]["total_event_count"],
+            truncated=payload["evidence"]["truncated"],
         ),
         explanation=payload["explanation"],
         recommendation=payload["recommendation"],
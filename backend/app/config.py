@@ -15,6 +15,8 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
     DATABASE_ECHO: bool = False
+    # Compiled-statement cache entries per engine (SQLAlchemy default is 500)
+    DATABASE_QUERY_CACHE_SIZE: int = 1200
     
     # Security
     SECRET_KEY: str
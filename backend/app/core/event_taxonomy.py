@@ -43,9 +43,25 @@ class EventType(str, Enum):
 # Allowed event types (for validation)
 SUPPORTED_EVENT_TYPES = {e.value for e in EventType}
 
+# Event types that count as "writing" (document uploads, etc.)
+WRITING_EVENT_TYPES = frozenset({EventType.DOCUMENT_UPLOADED.value})
+
+# Event types that count as "supervision"
+SUPERVISION_EVENT_TYPES = frozenset({
+    EventType.SUPERVISION_LOGGED.value,
+    EventType.SUPERVISION_FEEDBACK_RECEIVED.value,
+})
+
 
 def metadata_with_version(metadata: Optional[Dict[str, Any]] = None, version: int = 1) -> Dict[str, Any]:
-    """Build versioned metadata dict. Ensures 'v' key for schema evolution."""
-    out = dict(metadata or {})
+    """
+    Build versioned metadata dict. Ensures 'v' key for schema evolution.
+    Returns the caller's dict unchanged (no copy) when it already carries this version.
+    """
+    if not metadata:
+        return {"v": version}
+    if metadata.get("v") == version:
+        return metadata
+    out = dict(metadata)
     out["v"] = version
     return out
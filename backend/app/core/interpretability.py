@@ -14,7 +14,6 @@ No signal should exist in the API without evidence and explanation.
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from uuid import UUID
 
 
 @dataclass(frozen=True)
@@ -26,17 +25,29 @@ class TimeWindow:
 
 @dataclass
 class Evidence:
-    """Evidence supporting the signal; traceable back to raw events."""
-    contributing_event_ids: List[UUID]  # LongitudinalEvent.event_id
+    """
+    Evidence supporting the signal; traceable back to raw events.
+    contributing_event_ids may be capped to the most recent events; truncated and
+    total_event_count then describe the full set in the window.
+    """
+    contributing_event_ids: List[str]  # LongitudinalEvent.event_id, as text
     time_window: TimeWindow
+    total_event_count: Optional[int] = None  # Defaults to len(contributing_event_ids)
+    truncated: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "contributing_event_ids": [str(e) for e in self.contributing_event_ids],
+            "contributing_event_ids": list(self.contributing_event_ids),
             "time_window": {
                 "start": self.time_window.start.isoformat(),
                 "end": self.time_window.end.isoformat(),
             },
+            "total_event_count": (
+                self.total_event_count
+                if self.total_event_count is not None
+                else len(self.contributing_event_ids)
+            ),
+            "truncated": self.truncated,
         }
 
 
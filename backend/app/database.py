@@ -11,12 +11,14 @@ if settings.DATABASE_URL.startswith("sqlite"):
     engine = create_engine(
         settings.DATABASE_URL,
         echo=settings.DATABASE_ECHO,
+        query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
         connect_args={"check_same_thread": False}  # SQLite-specific
     )
 else:
     engine = create_engine(
         settings.DATABASE_URL,
         echo=settings.DATABASE_ECHO,
+        query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
         pool_pre_ping=True,
         pool_size=10,
         max_overflow=20,
@@ -1,15 +1,20 @@
 """Main FastAPI application entry point."""
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
+from app.database import SessionLocal
 from app.api.deps import get_current_user
 from app.api.v1 import api_router
 from app.middleware.role_access import RoleBasedAccessMiddleware
 from app.models.user import User
 from app.api.v1.auth import router as auth_router
+from app.orchestrators.opportunity_feed_orchestrator import OpportunityFeedOrchestrator
+
+logger = logging.getLogger(__name__)
 
 openapi_url = "/openapi.json" if getattr(settings, "PUBLIC_OPENAPI_ENABLED", True) else None
 docs_url = "/docs" if getattr(settings, "PUBLIC_DOCS_ENABLED", True) and getattr(settings, "PUBLIC_OPENAPI_ENABLED", True) else None
@@ -29,6 +34,16 @@ else:
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
     # Startup: Initialize resources
+    if not settings.DATABASE_URL.startswith("sqlite"):
+        db = SessionLocal()
+        try:
+            OpportunityFeedOrchestrator.sync_catalog(db)
+        except Exception as e:
+            # Don't block startup; the nightly sync job will retry
+            db.rollback()
+            logger.warning(f"Opportunity catalog sync failed: {e}")
+        finally:
+            db.close()
     yield
     # Shutdown: Clean up resources
 
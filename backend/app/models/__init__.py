@@ -35,6 +35,8 @@ from app.models.opportunity import (
 )
 from app.models.risk_fusion import RiskWeightConfig, RiskAssessmentSnapshot
 from app.models.scoring_config import ScoringConfig
+from app.models.user_last_activity import UserLastActivity
+from app.models.user_week_event_count import UserWeekEventCount
 
 __all__ = [
     'Base',
@@ -73,6 +75,8 @@ __all__ = [
     'RiskWeightConfig',
     'RiskAssessmentSnapshot',
     'ScoringConfig',
+    'UserLastActivity',
+    'UserWeekEventCount',
 ]
 
 # Ensure all models are imported for Alembic to detect them
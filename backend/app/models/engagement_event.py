@@ -4,7 +4,7 @@ Engagement events: reminders (inactivity flags) and monthly digest snapshots.
 Consumed by dashboard/API; no UI logic in backend. Feeds engagement signals into intelligence layer.
 """
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
@@ -52,3 +52,15 @@ class EngagementEvent(Base, BaseModel):
 
     # Relationships
     user = relationship("User", back_populates="engagement_events")
+
+    __table_args__ = (
+        # One reminder per (user, kind, UTC day); inserts use ON CONFLICT DO NOTHING
+        Index(
+            "ux_engagement_reminder_per_day",
+            user_id,
+            kind,
+            text("((triggered_at AT TIME ZONE 'UTC')::date)"),
+            unique=True,
+            postgresql_where=text(f"kind <> '{ENGAGEMENT_KIND_MONTHLY_DIGEST}'"),
+        ),
+    )
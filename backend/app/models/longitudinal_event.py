@@ -7,7 +7,7 @@ No update/delete; audit trail only.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 import uuid
 
@@ -21,7 +21,6 @@ class LongitudinalEvent(Base):
     """
 
     __tablename__ = "longitudinal_events"
-    __table_args__ = {"comment": "Append-only event log; do not update or delete rows."}
 
     event_id = Column(
         UUID(as_uuid=True),
@@ -37,3 +36,12 @@ class LongitudinalEvent(Base):
     metadata_ = Column("metadata", JSONB, nullable=False, default=dict)
     timestamp = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
     source_module = Column(String(128), nullable=False, index=True)
+
+    __table_args__ = (
+        # Per-user activity aggregates (max timestamp by type, windowed counts)
+        Index("ix_levent_user_type_ts", user_id, event_type, timestamp.desc()),
+        Index("ix_levent_user_ts", user_id, timestamp.desc()),
+        # Append-only, insertion-ordered timestamps: BRIN keeps wide time-range scans cheap
+        Index("ix_levent_ts_brin", timestamp, postgresql_using="brin"),
+        {"comment": "Append-only event log; do not update or delete rows."},
+    )
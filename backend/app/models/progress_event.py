@@ -1,6 +1,8 @@
 """ProgressEvent model."""
 from enum import Enum
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum as SqlEnum, Index, func
+from sqlalchemy import (
+    Column, String, Text, DateTime, ForeignKey, Enum as SqlEnum, Index, func, text
+)
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship
 
@@ -70,4 +72,5 @@ class ProgressEvent(Base, BaseModel):
 
     __table_args__ = (
         Index("ix_progress_events_tags_gin", "tags", postgresql_using="gin"),
+        Index("ix_progress_events_user_date", user_id, event_date.desc(), text("id DESC")),
     )
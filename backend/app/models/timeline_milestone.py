@@ -1,5 +1,5 @@
 """TimelineMilestone model."""
-from sqlalchemy import Column, String, Text, Integer, Date, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, Integer, Date, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -56,3 +56,12 @@ class TimelineMilestone(Base, BaseModel):
         back_populates="milestone",
         cascade="all, delete-orphan"
     )
+
+    __table_args__ = (
+        # Open milestones per stage: backs the overdue aggregates in analytics
+        Index(
+            "ix_tmilestone_open_stage",
+            timeline_stage_id,
+            postgresql_where=is_completed.is_(False),
+        ),
+    )
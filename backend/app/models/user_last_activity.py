@@ -0,0 +1,26 @@
+"""
+Per-user last-activity summary (user_activity_summary).
+
+One row per user with at least one longitudinal event: latest timestamp of any
+event, of a writing event and of a supervision event. Maintained by EventStore
+on every append (upsert with GREATEST), so reads are a primary-key lookup and
+always current within the writing transaction.
+"""
+
+from sqlalchemy import Column, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class UserLastActivity(Base):
+    """
+    Last event timestamps per user: any event, writing events, supervision events.
+    """
+
+    __tablename__ = "user_activity_summary"
+
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    last_any = Column(DateTime(timezone=True), nullable=True)
+    last_writing = Column(DateTime(timezone=True), nullable=True)
+    last_supervision = Column(DateTime(timezone=True), nullable=True)
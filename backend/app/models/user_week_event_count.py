@@ -0,0 +1,22 @@
+"""
+Per-user weekly event counts — rollup of longitudinal_events.
+
+One row per (user, UTC ISO week starting Monday) with at least one event.
+Maintained by EventStore on every append (upsert count = count + n); read by
+continuity signals instead of scanning raw events.
+"""
+
+from sqlalchemy import Column, Date, Integer
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class UserWeekEventCount(Base):
+    """Number of longitudinal events a user emitted in a given week."""
+
+    __tablename__ = "user_week_event_counts"
+
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    week_start = Column(Date, primary_key=True)  # Monday (UTC) of the event's week
+    event_count = Column(Integer, nullable=False, default=0)
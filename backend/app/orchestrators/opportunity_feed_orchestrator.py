@@ -9,6 +9,7 @@ Steps:
 5. Respect subscription gating
 """
 
+import copy
 from typing import Dict, List, Optional, Any
 from uuid import UUID
 from datetime import date
@@ -26,10 +27,49 @@ from app.services.opportunity_relevance_engine import (
     ResearchStage,
     OpportunityType,
 )
-from app.data.opportunities_catalog import get_active_opportunities
+from app.data.opportunities_catalog import get_active_opportunities, get_catalog
 from app.repositories.opportunity_repository import OpportunityRepository
 from app.repositories.timeline_repository import TimelineRepository
 from app.repositories.user_repository import UserRepository
+from app.utils.ttl_cache import TTLCache
+
+
+# Completed feed summaries keyed on (user_id, request_id) so client retries
+# and double-submits skip the idempotency lookup and the whole pipeline.
+FEED_RESULT_CACHE_TTL_SECONDS = 3600
+_feed_result_cache = TTLCache(ttl_seconds=FEED_RESULT_CACHE_TTL_SECONDS)
+
+# Catalog entries converted to Opportunity objects once per process, keyed by
+# opportunity_id; shared read-only across feeds (scoring never mutates them).
+_catalog_opportunities: Optional[Dict[str, Opportunity]] = None
+
+
+def _opportunity_from_catalog(opp_data: Dict[str, Any]) -> Opportunity:
+    return Opportunity(
+        opportunity_id=opp_data["opportunity_id"],
+        title=opp_data["title"],
+        opportunity_type=OpportunityType(opp_data["opportunity_type"]),
+        disciplines=opp_data["disciplines"],
+        eligible_stages=[
+            ResearchStage(stage) for stage in opp_data["eligible_stages"]
+        ],
+        deadline=opp_data["deadline"],
+        description=opp_data.get("description"),
+        keywords=opp_data.get("keywords", []),
+        funding_amount=opp_data.get("funding_amount"),
+        prestige_level=opp_data.get("prestige_level"),
+        geographic_scope=opp_data.get("geographic_scope")
+    )
+
+
+def _catalog_opportunity_map() -> Dict[str, Opportunity]:
+    global _catalog_opportunities
+    if _catalog_opportunities is None:
+        _catalog_opportunities = {
+            opp_data["opportunity_id"]: _opportunity_from_catalog(opp_data)
+            for opp_data in get_catalog()
+        }
+    return _catalog_opportunities
 
 
 class OpportunityFeedOrchestratorError(Exception):
@@ -78,6 +118,24 @@ class OpportunityFeedOrchestrator(BaseOrchestrator[Dict[str, Any]]):
         self.timeline_repository = TimelineRepository(db)
         self.opportunity_repository = OpportunityRepository(db)
     
+    @classmethod
+    def sync_catalog(cls, db: Session) -> int:
+        """
+        Idempotently upsert the active opportunities into the catalog table.
+        
+        Run at application startup and from the nightly sync job so that
+        feed generation only has to look up existing catalog rows.
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            Number of catalog entries synced
+        """
+        synced = OpportunityRepository(db).upsert_catalog_entries(get_active_opportunities())
+        db.commit()
+        return synced
+    
     def generate_feed(
         self,
         request_id: str,
@@ -112,7 +170,13 @@ class OpportunityFeedOrchestrator(BaseOrchestrator[Dict[str, Any]]):
         Raises:
             OpportunityFeedOrchestratorError: If user not found
         """
-        return self.execute(
+        cache_key = (str(user_id), request_id)
+        cached = _feed_result_cache.get(cache_key)
+        if cached is not None:
+            # Callers get their own copy; the cached summary is shared by the worker
+            return copy.deepcopy(cached)
+        
+        summary = self.execute(
             request_id=request_id,
             input_data={
                 "user_id": str(user_id),
@@ -122,6 +186,8 @@ class OpportunityFeedOrchestrator(BaseOrchestrator[Dict[str, Any]]):
                 "include_premium": include_premium
             }
         )
+        _feed_result_cache.set(cache_key, copy.deepcopy(summary))
+        return summary
     
     def _execute_pipeline(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -378,30 +444,9 @@ class OpportunityFeedOrchestrator(BaseOrchestrator[Dict[str, Any]]):
         Returns:
             List of Opportunity objects
         """
-        # Load from static catalog
-        catalog_data = get_active_opportunities()
-        
-        opportunities = []
-        for opp_data in catalog_data:
-            # Convert to Opportunity object
-            opportunity = Opportunity(
-                opportunity_id=opp_data["opportunity_id"],
-                title=opp_data["title"],
-                opportunity_type=OpportunityType(opp_data["opportunity_type"]),
-                disciplines=opp_data["disciplines"],
-                eligible_stages=[
-                    ResearchStage(stage) for stage in opp_data["eligible_stages"]
-                ],
-                deadline=opp_data["deadline"],
-                description=opp_data.get("description"),
-                keywords=opp_data.get("keywords", []),
-                funding_amount=opp_data.get("funding_amount"),
-                prestige_level=opp_data.get("prestige_level"),
-                geographic_scope=opp_data.get("geographic_scope")
-            )
-            opportunities.append(opportunity)
-        
-        return opportunities
+        # Active entries of the static catalog, as prebuilt Opportunity objects
+        catalog = _catalog_opportunity_map()
+        return [catalog[opp_data["opportunity_id"]] for opp_data in get_active_opportunities()]
     
     def _filter_by_subscription(
         self,
@@ -505,27 +550,31 @@ class OpportunityFeedOrchestrator(BaseOrchestrator[Dict[str, Any]]):
             subscription_tier=user_subscription_tier,
         )
         
-        # Store feed items
-        # First, get or create opportunity catalog entries
-        catalog_data = get_active_opportunities()
-        catalog_map = {opp["opportunity_id"]: opp for opp in catalog_data}
+        # Store feed items against catalog rows populated by sync_catalog(); rows the
+        # sync has not written yet (e.g. startup sync skipped) are upserted here
+        opportunity_ids = [score.opportunity_id for score in ranked_scores]
+        catalog_ids = self.opportunity_repository.get_catalog_ids_by_opportunity_ids(
+            opportunity_ids
+        )
+        missing = set(opportunity_ids) - set(catalog_ids)
+        if missing:
+            self.opportunity_repository.upsert_catalog_entries(
+                [entry for entry in get_catalog() if entry["opportunity_id"] in missing]
+            )
+            catalog_ids.update(
+                self.opportunity_repository.get_catalog_ids_by_opportunity_ids(list(missing))
+            )
         
         for rank, score in enumerate(ranked_scores, 1):
-            # Get or create catalog entry
-            catalog_entry_data = catalog_map.get(score.opportunity_id)
-            if not catalog_entry_data:
-                continue
-            
-            catalog_entry = self.opportunity_repository.get_catalog_by_opportunity_id(
-                score.opportunity_id,
-            )
-            
-            if not catalog_entry:
-                catalog_entry = self.opportunity_repository.create_catalog_entry(catalog_entry_data)
+            catalog_id = catalog_ids.get(score.opportunity_id)
+            if catalog_id is None:
+                raise OpportunityFeedOrchestratorError(
+                    f"Opportunity {score.opportunity_id} is not in the opportunity catalog"
+                )
             
             self.opportunity_repository.add_feed_item(
                 feed_snapshot_id=snapshot.id,
-                opportunity_catalog_id=catalog_entry.id,
+                opportunity_catalog_id=catalog_id,
                 rank=rank,
                 score=score,
             )
@@ -1,8 +1,11 @@
 """Opportunity repository."""
-from datetime import date
+from datetime import date, datetime
 from typing import Any
 from uuid import UUID
 
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
 from app.models.opportunity import (
     OpportunityCatalog,
     OpportunityFeedSnapshot,
@@ -19,29 +22,41 @@ class OpportunityRepository(BaseRepository):
             OpportunityCatalog.opportunity_id == opportunity_id,
         ).first()
 
+    def get_catalog_ids_by_opportunity_ids(self, opportunity_ids: list[str]) -> dict[str, UUID]:
+        if not opportunity_ids:
+            return {}
+        rows = self.db.query(OpportunityCatalog.opportunity_id, OpportunityCatalog.id).filter(
+            OpportunityCatalog.opportunity_id.in_(opportunity_ids),
+        ).all()
+        return {opportunity_id: catalog_id for opportunity_id, catalog_id in rows}
+
     def create_catalog_entry(self, catalog_entry_data: dict[str, Any]) -> OpportunityCatalog:
-        catalog_entry = OpportunityCatalog(
-            opportunity_id=catalog_entry_data["opportunity_id"],
-            title=catalog_entry_data["title"],
-            opportunity_type=catalog_entry_data["opportunity_type"],
-            disciplines=catalog_entry_data["disciplines"],
-            eligible_stages=catalog_entry_data["eligible_stages"],
-            deadline=catalog_entry_data["deadline"],
-            description=catalog_entry_data.get("description"),
-            keywords=catalog_entry_data.get("keywords", []),
-            funding_amount=catalog_entry_data.get("funding_amount"),
-            prestige_level=catalog_entry_data.get("prestige_level"),
-            geographic_scope=catalog_entry_data.get("geographic_scope"),
-            source_url=catalog_entry_data.get("source_url"),
-            organization=catalog_entry_data.get("organization"),
-            is_active=True,
-            requires_subscription=catalog_entry_data.get("requires_subscription", False),
-            subscription_tier=catalog_entry_data.get("subscription_tier"),
-        )
+        catalog_entry = OpportunityCatalog(**_catalog_row(catalog_entry_data))
         self.add(catalog_entry)
         self.flush()
         return catalog_entry
 
+    def upsert_catalog_entries(self, catalog_data: list[dict[str, Any]]) -> int:
+        rows = [_catalog_row(entry) for entry in catalog_data]
+        if not rows:
+            return 0
+        # SQLite (tests/local) shares PostgreSQL's ON CONFLICT DO UPDATE form
+        insert_ = sqlite_insert if self.db.get_bind().dialect.name == "sqlite" else pg_insert
+        stmt = insert_(OpportunityCatalog.__table__).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[OpportunityCatalog.opportunity_id],
+            set_={
+                **{
+                    column: stmt.excluded[column]
+                    for column in rows[0]
+                    if column != "opportunity_id"
+                },
+                "updated_at": datetime.utcnow(),
+            },
+        )
+        self.db.execute(stmt)
+        return len(rows)
+
     def create_feed_snapshot(
         self,
         user_id: UUID,
@@ -87,3 +102,24 @@ class OpportunityRepository(BaseRepository):
         )
         self.add(feed_item)
         return feed_item
+
+
+def _catalog_row(catalog_entry_data: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "opportunity_id": catalog_entry_data["opportunity_id"],
+        "title": catalog_entry_data["title"],
+        "opportunity_type": catalog_entry_data["opportunity_type"],
+        "disciplines": catalog_entry_data["disciplines"],
+        "eligible_stages": catalog_entry_data["eligible_stages"],
+        "deadline": catalog_entry_data["deadline"],
+        "description": catalog_entry_data.get("description"),
+        "keywords": catalog_entry_data.get("keywords", []),
+        "funding_amount": catalog_entry_data.get("funding_amount"),
+        "prestige_level": catalog_entry_data.get("prestige_level"),
+        "geographic_scope": catalog_entry_data.get("geographic_scope"),
+        "source_url": catalog_entry_data.get("source_url"),
+        "organization": catalog_entry_data.get("organization"),
+        "is_active": True,
+        "requires_subscription": catalog_entry_data.get("requires_subscription", False),
+        "subscription_tier": catalog_entry_data.get("subscription_tier"),
+    }
@@ -1,5 +1,6 @@
 """Analytics engine for aggregating timeline progress and journey health data."""
 import logging
+from collections import Counter
 from typing import Dict, List, Optional, Any
 from uuid import UUID
 from datetime import date, timedelta
@@ -921,10 +922,7 @@ class AnalyticsEngine:
                 duration_progress_percentage = (elapsed_days / timeline_duration_days) * 100
         
         # Event counts by type
-        event_counts = {}
-        for event in progress_events:
-            event_type = event.event_type
-            event_counts[event_type] = event_counts.get(event_type, 0) + 1
+        event_counts = dict(Counter(event.event_type for event in progress_events))
         
         # Milestone completion timeline (first and last completion dates)
         completed_milestones = [m for m in milestones if m.is_completed and m.actual_completion_date]
@@ -12,11 +12,12 @@ Engagement signals exposed for intelligence layer.
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
-from uuid import UUID
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.models.longitudinal_event import LongitudinalEvent
 from app.models.engagement_event import (
@@ -27,8 +28,9 @@ from app.models.engagement_event import (
     ENGAGEMENT_KIND_MONTHLY_DIGEST,
 )
 from app.models.user import User
-from app.core.event_taxonomy import EventType
-from app.services.event_store import emit_event
+from app.models.user_last_activity import UserLastActivity
+from app.core.event_taxonomy import EventType, SUPERVISION_EVENT_TYPES, WRITING_EVENT_TYPES
+from app.services.event_store import EventStore, emit_event
 
 
 # Inactivity thresholds (days)
@@ -36,20 +38,64 @@ DAYS_ANY_ACTIVITY = 14
 DAYS_WRITING_ACTIVITY = 30
 DAYS_SUPERVISION_ACTIVITY = 45
 
-# Event types that count as "writing" (document uploads, etc.)
-WRITING_EVENT_TYPES = {EventType.DOCUMENT_UPLOADED.value}
+SECONDS_PER_DAY = 86400
 
-# Event types that count as "supervision"
-SUPERVISION_EVENT_TYPES = {
-    EventType.SUPERVISION_LOGGED.value,
-    EventType.SUPERVISION_FEEDBACK_RECEIVED.value,
-}
+# Rows fetched per round-trip when streaming cohort-wide result sets
+COHORT_YIELD_PER = 1000
 
+# Monthly digest payload field -> counted event type
+DIGEST_COUNT_FIELDS = {
+    "milestones_updated": EventType.MILESTONE_UPDATED.value,
+    "documents_uploaded": EventType.DOCUMENT_UPLOADED.value,
+    "supervision_logs": EventType.SUPERVISION_LOGGED.value,
+    "supervision_feedback": EventType.SUPERVISION_FEEDBACK_RECEIVED.value,
+    "opportunity_saved": EventType.OPPORTUNITY_SAVED.value,
+    "opportunity_applied": EventType.OPPORTUNITY_APPLIED.value,
+    "questionnaire_completed": EventType.QUESTIONNAIRE_COMPLETED.value,
+}
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _month_bounds(year: int, month: int) -> Tuple[datetime, datetime]:
+    """Inclusive UTC start/end of a calendar month."""
+    start = datetime(year, month, 1, tzinfo=timezone.utc)
+    if month == 12:
+        end = datetime(year + 1, 1, 1, tzinfo=timezone.utc) - timedelta(microseconds=1)
+    else:
+        end = datetime(year, month + 1, 1, tzinfo=timezone.utc) - timedelta(microseconds=1)
+    return start, end
+
+
+def _digest_summary(year: int, month: int, counts: Dict[str, int]) -> Dict[str, Any]:
+    """Monthly digest payload from per-event-type counts."""
+    summary: Dict[str, Any] = {"year": year, "month": month}
+    summary.update({field: counts.get(et, 0) for field, et in DIGEST_COUNT_FIELDS.items()})
+    return summary
+
+
+def _last_activity_from_type_maxima(by_type: Dict[str, datetime]) -> Dict[str, Optional[datetime]]:
+    """Fold per-event-type max timestamps into the three last-activity buckets."""
+    return {
+        "last_any_activity": max(by_type.values(), default=None),
+        "last_writing_activity": max(
+            (ts for t, ts in by_type.items() if t in WRITING_EVENT_TYPES), default=None
+        ),
+        "last_supervision_activity": max(
+            (ts for t, ts in by_type.items() if t in SUPERVISION_EVENT_TYPES), default=None
+        ),
+    }
+
+
+def _reminder_insert():
+    """
+    INSERT for reminder rows that silently skips rows hitting ux_engagement_reminder_per_day
+    (one reminder per user, kind and UTC day), so reruns on the same day are no-ops.
+    """
+    return pg_insert(EngagementEvent).on_conflict_do_nothing()
+
+
 class EngagementEngine:
     """
     Evaluates inactivity rules from longitudinal events and creates engagement_events.
@@ -62,36 +108,38 @@ class EngagementEngine:
     def get_last_activity_timestamps(self, user_id: UUID) -> Dict[str, Optional[datetime]]:
         """
         Return last timestamp for: any event, writing event, supervision event.
-        Used by inactivity rules and by get_engagement_signals.
+        Used by inactivity rules and by get_engagement_signals. Single primary-key
+        lookup on user_activity_summary (kept current by EventStore).
         """
-        q_any = (
-            self.db.query(func.max(LongitudinalEvent.timestamp))
-            .filter(LongitudinalEvent.user_id == user_id)
-        )
-        last_any = q_any.scalar()
-
-        q_writing = (
-            self.db.query(func.max(LongitudinalEvent.timestamp))
-            .filter(
-                LongitudinalEvent.user_id == user_id,
-                LongitudinalEvent.event_type.in_(WRITING_EVENT_TYPES),
-            )
-        )
-        last_writing = q_writing.scalar()
-
-        q_supervision = (
-            self.db.query(func.max(LongitudinalEvent.timestamp))
-            .filter(
-                LongitudinalEvent.user_id == user_id,
-                LongitudinalEvent.event_type.in_(SUPERVISION_EVENT_TYPES),
-            )
-        )
-        last_supervision = q_supervision.scalar()
+        row = self.db.get(UserLastActivity, user_id)
+        if row is None:
+            return _last_activity_from_type_maxima({})
+        return {
+            "last_any_activity": row.last_any,
+            "last_writing_activity": row.last_writing,
+            "last_supervision_activity": row.last_supervision,
+        }
 
+    def get_last_activity_timestamps_for_all_users(
+        self,
+    ) -> Dict[UUID, Dict[str, Optional[datetime]]]:
+        """
+        Cohort-wide variant of get_last_activity_timestamps, read from user_activity_summary.
+        Users without any events are absent from the result.
+        """
+        rows = self.db.query(
+            UserLastActivity.user_id,
+            UserLastActivity.last_any,
+            UserLastActivity.last_writing,
+            UserLastActivity.last_supervision,
+        ).yield_per(COHORT_YIELD_PER)
         return {
-            "last_any_activity": last_any,
-            "last_writing_activity": last_writing,
-            "last_supervision_activity": last_supervision,
+            uid: {
+                "last_any_activity": last_any,
+                "last_writing_activity": last_writing,
+                "last_supervision_activity": last_supervision,
+            }
+            for uid, last_any, last_writing, last_supervision in rows
         }
 
     def get_engagement_signals(self, user_id: UUID) -> Dict[str, Any]:
@@ -99,77 +147,99 @@ class EngagementEngine:
         Return engagement flags and last-activity timestamps for intelligence layer.
         No UI logic; consumers (e.g. opportunity engine, notifications) decide how to use.
         """
-        ts = self.get_last_activity_timestamps(user_id)
+        return self._signals_from_timestamps(
+            user_id, self.get_last_activity_timestamps(user_id), _utcnow()
+        )
+
+    def get_engagement_signals_bulk(self, user_ids: List[UUID]) -> Dict[UUID, Dict[str, Any]]:
+        """
+        get_engagement_signals for several users, from one user_activity_summary query.
+        """
+        if not user_ids:
+            return {}
+        rows = self.db.query(
+            UserLastActivity.user_id,
+            UserLastActivity.last_any,
+            UserLastActivity.last_writing,
+            UserLastActivity.last_supervision,
+        ).filter(UserLastActivity.user_id.in_(user_ids))
+        timestamps = {
+            uid: {
+                "last_any_activity": last_any,
+                "last_writing_activity": last_writing,
+                "last_supervision_activity": last_supervision,
+            }
+            for uid, last_any, last_writing, last_supervision in rows
+        }
+        no_activity = _last_activity_from_type_maxima({})
         now = _utcnow()
+        return {
+            uid: self._signals_from_timestamps(uid, timestamps.get(uid, no_activity), now)
+            for uid in user_ids
+        }
+
+    def _signals_from_timestamps(
+        self,
+        user_id: UUID,
+        ts: Dict[str, Optional[datetime]],
+        now: datetime,
+    ) -> Dict[str, Any]:
+        """Apply the inactivity thresholds to precomputed last-activity timestamps."""
         last_any = ts["last_any_activity"]
         last_writing = ts["last_writing_activity"]
         last_supervision = ts["last_supervision_activity"]
 
-        def _ensure_utc(dt: Optional[datetime]) -> Optional[datetime]:
-            if dt is None:
-                return None
-            return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
-
-        last_any = _ensure_utc(last_any)
-        last_writing = _ensure_utc(last_writing)
-        last_supervision = _ensure_utc(last_supervision)
+        # One epoch conversion per timestamp; floor division matches timedelta.days
+        now_s = now.timestamp()
 
         def days_ago(dt: Optional[datetime]) -> Optional[int]:
             if dt is None:
                 return None
-            delta = now - dt
-            return delta.days
+            return int((now_s - dt.timestamp()) // SECONDS_PER_DAY)
 
-        low_engagement = last_any is None or (days_ago(last_any) or 0) >= DAYS_ANY_ACTIVITY
-        writing_inactivity = last_writing is None or (days_ago(last_writing) or 0) >= DAYS_WRITING_ACTIVITY
-        supervision_drift = last_supervision is None or (days_ago(last_supervision) or 0) >= DAYS_SUPERVISION_ACTIVITY
+        days_any = days_ago(last_any)
+        days_writing = days_ago(last_writing)
+        days_supervision = days_ago(last_supervision)
 
         return {
             "user_id": str(user_id),
-            "low_engagement": low_engagement,
-            "writing_inactivity": writing_inactivity,
-            "supervision_drift": supervision_drift,
+            "low_engagement": days_any is None or days_any >= DAYS_ANY_ACTIVITY,
+            "writing_inactivity": days_writing is None or days_writing >= DAYS_WRITING_ACTIVITY,
+            "supervision_drift": (
+                days_supervision is None or days_supervision >= DAYS_SUPERVISION_ACTIVITY
+            ),
             "last_any_activity_at": last_any.isoformat() if last_any else None,
             "last_writing_activity_at": last_writing.isoformat() if last_writing else None,
             "last_supervision_activity_at": last_supervision.isoformat() if last_supervision else None,
-            "days_since_any": days_ago(last_any),
-            "days_since_writing": days_ago(last_writing),
-            "days_since_supervision": days_ago(last_supervision),
+            "days_since_any": days_any,
+            "days_since_writing": days_writing,
+            "days_since_supervision": days_supervision,
         }
 
-    def _create_reminder(
+    def _reminder_rows(
         self,
         user_id: UUID,
-        kind: str,
-        message: str,
-        payload: Dict[str, Any],
-    ) -> EngagementEvent:
-        entry = EngagementEvent(
-            user_id=user_id,
-            kind=kind,
-            message=message,
-            payload=payload,
-            triggered_at=_utcnow(),
-        )
-        self.db.add(entry)
-        self.db.flush()
-        return entry
-
-    def run_inactivity_detection(self, user_id: UUID) -> List[EngagementEvent]:
-        """
-        Evaluate inactivity rules for one user; create engagement_events for each triggered rule.
-        Returns list of created reminder events (for idempotency you may want to avoid duplicates
-        per day per kind; we create one per run).
-        """
-        signals = self.get_engagement_signals(user_id)
-        created: List[EngagementEvent] = []
+        signals: Dict[str, Any],
+        triggered_at: datetime,
+    ) -> List[Dict[str, Any]]:
+        """Build engagement_event column values for each inactivity rule that fires."""
+        rows: List[Dict[str, Any]] = []
+
+        def _row(kind: str, message: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                "id": uuid4(),
+                "user_id": user_id,
+                "kind": kind,
+                "message": message,
+                "payload": payload,
+                "triggered_at": triggered_at,
+            }
 
         if signals["low_engagement"]:
             days = signals.get("days_since_any") or DAYS_ANY_ACTIVITY
             msg = f"No activity for {days} days. Consider updating your progress or uploading a document."
-            created.append(
-                self._create_reminder(
-                    user_id,
+            rows.append(
+                _row(
                     ENGAGEMENT_KIND_LOW_ENGAGEMENT,
                     msg,
                     {
@@ -182,9 +252,8 @@ class EngagementEngine:
         if signals["writing_inactivity"]:
             days = signals.get("days_since_writing") or DAYS_WRITING_ACTIVITY
             msg = f"No document upload or writing-related activity for {days} days."
-            created.append(
-                self._create_reminder(
-                    user_id,
+            rows.append(
+                _row(
                     ENGAGEMENT_KIND_WRITING_INACTIVITY,
                     msg,
                     {
@@ -197,9 +266,8 @@ class EngagementEngine:
         if signals["supervision_drift"]:
             days = signals.get("days_since_supervision") or DAYS_SUPERVISION_ACTIVITY
             msg = f"No supervision log or feedback for {days} days. Consider logging a meeting or requesting feedback."
-            created.append(
-                self._create_reminder(
-                    user_id,
+            rows.append(
+                _row(
                     ENGAGEMENT_KIND_SUPERVISION_DRIFT,
                     msg,
                     {
@@ -209,15 +277,52 @@ class EngagementEngine:
                 )
             )
 
-        return created
+        return rows
 
-    def run_inactivity_detection_for_all_users(self) -> Dict[UUID, List[EngagementEvent]]:
-        """Run inactivity detection for every user (e.g. from a scheduled job)."""
-        user_ids = [r[0] for r in self.db.query(User.id).all()]
-        result: Dict[UUID, List[EngagementEvent]] = {}
+    def run_inactivity_detection(
+        self,
+        user_id: UUID,
+        signals: Optional[Dict[str, Any]] = None,
+    ) -> List[EngagementEvent]:
+        """
+        Evaluate inactivity rules for one user; create engagement_events for each triggered rule.
+        At most one reminder per (user, kind, UTC day): rules that already fired today are
+        skipped by the database, so only actually inserted reminders are returned.
+        Pass precomputed signals to skip the per-user timestamp query.
+        """
+        if signals is None:
+            signals = self.get_engagement_signals(user_id)
+        rows = self._reminder_rows(user_id, signals, _utcnow())
+        if not rows:
+            return []
+        return list(self.db.scalars(_reminder_insert().returning(EngagementEvent), rows))
+
+    def run_inactivity_detection_for_all_users(self) -> Dict[UUID, List[Dict[str, Any]]]:
+        """
+        Run inactivity detection for every user (e.g. from a scheduled job).
+        Reminders are written with one batched insert and committed; returns the inserted
+        column values per user (reminders already stored today are skipped).
+        """
+        timestamps = self.get_last_activity_timestamps_for_all_users()
+        user_ids = self.db.scalars(select(User.id).execution_options(yield_per=COHORT_YIELD_PER))
+        no_activity = _last_activity_from_type_maxima({})
+        now = _utcnow()
+        candidates: Dict[UUID, List[Dict[str, Any]]] = {}
+        all_rows: List[Dict[str, Any]] = []
         for uid in user_ids:
-            result[uid] = self.run_inactivity_detection(uid)
-        return result
+            signals = self._signals_from_timestamps(uid, timestamps.get(uid, no_activity), now)
+            candidates[uid] = self._reminder_rows(uid, signals, now)
+            all_rows.extend(candidates[uid])
+        inserted = (
+            set(self.db.scalars(_reminder_insert().returning(EngagementEvent.id), all_rows))
+            if all_rows
+            else set()
+        )
+        self.db.commit()
+        return {
+            uid: [row for row in rows if row["id"] in inserted]
+            for uid, rows in candidates.items()
+        }
 
     def generate_monthly_digest(
         self,
@@ -230,34 +335,23 @@ class EngagementEngine:
         Summarize longitudinal events for the given month; store digest as engagement_event
         and emit engagement_monthly_digest to longitudinal event store.
         """
-        start = datetime(year, month, 1, tzinfo=timezone.utc)
-        if month == 12:
-            end = datetime(year + 1, 1, 1, tzinfo=timezone.utc) - timedelta(microseconds=1)
-        else:
-            end = datetime(year, month + 1, 1, tzinfo=timezone.utc) - timedelta(microseconds=1)
-
-        q = (
-            self.db.query(LongitudinalEvent.event_type, func.count(LongitudinalEvent.event_id))
-            .filter(
+        start, end = _month_bounds(year, month)
+
+        # One aggregate pass: a COUNT(*) FILTER per digest field, no group-by
+        counts = self.db.execute(
+            select(
+                *(
+                    func.count().filter(LongitudinalEvent.event_type == et).label(field)
+                    for field, et in DIGEST_COUNT_FIELDS.items()
+                )
+            ).where(
                 LongitudinalEvent.user_id == user_id,
+                LongitudinalEvent.event_type.in_(DIGEST_COUNT_FIELDS.values()),
                 LongitudinalEvent.timestamp >= start,
                 LongitudinalEvent.timestamp <= end,
             )
-            .group_by(LongitudinalEvent.event_type)
-        )
-        counts = dict(q.all())
-
-        summary = {
-            "year": year,
-            "month": month,
-            "milestones_updated": counts.get(EventType.MILESTONE_UPDATED.value, 0),
-            "documents_uploaded": counts.get(EventType.DOCUMENT_UPLOADED.value, 0),
-            "supervision_logs": counts.get(EventType.SUPERVISION_LOGGED.value, 0),
-            "supervision_feedback": counts.get(EventType.SUPERVISION_FEEDBACK_RECEIVED.value, 0),
-            "opportunity_saved": counts.get(EventType.OPPORTUNITY_SAVED.value, 0),
-            "opportunity_applied": counts.get(EventType.OPPORTUNITY_APPLIED.value, 0),
-            "questionnaire_completed": counts.get(EventType.QUESTIONNAIRE_COMPLETED.value, 0),
-        }
+        ).one()
+        summary: Dict[str, Any] = {"year": year, "month": month, **counts._asdict()}
 
         digest_entry = EngagementEvent(
             user_id=user_id,
@@ -282,3 +376,68 @@ class EngagementEngine:
         self.db.commit()
         self.db.refresh(digest_entry)
         return digest_entry
+
+    def generate_monthly_digests_for_all_users(
+        self,
+        year: int,
+        month: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Batch variant of generate_monthly_digest for every user with events in the month.
+        Postgres returns each user's {event_type: count} object via jsonb_object_agg in a
+        single query; digests and their longitudinal events are bulk-inserted and committed
+        once. Returns the inserted digest column values.
+        """
+        start, end = _month_bounds(year, month)
+        per_type = (
+            select(
+                LongitudinalEvent.user_id,
+                LongitudinalEvent.event_type,
+                func.count(LongitudinalEvent.event_id).label("cnt"),
+            )
+            .where(
+                LongitudinalEvent.timestamp >= start,
+                LongitudinalEvent.timestamp <= end,
+            )
+            .group_by(LongitudinalEvent.user_id, LongitudinalEvent.event_type)
+            .subquery()
+        )
+        rows = self.db.execute(
+            select(
+                per_type.c.user_id,
+                User.role,
+                func.jsonb_object_agg(per_type.c.event_type, per_type.c.cnt),
+            )
+            .join(User, User.id == per_type.c.user_id)
+            .group_by(per_type.c.user_id, User.role)
+        ).all()
+
+        triggered_at = _utcnow()
+        digests: List[Dict[str, Any]] = []
+        digest_events: List[Dict[str, Any]] = []
+        for uid, role, counts in rows:
+            digest = {
+                "id": uuid4(),
+                "user_id": uid,
+                "kind": ENGAGEMENT_KIND_MONTHLY_DIGEST,
+                "message": None,
+                "payload": _digest_summary(year, month, counts),
+                "triggered_at": triggered_at,
+            }
+            digests.append(digest)
+            digest_events.append(
+                {
+                    "user_id": uid,
+                    "role": getattr(role, "value", role),
+                    "event_type": EventType.ENGAGEMENT_MONTHLY_DIGEST.value,
+                    "source_module": "engagement_engine",
+                    "entity_type": "engagement_event",
+                    "entity_id": digest["id"],
+                    "metadata": digest["payload"],
+                }
+            )
+        if digests:
+            self.db.bulk_insert_mappings(EngagementEvent, digests)
+            EventStore(self.db).emit_many(digest_events)
+        self.db.commit()
+        return digests
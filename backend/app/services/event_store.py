@@ -6,20 +6,40 @@ events via this store. No update or delete methods — audit trail only.
 All signals in the intelligence layer are traceable to raw events (event_id) in this store.
 """
 
-from datetime import datetime
-from typing import Any, Dict, Optional
-from uuid import UUID
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
+from sqlalchemy import func, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.models.longitudinal_event import LongitudinalEvent
+from app.models.user_last_activity import UserLastActivity
+from app.models.user_week_event_count import UserWeekEventCount
 from app.core.event_taxonomy import (
     EventType,
+    SUPERVISION_EVENT_TYPES,
     SUPPORTED_EVENT_TYPES,
+    WRITING_EVENT_TYPES,
     metadata_with_version,
 )
 
 
+def utc_week_start(ts: datetime) -> date:
+    """Monday (UTC) of the week containing ts; naive datetimes are taken as UTC."""
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc)
+    day = ts.date()
+    return day - timedelta(days=day.weekday())
+
+
+def utc_weeks_spanned(start: datetime, end: datetime) -> int:
+    """Number of UTC calendar weeks from start's week to end's week, inclusive."""
+    return (utc_week_start(end) - utc_week_start(start)).days // 7 + 1
+
+
 class EventStoreError(Exception):
     """Raised when event emission fails."""
     pass
@@ -71,21 +91,176 @@ class EventStore:
                 f"Unsupported event_type: {event_type}. "
                 f"Allowed: {sorted(SUPPORTED_EVENT_TYPES)}"
             )
-        payload = metadata_with_version(metadata, metadata_version)
-        ts = timestamp or datetime.utcnow()
-        event = LongitudinalEvent(
-            user_id=user_id,
-            role=role,
-            event_type=event_type,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            metadata_=payload,
-            timestamp=ts,
-            source_module=source_module,
-        )
-        self.db.add(event)
+        event_id = uuid4()
+        ts = timestamp or datetime.now(timezone.utc)
+        # Flush pending rows the event may reference, then append with a Core INSERT
+        # (the event itself never needs unit-of-work tracking).
         self.db.flush()
-        return event.event_id
+        self.db.execute(
+            insert(LongitudinalEvent).values(
+                event_id=event_id,
+                user_id=user_id,
+                role=role,
+                event_type=event_type,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                metadata_=metadata_with_version(metadata, metadata_version),
+                timestamp=ts,
+                source_module=source_module,
+            )
+        )
+        self._record_rollups([(user_id, event_type, ts)])
+        return event_id
+
+    def emit_many(self, events: List[Dict[str, Any]]) -> List[UUID]:
+        """
+        Append a batch of events with a single bulk INSERT. Immutable; no update/delete.
+
+        Each item takes the keyword arguments of emit() (user_id, role, event_type,
+        source_module, and optionally entity_type, entity_id, metadata,
+        metadata_version, timestamp). The whole batch is validated before insert.
+
+        Returns:
+            event_ids in input order.
+
+        Raises:
+            EventStoreError: If any event_type is invalid.
+        """
+        invalid = {e["event_type"] for e in events} - SUPPORTED_EVENT_TYPES
+        if invalid:
+            raise EventStoreError(
+                f"Unsupported event_type: {sorted(invalid)}. "
+                f"Allowed: {sorted(SUPPORTED_EVENT_TYPES)}"
+            )
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "event_id": uuid4(),
+                "user_id": e["user_id"],
+                "role": e["role"],
+                "event_type": e["event_type"],
+                "entity_type": e.get("entity_type"),
+                "entity_id": e.get("entity_id"),
+                "metadata_": metadata_with_version(
+                    e.get("metadata"), e.get("metadata_version", 1)
+                ),
+                "timestamp": e.get("timestamp") or now,
+                "source_module": e["source_module"],
+            }
+            for e in events
+        ]
+        if rows:
+            self.db.bulk_insert_mappings(LongitudinalEvent, rows)
+            self._record_rollups(
+                [(row["user_id"], row["event_type"], row["timestamp"]) for row in rows]
+            )
+        return [row["event_id"] for row in rows]
+
+    def _record_rollups(self, events: List[Tuple[UUID, str, datetime]]) -> None:
+        """
+        Fold appended (user_id, event_type, timestamp) events into the per-user rollups:
+        user_week_event_counts and user_activity_summary. One upsert each per batch.
+        """
+        if not events:
+            return
+        week_counts = Counter((user_id, utc_week_start(ts)) for user_id, _, ts in events)
+        week_stmt = pg_insert(UserWeekEventCount).values(
+            [
+                {"user_id": user_id, "week_start": week_start, "event_count": n}
+                for (user_id, week_start), n in week_counts.items()
+            ]
+        )
+        self.db.execute(
+            week_stmt.on_conflict_do_update(
+                index_elements=[UserWeekEventCount.user_id, UserWeekEventCount.week_start],
+                set_={
+                    "event_count": UserWeekEventCount.event_count
+                    + week_stmt.excluded.event_count
+                },
+            )
+        )
+
+        latest: Dict[UUID, Dict[str, Any]] = {}
+        for user_id, event_type, ts in events:
+            row = latest.setdefault(
+                user_id,
+                {
+                    "user_id": user_id,
+                    "last_any": None,
+                    "last_writing": None,
+                    "last_supervision": None,
+                },
+            )
+            columns = ["last_any"]
+            if event_type in WRITING_EVENT_TYPES:
+                columns.append("last_writing")
+            if event_type in SUPERVISION_EVENT_TYPES:
+                columns.append("last_supervision")
+            for column in columns:
+                if row[column] is None or ts > row[column]:
+                    row[column] = ts
+        summary_stmt = pg_insert(UserLastActivity).values(list(latest.values()))
+        self.db.execute(
+            summary_stmt.on_conflict_do_update(
+                index_elements=[UserLastActivity.user_id],
+                # GREATEST ignores NULLs, so a batch never clears an existing timestamp
+                set_={
+                    column: func.greatest(
+                        getattr(UserLastActivity, column), summary_stmt.excluded[column]
+                    )
+                    for column in ("last_any", "last_writing", "last_supervision")
+                },
+            )
+        )
+
+
+class EventBuffer:
+    """
+    Collects events emitted during one unit of work and appends them with a single
+    EventStore.emit_many INSERT, in the caller's transaction. Flushes automatically
+    once max_size events are pending; call flush() before commit.
+    """
+
+    def __init__(self, db: Session, max_size: int = 500):
+        self.db = db
+        self.max_size = max_size
+        self._pending: List[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def enqueue(
+        self,
+        user_id: UUID,
+        role: str,
+        event_type: str,
+        source_module: str,
+        **kwargs: Any,
+    ) -> None:
+        """Queue one event; takes the same arguments as EventStore.emit."""
+        self._pending.append(
+            {
+                "user_id": user_id,
+                "role": role,
+                "event_type": event_type,
+                "source_module": source_module,
+                **kwargs,
+            }
+        )
+        if len(self._pending) >= self.max_size:
+            self.flush()
+
+    def flush(self) -> List[UUID]:
+        """
+        Append all pending events; returns their event_ids in enqueue order.
+
+        Raises:
+            EventStoreError: If any pending event_type is invalid (nothing is inserted).
+        """
+        if not self._pending:
+            return []
+        events, self._pending = self._pending, []
+        return EventStore(self.db).emit_many(events)
 
 
 def emit_event(
@@ -9,21 +9,31 @@ Constraints:
 Data sources: longitudinal events (event_type/counts only), engagement signals, timeline/stage counts.
 """
 
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+import copy
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
 from uuid import UUID
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import Integer, Select, and_, case, cast, func, or_, select
 
 from app.models.user import User
 from app.models.longitudinal_event import LongitudinalEvent
+from app.models.user_last_activity import UserLastActivity
+from app.models.user_week_event_count import UserWeekEventCount
 from app.models.committed_timeline import CommittedTimeline
 from app.models.timeline_stage import TimelineStage
 from app.models.timeline_milestone import TimelineMilestone
-from app.core.event_taxonomy import EventType
-from app.services.engagement_engine import EngagementEngine
-from app.services.progress_service import ProgressService
+from app.core.event_taxonomy import SUPERVISION_EVENT_TYPES
+from app.utils.ttl_cache import TTLCache
+from app.services.event_store import utc_week_start, utc_weeks_spanned
+from app.services.engagement_engine import (
+    DAYS_ANY_ACTIVITY,
+    DAYS_SUPERVISION_ACTIVITY,
+    DAYS_WRITING_ACTIVITY,
+)
 
 
 # Minimum count in a cell to be reported; smaller cells are suppressed to prevent inference
@@ -32,10 +42,41 @@ AGGREGATION_THRESHOLD = 5
 LOOKBACK_DAYS = 90
 SUPERVISION_LOOKBACK_DAYS = 45
 
-SUPERVISION_EVENT_TYPES = [
-    EventType.SUPERVISION_LOGGED.value,
-    EventType.SUPERVISION_FEEDBACK_RECEIVED.value,
-]
+# Rows fetched per round-trip when streaming cohort-sized result sets
+COHORT_YIELD_PER = 1000
+
+# Continuity index buckets; each edge starts the next bucket
+CONTINUITY_BUCKETS = ("0.0-0.2", "0.2-0.4", "0.4-0.6", "0.6-0.8", "0.8-1.0")
+CONTINUITY_BUCKET_EDGES = (0.2, 0.4, 0.6, 0.8)
+
+
+# Cohort aggregates are cached per worker for a short TTL; admin dashboards tolerate
+# a few minutes of staleness and repeated loads skip the cohort-wide scans.
+ANALYTICS_CACHE_TTL_SECONDS = 300
+_analytics_cache = TTLCache(ttl_seconds=ANALYTICS_CACHE_TTL_SECONDS, max_entries=256)
+
+
+def _cached_aggregate(method: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+    """
+    Serve an analytics method from _analytics_cache, keyed by database URL, method name
+    and arguments, so services bound to different databases never share entries.
+    Results are deep-copied in and out, so callers never share the cached dicts.
+    """
+    @wraps(method)
+    def wrapper(self: "InstitutionalAnalyticsService", *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        cache_key = (
+            str(self.db.get_bind().url),
+            method.__name__,
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+        cached = _analytics_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        result = method(self, *args, **kwargs)
+        _analytics_cache.set(cache_key, copy.deepcopy(result))
+        return result
+    return wrapper
 
 
 def _apply_threshold(buckets: Dict[str, int], threshold: int = AGGREGATION_THRESHOLD) -> Dict[str, Any]:
@@ -49,42 +90,37 @@ def _apply_threshold(buckets: Dict[str, int], threshold: int = AGGREGATION_THRES
     }
 
 
-def _continuity_for_user(db: Session, user_id: UUID, lookback_days: int) -> float:
-    """Compute continuity index (0-1) from longitudinal events; no content."""
+def _window_start(lookback_days: int):
+    """
+    Server-side window start (now() - N days); events are never future-dated, so no upper bound.
+    """
+    return func.now() - timedelta(days=lookback_days)
+
+
+def _continuity_by_user(db: Session, user_ids: Select, lookback_days: int) -> Dict[UUID, float]:
+    """
+    Continuity index (0-1) per user, defined as in IntelligenceSignalsService.continuity_index:
+    active UTC calendar weeks overlapping the window / weeks the window spans. Read from the
+    weekly rollup in one grouped query; users without events in the window (last_any before
+    its start) are absent from the result.
+    """
     window_end = datetime.now(timezone.utc)
     window_start = window_end - timedelta(days=lookback_days)
-    events = (
-        db.query(LongitudinalEvent)
+    rows = (
+        db.query(UserWeekEventCount.user_id, func.count())
+        .join(UserLastActivity, UserLastActivity.user_id == UserWeekEventCount.user_id)
         .filter(
-            LongitudinalEvent.user_id == user_id,
-            LongitudinalEvent.timestamp >= window_start,
-            LongitudinalEvent.timestamp <= window_end,
+            UserWeekEventCount.user_id.in_(user_ids),
+            UserWeekEventCount.week_start >= utc_week_start(window_start),
+            UserWeekEventCount.week_start <= utc_week_start(window_end),
+            UserWeekEventCount.event_count > 0,
+            UserLastActivity.last_any >= window_start,
         )
-        .all()
+        .group_by(UserWeekEventCount.user_id)
+        .yield_per(COHORT_YIELD_PER)
     )
-    if not events:
-        return 0.0
-    weeks = max(1, lookback_days // 7)
-    by_week: Dict[int, bool] = {}
-    for e in events:
-        ts = e.timestamp.replace(tzinfo=timezone.utc) if e.timestamp.tzinfo is None else e.timestamp
-        week_key = int((ts - window_start).total_seconds() // (7 * 24 * 3600))
-        by_week[week_key] = True
-    return min(1.0, len(by_week) / weeks)
-
-
-def _risk_segment_for_user(engagement_engine: EngagementEngine, user_id: UUID) -> str:
-    """Segment: low, medium, high from engagement flags only (no content)."""
-    s = engagement_engine.get_engagement_signals(user_id)
-    low = s.get("low_engagement", False)
-    writing = s.get("writing_inactivity", False)
-    super_ = s.get("supervision_drift", False)
-    n = sum([low, writing, super_])
-    if n == 0:
-        return "low"
-    if n == 1:
-        return "medium"
-    return "high"
+    weeks = utc_weeks_spanned(window_start, window_end)
+    return {uid: active_weeks / weeks for uid, active_weeks in rows}
 
 
 class InstitutionalAnalyticsService:
@@ -95,9 +131,8 @@ class InstitutionalAnalyticsService:
 
     def __init__(self, db: Session) -> None:
         self.db = db
-        self.engagement_engine = EngagementEngine(db)
-        self.progress_service = ProgressService(db)
 
+    @_cached_aggregate
     def cohort_continuity_distribution(
         self,
         lookback_days: int = LOOKBACK_DAYS,
@@ -106,49 +141,66 @@ class InstitutionalAnalyticsService:
         Distribution of continuity index across researchers (bucketed).
         No document or questionnaire content used.
         """
-        researcher_ids = [r[0] for r in self.db.query(User.id).filter(User.role == "researcher").all()]
-        buckets: Dict[str, int] = {
-            "0.0-0.2": 0,
-            "0.2-0.4": 0,
-            "0.4-0.6": 0,
-            "0.6-0.8": 0,
-            "0.8-1.0": 0,
-        }
-        for uid in researcher_ids:
-            c = _continuity_for_user(self.db, uid, lookback_days)
-            if c < 0.2:
-                buckets["0.0-0.2"] += 1
-            elif c < 0.4:
-                buckets["0.2-0.4"] += 1
-            elif c < 0.6:
-                buckets["0.4-0.6"] += 1
-            elif c < 0.8:
-                buckets["0.6-0.8"] += 1
-            else:
-                buckets["0.8-1.0"] += 1
+        continuity = _continuity_by_user(
+            self.db,
+            select(User.id).where(User.role == "researcher"),
+            lookback_days,
+        )
+        cohort_size = self.db.scalar(
+            select(func.count()).select_from(User).where(User.role == "researcher")
+        ) or 0
+        counts = [0] * len(CONTINUITY_BUCKETS)
+        for c in continuity.values():
+            counts[bisect_right(CONTINUITY_BUCKET_EDGES, c)] += 1
+        # Researchers without events in the window have continuity 0.0
+        counts[0] += cohort_size - len(continuity)
+        buckets: Dict[str, int] = dict(zip(CONTINUITY_BUCKETS, counts))
         return {
-            "cohort_size": len(researcher_ids),
+            "cohort_size": cohort_size,
             "lookback_days": lookback_days,
             **_apply_threshold(buckets),
         }
 
+    @_cached_aggregate
     def risk_segmentation_summary(
         self,
     ) -> Dict[str, Any]:
         """
         Count of researchers in each risk segment (low/medium/high).
-        Based on engagement signals only; no content.
+        Based on engagement signals only; no content. Segmented in SQL from
+        user_activity_summary.
         """
-        researcher_ids = [r[0] for r in self.db.query(User.id).filter(User.role == "researcher").all()]
+        now = datetime.now(timezone.utc)
+
+        def _flag(last_ts, days: int):
+            return cast(or_(last_ts.is_(None), last_ts <= now - timedelta(days=days)), Integer)
+
+        flags = (
+            _flag(UserLastActivity.last_any, DAYS_ANY_ACTIVITY)
+            + _flag(UserLastActivity.last_writing, DAYS_WRITING_ACTIVITY)
+            + _flag(UserLastActivity.last_supervision, DAYS_SUPERVISION_ACTIVITY)
+        )
+        per_user = (
+            select(flags.label("flags"))
+            .select_from(User)
+            .outerjoin(UserLastActivity, UserLastActivity.user_id == User.id)
+            .where(User.role == "researcher")
+            .subquery()
+        )
+        segment = case(
+            (per_user.c.flags == 0, "low"),
+            (per_user.c.flags == 1, "medium"),
+            else_="high",
+        )
+        rows = self.db.execute(select(segment, func.count()).group_by(segment)).all()
         buckets: Dict[str, int] = {"low": 0, "medium": 0, "high": 0}
-        for uid in researcher_ids:
-            seg = _risk_segment_for_user(self.engagement_engine, uid)
-            buckets[seg] += 1
+        buckets.update({seg: count for seg, count in rows})
         return {
-            "cohort_size": len(researcher_ids),
+            "cohort_size": sum(buckets.values()),
             **_apply_threshold(buckets),
         }
 
+    @_cached_aggregate
     def supervisor_engagement_averages(
         self,
         lookback_days: int = SUPERVISION_LOOKBACK_DAYS,
@@ -157,26 +209,32 @@ class InstitutionalAnalyticsService:
         Average supervision event count per researcher and % with at least one.
         Uses event counts only; no content.
         """
-        researcher_ids = [r[0] for r in self.db.query(User.id).filter(User.role == "researcher").all()]
-        window_end = datetime.now(timezone.utc)
-        window_start = window_end - timedelta(days=lookback_days)
-        counts: List[int] = []
-        for uid in researcher_ids:
-            n = (
-                self.db.query(func.count(LongitudinalEvent.event_id))
-                .filter(
-                    LongitudinalEvent.user_id == uid,
-                    LongitudinalEvent.event_type.in_(SUPERVISION_EVENT_TYPES),
+        window_start = _window_start(lookback_days)
+        per_user = (
+            select(
+                User.id.label("user_id"),
+                func.count(LongitudinalEvent.event_id).label("n"),
+            )
+            .outerjoin(
+                LongitudinalEvent,
+                and_(
+                    LongitudinalEvent.user_id == User.id,
+                    LongitudinalEvent.event_type.in_(list(SUPERVISION_EVENT_TYPES)),
                     LongitudinalEvent.timestamp >= window_start,
-                    LongitudinalEvent.timestamp <= window_end,
-                )
-                .scalar()
-                or 0
+                ),
             )
-            counts.append(n)
-        total = len(counts)
-        with_at_least_one = sum(1 for c in counts if c >= 1)
-        avg = sum(counts) / total if total else 0.0
+            .where(User.role == "researcher")
+            .group_by(User.id)
+            .subquery()
+        )
+        total, event_sum, with_at_least_one = self.db.execute(
+            select(
+                func.count(),
+                func.coalesce(func.sum(per_user.c.n), 0),
+                func.count().filter(per_user.c.n >= 1),
+            ).select_from(per_user)
+        ).one()
+        avg = float(event_sum) / total if total else 0.0
         return {
             "cohort_size": total,
             "lookback_days": lookback_days,
@@ -184,6 +242,7 @@ class InstitutionalAnalyticsService:
             "percent_with_at_least_one_supervision_event": round(100.0 * with_at_least_one / total, 1) if total else 0,
         }
 
+    @_cached_aggregate
     def stage_distribution_counts(
         self,
     ) -> Dict[str, Any]:
@@ -202,23 +261,35 @@ class InstitutionalAnalyticsService:
             "stage_counts": _apply_threshold(buckets),
         }
 
+    @_cached_aggregate
     def timeline_delay_frequency(
         self,
     ) -> Dict[str, Any]:
         """
         Distribution of timelines by number of overdue milestones (0, 1-2, 3+).
         Uses progress aggregates only; no content.
+
+        Overdue counts are computed in a single grouped query (same rule as
+        ProgressService.get_timeline_progress: incomplete and target_date before
+        today). Timelines without milestones have no data and are not counted.
         """
-        timelines = self.db.query(CommittedTimeline).filter(CommittedTimeline.user_id.isnot(None)).all()
+        overdue = func.count(TimelineMilestone.id).filter(
+            TimelineMilestone.is_completed.is_(False),
+            TimelineMilestone.target_date < date.today(),
+        )
+        rows = self.db.execute(
+            select(TimelineStage.committed_timeline_id, overdue)
+            .join(TimelineMilestone, TimelineMilestone.timeline_stage_id == TimelineStage.id)
+            .join(CommittedTimeline, CommittedTimeline.id == TimelineStage.committed_timeline_id)
+            .where(CommittedTimeline.user_id.isnot(None))
+            .group_by(TimelineStage.committed_timeline_id)
+            .execution_options(yield_per=COHORT_YIELD_PER)
+        )
         buckets: Dict[str, int] = {"0_overdue": 0, "1_2_overdue": 0, "3_plus_overdue": 0}
-        for tl in timelines:
-            progress = self.progress_service.get_timeline_progress(tl.id)
-            if not progress or not progress.get("has_data"):
-                continue
-            overdue = progress.get("overdue_milestones", 0) or 0
-            if overdue == 0:
+        for _timeline_id, overdue_count in rows:
+            if overdue_count == 0:
                 buckets["0_overdue"] += 1
-            elif overdue <= 2:
+            elif overdue_count <= 2:
                 buckets["1_2_overdue"] += 1
             else:
                 buckets["3_plus_overdue"] += 1
@@ -6,14 +6,19 @@ and time window so outputs are traceable to raw events. Signals cannot be displa
 without the explanation payload.
 """
 
+import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+from sqlalchemy import Select, String, cast, func, literal, select, union_all
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app.models.longitudinal_event import LongitudinalEvent
-from app.core.event_taxonomy import EventType
+from app.models.user_last_activity import UserLastActivity
+from app.models.user_week_event_count import UserWeekEventCount
+from app.core.event_taxonomy import EventType, SUPERVISION_EVENT_TYPES
 from app.core.interpretability import (
     Evidence,
     ExplanationPayload,
@@ -25,18 +30,99 @@ from app.core.interpretability import (
     SIGNAL_OPPORTUNITY_MATCH,
 )
 from app.services.engagement_engine import EngagementEngine
+from app.services.event_store import utc_week_start, utc_weeks_spanned
+
+logger = logging.getLogger(__name__)
 
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def _days_ago(dt: Optional[datetime]) -> Optional[int]:
-    if dt is None:
-        return None
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    return (_utcnow() - dt).days
+# Events that inform opportunity matching: profile activity and opportunity actions
+OPPORTUNITY_CONTEXT_EVENT_TYPES = frozenset({
+    EventType.OPPORTUNITY_SAVED.value,
+    EventType.OPPORTUNITY_APPLIED.value,
+    EventType.DOCUMENT_UPLOADED.value,
+    EventType.MILESTONE_UPDATED.value,
+})
+
+SUPERVISOR_LOOKBACK_DAYS = 45
+OPPORTUNITY_LOOKBACK_DAYS = 30
+
+# Evidence lists at most this many (most recent) event_ids; the total is reported alongside
+EVIDENCE_EVENT_ID_LIMIT = 50
+
+# Signal text: static recommendations and explanation templates (only counts are formatted in)
+CONTINUITY_EMPTY_EXPLANATION = (
+    "No activity events in the last {days} days. "
+    "Continuity is zero when there is no recorded activity in the time window."
+)
+CONTINUITY_EMPTY_RECOMMENDATION = (
+    "Log progress, upload a document, or complete a questionnaire to build continuity."
+)
+CONTINUITY_EXPLANATION = (
+    "Activity on {active_weeks} of the last {weeks} weeks ({events} events total). "
+    "Continuity index reflects how regularly you engage within the time window."
+)
+CONTINUITY_RECOMMENDATION = (
+    "Maintain weekly activity (e.g. progress updates or document uploads) "
+    "to keep continuity high."
+)
+DROPOUT_EXPLANATION = "Risk assessment based on {events} events in the last {days} days. "
+DROPOUT_NO_FACTORS = "No strong risk factors in the window."
+DROPOUT_ELEVATED_RECOMMENDATION = (
+    "Upload a document, log progress, or schedule a supervision meeting "
+    "to reduce dropout risk."
+)
+DROPOUT_LOW_RECOMMENDATION = (
+    "Continue current engagement level; consider logging milestones when completed."
+)
+SUPERVISION_EMPTY_EXPLANATION = (
+    "No supervision events (meetings or feedback) in the last {days} days. "
+    "Regular supervision contact supports progress and reduces isolation."
+)
+SUPERVISION_EMPTY_RECOMMENDATION = (
+    "Schedule a supervision meeting and log it, or request feedback from your supervisor."
+)
+SUPERVISION_EXPLANATION = (
+    "Found {events} supervision-related event(s) in the last {days} days. "
+    "Alert is off when there is recent supervision activity."
+)
+SUPERVISION_RECOMMENDATION = (
+    "Keep logging supervision meetings and feedback to maintain visibility."
+)
+OPPORTUNITY_EXPLANATION = (
+    "Opportunity match context is based on {events} relevant events in the last {days} days "
+    "(e.g. documents uploaded, milestones updated, opportunities saved or applied). "
+    "Scores depend on discipline, stage, and timeline alignment."
+)
+OPPORTUNITY_RECOMMENDATION = (
+    "Update your progress and documents so opportunity recommendations stay relevant; "
+    "apply to high-match opportunities when ready."
+)
+
+
+def _evidence(
+    event_ids: List[str],
+    window_start: datetime,
+    window_end: datetime,
+    total_event_count: Optional[int] = None,
+) -> Evidence:
+    """Evidence for a window, keeping the most recent EVIDENCE_EVENT_ID_LIMIT ids (oldest first)."""
+    total = len(event_ids) if total_event_count is None else total_event_count
+    shown = event_ids[-EVIDENCE_EVENT_ID_LIMIT:]
+    return Evidence(
+        contributing_event_ids=shown,
+        time_window=TimeWindow(start=window_start, end=window_end),
+        total_event_count=total,
+        truncated=total > len(shown),
+    )
+
+
+def _event_id_text():
+    """event_id selected as text, so evidence ids arrive ready to serialize."""
+    return cast(LongitudinalEvent.event_id, String).label("event_id")
 
 
 class IntelligenceSignalsService:
@@ -47,25 +133,98 @@ class IntelligenceSignalsService:
 
     DEFAULT_LOOKBACK_DAYS = 90
 
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Session, engagement_engine: Optional[EngagementEngine] = None) -> None:
         self.db = db
+        # Callers may share one engine across services
+        self.engagement = engagement_engine or EngagementEngine(db)
+        # Engagement signals per user for this service instance (one per request)
+        self._engagement_cache: Dict[UUID, Dict[str, Any]] = {}
+        # Single clock reading shared by every signal computed on this instance
+        self._now: Optional[datetime] = None
 
-    def _events_in_window(
+    def _now_cached(self) -> datetime:
+        """Current UTC time, read once per instance (reset by get_all_signals)."""
+        if self._now is None:
+            self._now = _utcnow()
+        return self._now
+
+    def _engagement_signals(self, user_id: UUID) -> Dict[str, Any]:
+        """Engagement signals for user_id, computed at most once per service instance."""
+        signals = self._engagement_cache.get(user_id)
+        if signals is None:
+            signals = self.engagement.get_engagement_signals(user_id)
+            self._engagement_cache[user_id] = signals
+        return signals
+
+    def _window_filter(
         self,
         user_id: UUID,
         window_start: datetime,
         window_end: datetime,
-        event_types: Optional[List[str]] = None,
+        event_types: Optional[frozenset] = None,
     ) -> List[Any]:
-        """Return longitudinal events in time window; optionally filter by event_type."""
-        q = self.db.query(LongitudinalEvent).filter(
+        """WHERE clauses for a user's events in a time window, optionally by event_type."""
+        clauses = [
             LongitudinalEvent.user_id == user_id,
             LongitudinalEvent.timestamp >= window_start,
             LongitudinalEvent.timestamp <= window_end,
-        )
+        ]
         if event_types:
-            q = q.filter(LongitudinalEvent.event_type.in_(event_types))
-        return q.order_by(LongitudinalEvent.timestamp.asc()).all()
+            clauses.append(LongitudinalEvent.event_type.in_(list(event_types)))
+        return clauses
+
+    def _event_count_in_window(
+        self,
+        user_id: UUID,
+        window_start: datetime,
+        window_end: datetime,
+        event_types: Optional[frozenset] = None,
+    ) -> int:
+        """Number of events in time window (optionally by event_type), counted in SQL."""
+        stmt = select(func.count()).select_from(LongitudinalEvent).where(
+            *self._window_filter(user_id, window_start, window_end, event_types)
+        )
+        return self.db.scalar(stmt) or 0
+
+    def _event_ids_in_window(
+        self,
+        user_id: UUID,
+        window_start: datetime,
+        window_end: datetime,
+        event_types: Optional[frozenset] = None,
+    ) -> List[str]:
+        """
+        The most recent EVIDENCE_EVENT_ID_LIMIT event_ids in window, oldest first.
+        Cast to text in SQL: evidence only ever serializes them as strings.
+        """
+        stmt = (
+            select(_event_id_text())
+            .where(*self._window_filter(user_id, window_start, window_end, event_types))
+            .order_by(LongitudinalEvent.timestamp.desc())
+            .limit(EVIDENCE_EVENT_ID_LIMIT)
+        )
+        return list(reversed(self.db.scalars(stmt).all()))
+
+    def _weekly_event_counts(
+        self,
+        user_id: UUID,
+        window_start: datetime,
+        window_end: datetime,
+    ) -> Select:
+        """
+        Query for active_weeks: UTC weeks (keyed by their Monday) overlapping the window
+        with at least one event, read from the user_week_event_counts rollup. Week totals
+        are not event counts for the window (edge weeks extend past it), so event totals
+        come from the exact-window count instead.
+        """
+        return select(
+            func.count().label("active_weeks"),
+        ).where(
+            UserWeekEventCount.user_id == user_id,
+            UserWeekEventCount.week_start >= utc_week_start(window_start),
+            UserWeekEventCount.week_start <= utc_week_start(window_end),
+            UserWeekEventCount.event_count > 0,
+        )
 
     def continuity_index(
         self,
@@ -75,42 +234,57 @@ class IntelligenceSignalsService:
         """
         Continuity index: regularity of activity over the window.
         Value in [0, 1]; higher = more regular activity. Evidence = event_ids in window.
+        Active weeks are UTC calendar weeks overlapping the window (weekly rollup); the
+        event total and the no-activity check use the exact window, like the evidence ids.
+        Users whose last activity predates the window's first week (user_activity_summary)
+        get the no-activity signal without scanning events.
         """
-        window_end = _utcnow()
+        window_end = self._now_cached()
         window_start = window_end - timedelta(days=lookback_days)
-        events = self._events_in_window(user_id, window_start, window_end)
-        event_ids = [e.event_id for e in events]
+        summary = self.db.get(UserLastActivity, user_id)
+        if (
+            summary is None
+            or summary.last_any is None
+            or utc_week_start(summary.last_any) < utc_week_start(window_start)
+        ):
+            return self._compute_continuity(0, 0, [], window_start, window_end, lookback_days)
+        active_weeks = self.db.scalar(
+            self._weekly_event_counts(user_id, window_start, window_end)
+        )
+        total_events = self._event_count_in_window(user_id, window_start, window_end)
+        event_ids = self._event_ids_in_window(user_id, window_start, window_end)
+        return self._compute_continuity(
+            active_weeks, total_events, event_ids, window_start, window_end, lookback_days
+        )
 
-        if not events:
+    def _compute_continuity(
+        self,
+        active_weeks: int,
+        total_events: int,
+        event_ids: List[str],
+        window_start: datetime,
+        window_end: datetime,
+        lookback_days: int,
+    ) -> InterpretableSignal:
+        if not total_events:
             value = 0.0
-            explanation = (
-                f"No activity events in the last {lookback_days} days. "
-                "Continuity is zero when there is no recorded activity in the time window."
-            )
-            recommendation = "Log progress, upload a document, or complete a questionnaire to build continuity."
+            explanation = CONTINUITY_EMPTY_EXPLANATION.format(days=lookback_days)
+            recommendation = CONTINUITY_EMPTY_RECOMMENDATION
         else:
-            # Simple continuity: number of weeks with at least one event / total weeks
-            weeks = max(1, lookback_days // 7)
-            by_week: Dict[int, int] = {}
-            for e in events:
-                ts = e.timestamp.replace(tzinfo=timezone.utc) if e.timestamp.tzinfo is None else e.timestamp
-                week_key = int((ts - window_start).total_seconds() // (7 * 24 * 3600))
-                by_week[week_key] = by_week.get(week_key, 0) + 1
-            value = round(len(by_week) / weeks, 4)
-            value = min(1.0, value)
-            explanation = (
-                f"Activity on {len(by_week)} of the last {weeks} weeks ({len(events)} events total). "
-                "Continuity index reflects how regularly you engage within the time window."
+            # Simple continuity: calendar weeks with at least one event / weeks in the window
+            weeks = utc_weeks_spanned(window_start, window_end)
+            value = round(active_weeks / weeks, 4)
+            explanation = CONTINUITY_EXPLANATION.format(
+                active_weeks=active_weeks, weeks=weeks, events=total_events
             )
-            recommendation = "Maintain weekly activity (e.g. progress updates or document uploads) to keep continuity high."
+            recommendation = CONTINUITY_RECOMMENDATION
 
         return InterpretableSignal(
             signal_type=SIGNAL_CONTINUITY_INDEX,
             value=value,
             explanation_payload=ExplanationPayload(
-                evidence=Evidence(
-                    contributing_event_ids=event_ids,
-                    time_window=TimeWindow(start=window_start, end=window_end),
+                evidence=_evidence(
+                    event_ids, window_start, window_end, total_event_count=total_events
                 ),
                 explanation=explanation,
                 recommendation=recommendation,
@@ -126,13 +300,27 @@ class IntelligenceSignalsService:
         Dropout risk: derived from long inactivity and lack of progress/supervision.
         Evidence = event_ids in window used to assess risk.
         """
-        window_end = _utcnow()
+        window_end = self._now_cached()
         window_start = window_end - timedelta(days=lookback_days)
-        events = self._events_in_window(user_id, window_start, window_end)
-        event_ids = [e.event_id for e in events]
+        return self._compute_dropout_risk(
+            user_id,
+            self._event_count_in_window(user_id, window_start, window_end),
+            self._event_ids_in_window(user_id, window_start, window_end),
+            window_start,
+            window_end,
+            lookback_days,
+        )
 
-        engine = EngagementEngine(self.db)
-        signals = engine.get_engagement_signals(user_id)
+    def _compute_dropout_risk(
+        self,
+        user_id: UUID,
+        event_count: int,
+        event_ids: List[str],
+        window_start: datetime,
+        window_end: datetime,
+        lookback_days: int,
+    ) -> InterpretableSignal:
+        signals = self._engagement_signals(user_id)
         low_engagement = signals.get("low_engagement", False)
         writing_inactive = signals.get("writing_inactivity", False)
         supervision_drift = signals.get("supervision_drift", False)
@@ -153,23 +341,26 @@ class IntelligenceSignalsService:
             reasons.append("no recent writing/document activity")
         if supervision_drift:
             reasons.append("no recent supervision contact")
-        explanation = (
-            f"Risk assessment based on {len(events)} events in the last {lookback_days} days. "
-            + ("Risk factors: " + "; ".join(reasons) + "." if reasons else "No strong risk factors in the window.")
+        explanation = DROPOUT_EXPLANATION.format(events=event_count, days=lookback_days) + (
+            "Risk factors: " + "; ".join(reasons) + "." if reasons else DROPOUT_NO_FACTORS
         )
         recommendation = (
-            "Upload a document, log progress, or schedule a supervision meeting to reduce dropout risk."
-            if risk_score > 0.3
-            else "Continue current engagement level; consider logging milestones when completed."
+            DROPOUT_ELEVATED_RECOMMENDATION if risk_score > 0.3 else DROPOUT_LOW_RECOMMENDATION
         )
 
         return InterpretableSignal(
             signal_type=SIGNAL_DROPOUT_RISK,
-            value={"score": risk_score, "flags": {"low_engagement": low_engagement, "writing_inactivity": writing_inactive, "supervision_drift": supervision_drift}},
+            value={
+                "score": risk_score,
+                "flags": {
+                    "low_engagement": low_engagement,
+                    "writing_inactivity": writing_inactive,
+                    "supervision_drift": supervision_drift,
+                },
+            },
             explanation_payload=ExplanationPayload(
-                evidence=Evidence(
-                    contributing_event_ids=event_ids,
-                    time_window=TimeWindow(start=window_start, end=window_end),
+                evidence=_evidence(
+                    event_ids, window_start, window_end, total_event_count=event_count
                 ),
                 explanation=explanation,
                 recommendation=recommendation,
@@ -179,44 +370,46 @@ class IntelligenceSignalsService:
     def supervisor_engagement_alert(
         self,
         user_id: UUID,
-        lookback_days: int = 45,
+        lookback_days: int = SUPERVISOR_LOOKBACK_DAYS,
     ) -> Optional[InterpretableSignal]:
         """
         Supervisor engagement: alert when supervision events are absent or sparse.
         Evidence = supervision-related event_ids in window.
         """
-        window_end = _utcnow()
+        window_end = self._now_cached()
         window_start = window_end - timedelta(days=lookback_days)
-        supervision_types = [
-            EventType.SUPERVISION_LOGGED.value,
-            EventType.SUPERVISION_FEEDBACK_RECEIVED.value,
-        ]
-        events = self._events_in_window(user_id, window_start, window_end, event_types=supervision_types)
-        event_ids = [e.event_id for e in events]
+        return self._compute_supervisor_engagement(
+            self._event_count_in_window(user_id, window_start, window_end, SUPERVISION_EVENT_TYPES),
+            self._event_ids_in_window(user_id, window_start, window_end, SUPERVISION_EVENT_TYPES),
+            window_start,
+            window_end,
+            lookback_days,
+        )
 
-        alert = len(events) == 0
-        value = {"alert": alert, "supervision_event_count": len(events)}
+    def _compute_supervisor_engagement(
+        self,
+        event_count: int,
+        event_ids: List[str],
+        window_start: datetime,
+        window_end: datetime,
+        lookback_days: int,
+    ) -> InterpretableSignal:
+        alert = event_count == 0
+        value = {"alert": alert, "supervision_event_count": event_count}
 
         if alert:
-            explanation = (
-                f"No supervision events (meetings or feedback) in the last {lookback_days} days. "
-                "Regular supervision contact supports progress and reduces isolation."
-            )
-            recommendation = "Schedule a supervision meeting and log it, or request feedback from your supervisor."
+            explanation = SUPERVISION_EMPTY_EXPLANATION.format(days=lookback_days)
+            recommendation = SUPERVISION_EMPTY_RECOMMENDATION
         else:
-            explanation = (
-                f"Found {len(events)} supervision-related event(s) in the last {lookback_days} days. "
-                "Alert is off when there is recent supervision activity."
-            )
-            recommendation = "Keep logging supervision meetings and feedback to maintain visibility."
+            explanation = SUPERVISION_EXPLANATION.format(events=event_count, days=lookback_days)
+            recommendation = SUPERVISION_RECOMMENDATION
 
         return InterpretableSignal(
             signal_type=SIGNAL_SUPERVISOR_ENGAGEMENT,
             value=value,
             explanation_payload=ExplanationPayload(
-                evidence=Evidence(
-                    contributing_event_ids=event_ids,
-                    time_window=TimeWindow(start=window_start, end=window_end),
+                evidence=_evidence(
+                    event_ids, window_start, window_end, total_event_count=event_count
                 ),
                 explanation=explanation,
                 recommendation=recommendation,
@@ -227,51 +420,118 @@ class IntelligenceSignalsService:
         self,
         user_id: UUID,
         opportunity_id: Optional[UUID] = None,
-        lookback_days: int = 30,
+        lookback_days: int = OPPORTUNITY_LOOKBACK_DAYS,
     ) -> Optional[InterpretableSignal]:
         """
         Opportunity match: relevance of opportunities based on profile/timeline.
         Evidence = event_ids that inform context (e.g. opportunity_saved, document_uploaded, milestone_updated).
         When opportunity_id is provided, value can be a single score; otherwise a summary.
         """
-        window_end = _utcnow()
+        window_end = self._now_cached()
         window_start = window_end - timedelta(days=lookback_days)
-        # Events that inform opportunity matching: profile activity and opportunity actions
-        context_types = [
-            EventType.OPPORTUNITY_SAVED.value,
-            EventType.OPPORTUNITY_APPLIED.value,
-            EventType.DOCUMENT_UPLOADED.value,
-            EventType.MILESTONE_UPDATED.value,
-        ]
-        events = self._events_in_window(user_id, window_start, window_end, event_types=context_types)
-        event_ids = [e.event_id for e in events]
+        return self._compute_opportunity_match(
+            self._event_count_in_window(
+                user_id, window_start, window_end, OPPORTUNITY_CONTEXT_EVENT_TYPES
+            ),
+            self._event_ids_in_window(
+                user_id, window_start, window_end, OPPORTUNITY_CONTEXT_EVENT_TYPES
+            ),
+            window_start,
+            window_end,
+            lookback_days,
+            opportunity_id,
+        )
 
+    def _compute_opportunity_match(
+        self,
+        event_count: int,
+        event_ids: List[str],
+        window_start: datetime,
+        window_end: datetime,
+        lookback_days: int,
+        opportunity_id: Optional[UUID] = None,
+    ) -> InterpretableSignal:
         # Placeholder: real score would come from OpportunityRelevanceEngine for a specific opportunity
         # Here we return a summary signal with interpretability
         value = {
-            "context_events_in_window": len(events),
+            "context_events_in_window": event_count,
             "opportunity_id": str(opportunity_id) if opportunity_id else None,
         }
-        explanation = (
-            f"Opportunity match context is based on {len(events)} relevant events in the last {lookback_days} days "
-            "(e.g. documents uploaded, milestones updated, opportunities saved or applied). "
-            "Scores depend on discipline, stage, and timeline alignment."
-        )
-        recommendation = "Update your progress and documents so opportunity recommendations stay relevant; apply to high-match opportunities when ready."
+        explanation = OPPORTUNITY_EXPLANATION.format(events=event_count, days=lookback_days)
+        recommendation = OPPORTUNITY_RECOMMENDATION
 
         return InterpretableSignal(
             signal_type=SIGNAL_OPPORTUNITY_MATCH,
             value=value,
             explanation_payload=ExplanationPayload(
-                evidence=Evidence(
-                    contributing_event_ids=event_ids,
-                    time_window=TimeWindow(start=window_start, end=window_end),
+                evidence=_evidence(
+                    event_ids, window_start, window_end, total_event_count=event_count
                 ),
                 explanation=explanation,
                 recommendation=recommendation,
             ),
         )
 
+    def _signal_counts(
+        self,
+        user_id: UUID,
+        window_start: datetime,
+        supervisor_start: datetime,
+        window_end: datetime,
+    ) -> Any:
+        """
+        Every count the four signals need, in one round trip: events in the lookback window,
+        supervision and opportunity-context events in their windows (COUNT ... FILTER), and
+        active weeks from the weekly rollup (scalar subquery).
+        """
+        in_lookback = LongitudinalEvent.timestamp >= window_start
+        weeks = self._weekly_event_counts(user_id, window_start, window_end).subquery()
+        return self.db.execute(
+            select(
+                func.count().filter(in_lookback).label("events"),
+                func.count().filter(
+                    LongitudinalEvent.timestamp >= supervisor_start,
+                    LongitudinalEvent.event_type.in_(list(SUPERVISION_EVENT_TYPES)),
+                ).label("supervision_events"),
+                func.count().filter(
+                    in_lookback,
+                    LongitudinalEvent.event_type.in_(list(OPPORTUNITY_CONTEXT_EVENT_TYPES)),
+                ).label("opportunity_events"),
+                select(weeks.c.active_weeks).scalar_subquery().label("active_weeks"),
+            )
+            .select_from(LongitudinalEvent)
+            .where(*self._window_filter(user_id, min(window_start, supervisor_start), window_end))
+        ).one()
+
+    def _evidence_ids(
+        self,
+        user_id: UUID,
+        windows: Dict[str, Tuple[datetime, Optional[frozenset]]],
+        window_end: datetime,
+    ) -> Dict[str, List[str]]:
+        """
+        The most recent EVIDENCE_EVENT_ID_LIMIT event_ids (oldest first, as text) for each
+        named (window_start, event_types) window, fetched in one UNION ALL round trip.
+        """
+        parts = [
+            select(
+                literal(name).label("window"),
+                _event_id_text(),
+                LongitudinalEvent.timestamp,
+            )
+            .where(*self._window_filter(user_id, start, window_end, event_types))
+            .order_by(LongitudinalEvent.timestamp.desc())
+            .limit(EVIDENCE_EVENT_ID_LIMIT)
+            for name, (start, event_types) in windows.items()
+        ]
+        recent = union_all(*parts).subquery()
+        ids: Dict[str, List[str]] = {name: [] for name in windows}
+        for name, event_id in self.db.execute(
+            select(recent.c.window, recent.c.event_id).order_by(recent.c.window, recent.c.timestamp)
+        ):
+            ids[name].append(event_id)
+        return ids
+
     def get_all_signals(
         self,
         user_id: UUID,
@@ -280,30 +540,63 @@ class IntelligenceSignalsService:
         """
         Return all four signals with full interpretability payload.
         Only returns signals that have evidence, explanation, and recommendation (enforced).
+        Counts come from one conditional-aggregation query and evidence ids from one capped
+        query, so memory stays bounded for heavy users; all signals share one window_end.
         """
-        results = []
-        try:
-            sig = self.continuity_index(user_id, lookback_days=lookback_days)
-            if sig is not None:
-                results.append(sig.for_display())
-        except Exception:
-            pass
-        try:
-            sig = self.dropout_risk_signal(user_id, lookback_days=lookback_days)
-            if sig is not None:
-                results.append(sig.for_display())
-        except Exception:
-            pass
-        try:
-            sig = self.supervisor_engagement_alert(user_id, lookback_days=45)
-            if sig is not None:
-                results.append(sig.for_display())
-        except Exception:
-            pass
+        self._now = None
+        window_end = self._now_cached()
+        window_start = window_end - timedelta(days=lookback_days)
+        supervisor_start = window_end - timedelta(days=SUPERVISOR_LOOKBACK_DAYS)
         try:
-            sig = self.opportunity_match_score(user_id, lookback_days=lookback_days)
-            if sig is not None:
-                results.append(sig.for_display())
-        except Exception:
-            pass
+            counts = self._signal_counts(user_id, window_start, supervisor_start, window_end)
+            ids = self._evidence_ids(
+                user_id,
+                {
+                    "lookback": (window_start, None),
+                    "supervision": (supervisor_start, SUPERVISION_EVENT_TYPES),
+                    "opportunity": (window_start, OPPORTUNITY_CONTEXT_EVENT_TYPES),
+                },
+                window_end,
+            )
+        except SQLAlchemyError as e:
+            logger.warning("Signal event fetch failed for user %s: %s", user_id, e)
+            return []
+        computations = [
+            lambda: self._compute_continuity(
+                counts.active_weeks,
+                counts.events,
+                ids["lookback"],
+                window_start,
+                window_end,
+                lookback_days,
+            ),
+            lambda: self._compute_dropout_risk(
+                user_id, counts.events, ids["lookback"], window_start, window_end, lookback_days
+            ),
+            lambda: self._compute_supervisor_engagement(
+                counts.supervision_events,
+                ids["supervision"],
+                supervisor_start,
+                window_end,
+                SUPERVISOR_LOOKBACK_DAYS,
+            ),
+            lambda: self._compute_opportunity_match(
+                counts.opportunity_events,
+                ids["opportunity"],
+                window_start,
+                window_end,
+                lookback_days,
+            ),
+        ]
+        results = []
+        for compute in computations:
+            try:
+                sig = compute()
+                if sig is not None:
+                    results.append(sig.for_display())
+            except SQLAlchemyError as e:
+                logger.warning("Signal computation failed for user %s: %s", user_id, e)
+            except ValueError:
+                # Incomplete interpretability payload: never displayed
+                continue
         return results
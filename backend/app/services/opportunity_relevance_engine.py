@@ -10,10 +10,13 @@ Scores opportunities (grants, conferences, fellowships) based on:
 All scoring is rule-based and deterministic.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Set, Dict, Any
+import heapq
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import FrozenSet, List, NamedTuple, Optional, Set, Dict, Any
 from datetime import date, timedelta
-from enum import Enum
+from enum import Enum, IntFlag
 
 from sqlalchemy.orm import Session
 
@@ -73,7 +76,45 @@ class ReasonTag(Enum):
     PUBLICATION_VENUE = "publication_venue"
 
 
-@dataclass
+# One bit per ReasonTag (same names, same order). Scorers accumulate these bits and
+# only scores returned to the caller expand them into a List[ReasonTag].
+_RT = IntFlag("_RT", [tag.name for tag in ReasonTag])
+_NO_TAGS = _RT(0)
+_TAG_BITS = tuple((_RT[tag.name], tag) for tag in ReasonTag)
+
+
+# Explanation phrases in output order: discipline, stage, deadline, timeline. Within a
+# group the first tag present wins; _score_discipline always sets exactly one
+# discipline tag, so DISCIPLINE_MISMATCH is the discipline fallback.
+_EXPLAIN_PHRASES = (
+    (
+        (_RT.EXACT_DISCIPLINE_MATCH, "Exact discipline match"),
+        (_RT.BROAD_DISCIPLINE_MATCH, "Broad discipline alignment"),
+        (_RT.INTERDISCIPLINARY_MATCH, "Interdisciplinary relevance"),
+        (_RT.DISCIPLINE_MISMATCH, "Limited discipline match"),
+    ),
+    (
+        (_RT.STAGE_PERFECT_MATCH, "perfect for your research stage"),
+        (_RT.STAGE_GOOD_MATCH, "suitable for your research stage"),
+    ),
+    (
+        (_RT.DEADLINE_OPTIMAL, "optimal deadline timing"),
+        (_RT.DEADLINE_TIGHT, "tight but achievable deadline"),
+        (_RT.DEADLINE_VERY_TIGHT, "very tight deadline"),
+        (_RT.DEADLINE_MISSED, "deadline has passed"),
+    ),
+    (
+        (_RT.ALIGNS_WITH_CURRENT_STAGE, "aligns with your current timeline stage"),
+    ),
+)
+
+
+def _expand_tags(bits: _RT) -> List[ReasonTag]:
+    """Reason tags set in ``bits``, in ReasonTag declaration order."""
+    return [tag for bit, tag in _TAG_BITS if bits & bit]
+
+
+@dataclass(slots=True)
 class UserProfile:
     """User research profile."""
     discipline: str                          # Primary discipline
@@ -84,7 +125,7 @@ class UserProfile:
     geographic_region: Optional[str] = None  # US, EU, Global, etc.
 
 
-@dataclass
+@dataclass(slots=True)
 class TimelineContext:
     """User's timeline context."""
     current_stage_name: str                  # e.g., "Literature Review", "Data Collection"
@@ -94,9 +135,13 @@ class TimelineContext:
     expected_completion_date: Optional[date] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Opportunity:
-    """Opportunity to be ranked."""
+    """Opportunity to be ranked.
+
+    Treat as immutable after construction: lowercased discipline/keyword sets are
+    derived once in __post_init__ and reused by every ranking call.
+    """
     opportunity_id: str
     title: str
     opportunity_type: OpportunityType
@@ -108,13 +153,17 @@ class Opportunity:
     funding_amount: Optional[float] = None   # For grants/fellowships
     prestige_level: Optional[str] = None     # "high", "medium", "low"
     geographic_scope: Optional[str] = None   # "us", "eu", "global"
+    _disciplines_lower: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _keywords_lower: FrozenSet[str] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.keywords is None:
             self.keywords = []
+        self._disciplines_lower = frozenset(d.lower() for d in self.disciplines)
+        self._keywords_lower = frozenset(k.lower() for k in self.keywords)
 
 
-@dataclass
+@dataclass(slots=True)
 class RelevanceScore:
     """Relevance score and reasoning."""
     opportunity_id: str
@@ -129,6 +178,73 @@ class RelevanceScore:
     recommended_action: str                  # "apply_now", "prepare", "monitor", "skip"
 
 
+class _UserLower(NamedTuple):
+    """User profile fields lowercased once per scoring/ranking call."""
+    discipline: str
+    subdisciplines: FrozenSet[str]
+    keywords: FrozenSet[str]
+
+
+class _TimelineLower(NamedTuple):
+    """Timeline context fields lowercased once per scoring/ranking call."""
+    current_stage: str
+    progress: float                          # Clamped to [0, 1]
+    upcoming_text: str                       # _join_for_scan(upcoming stages)
+    milestone_text: str                      # _join_for_scan(critical milestones)
+    boosted_types: FrozenSet[OpportunityType]  # Types aligned with the current stage
+
+
+# Current-stage substrings that align an opportunity type with the timeline
+_TYPE_STAGE_PATTERNS = (
+    (OpportunityType.CONFERENCE, re.compile("writing|analysis")),
+    (OpportunityType.GRANT, re.compile("data collection|methodology")),
+)
+
+
+# Separator for _join_for_scan; never appears in stage names or keywords
+_SCAN_SEP = "\x1f"
+
+
+def _join_for_scan(texts: List[str]) -> str:
+    """Join lowercased texts so one ``kw in joined`` test equals ``any(kw in t for t in texts)``.
+
+    Each text is prefixed with _SCAN_SEP, so no match spans two texts and the result is
+    empty exactly when ``texts`` is; callers treat an empty result as "no match".
+    """
+    return "".join(_SCAN_SEP + t.lower() for t in texts)
+
+
+def _lower_user(user_profile: UserProfile) -> _UserLower:
+    return _UserLower(
+        discipline=user_profile.discipline.lower(),
+        subdisciplines=frozenset(s.lower() for s in user_profile.subdisciplines),
+        keywords=frozenset(k.lower() for k in user_profile.keywords),
+    )
+
+
+def _lower_timeline(timeline_context: Optional[TimelineContext]) -> Optional[_TimelineLower]:
+    if timeline_context is None:
+        return None
+    current_stage = timeline_context.current_stage_name.lower()
+    return _TimelineLower(
+        current_stage=current_stage,
+        # Clamp progress to [0, 1] in case callers supply out-of-range values
+        progress=max(0.0, min(1.0, timeline_context.current_stage_progress)),
+        upcoming_text=_join_for_scan(timeline_context.upcoming_stages),
+        milestone_text=_join_for_scan(timeline_context.critical_milestones),
+        boosted_types=frozenset(
+            opportunity_type for opportunity_type, pattern in _TYPE_STAGE_PATTERNS
+            if pattern.search(current_stage)
+        ),
+    )
+
+
+def _completion_ordinal(timeline_context: Optional[TimelineContext]) -> Optional[int]:
+    if timeline_context is None or timeline_context.expected_completion_date is None:
+        return None
+    return timeline_context.expected_completion_date.toordinal()
+
+
 class OpportunityRelevanceEngine:
     """
     Deterministic opportunity relevance scoring engine.
@@ -145,6 +261,8 @@ class OpportunityRelevanceEngine:
     STAGE_WEIGHT = 0.30
     TIMELINE_WEIGHT = 0.25
     DEADLINE_WEIGHT = 0.15
+    # Minimum keyword Jaccard overlap for an interdisciplinary match
+    KEYWORD_OVERLAP_THRESHOLD = 0.3
     CONFIG_NAME = "opportunity_relevance"
     DEFAULT_VERSION = "opportunity_relevance_v1"
 
@@ -177,6 +295,60 @@ class OpportunityRelevanceEngine:
         "Humanities": ["History", "Literature", "Philosophy", "Languages"],
     }
 
+    # Lowercased (broad category, subcategories) pairs, built once at class creation
+    _TAXONOMY_LOWER = tuple(
+        (broad.lower(), tuple(sub.lower() for sub in subs))
+        for broad, subs in DISCIPLINE_TAXONOMY.items()
+    )
+
+    # Broad-category ids (indexes into _TAXONOMY_LOWER) per lowercased discipline, filled
+    # lazily and shared across instances; bounded since disciplines can be user-supplied.
+    _DISCIPLINE_CATEGORY_CACHE_MAX = 4096
+    _discipline_categories: Dict[str, FrozenSet[int]] = {}
+
+    # Deadline buckets by days until deadline: bisect_right(cuts, days) indexes the
+    # (score, tag bits) table. Below 0 is missed, under 7 very tight, under 14 tight.
+    _GRANT_LIKE_TYPES = frozenset({OpportunityType.GRANT, OpportunityType.FELLOWSHIP})
+    # Grants need more prep time: optimal 30-90 days out
+    _GRANT_DEADLINE_CUTS = (0, 7, 14, 30, 91, 181)
+    _GRANT_DEADLINE_BUCKETS = (
+        (0.0, _RT.DEADLINE_MISSED),
+        (40.0, _RT.DEADLINE_VERY_TIGHT),
+        (65.0, _RT.DEADLINE_TIGHT),
+        (80.0, _NO_TAGS),                 # 14-29 days
+        (100.0, _RT.DEADLINE_OPTIMAL),    # 30-90 days
+        (90.0, _NO_TAGS),                 # 91-180 days
+        (70.0, _RT.DEADLINE_TOO_FAR),     # > 180 days
+    )
+    # Conference, workshop, competition: optimal 14-60 days out
+    _OTHER_DEADLINE_CUTS = (0, 7, 14, 61, 121)
+    _OTHER_DEADLINE_BUCKETS = (
+        (0.0, _RT.DEADLINE_MISSED),
+        (40.0, _RT.DEADLINE_VERY_TIGHT),
+        (65.0, _RT.DEADLINE_TIGHT),
+        (100.0, _RT.DEADLINE_OPTIMAL),    # 14-60 days
+        (85.0, _NO_TAGS),                 # 61-120 days
+        (75.0, _RT.DEADLINE_TOO_FAR),     # > 120 days
+    )
+
+    # Characteristic tags implied by the opportunity type alone
+    _TYPE_TAG_BITS: Dict[OpportunityType, _RT] = {
+        OpportunityType.GRANT: _RT.FUNDING_OPPORTUNITY,
+        OpportunityType.FELLOWSHIP: _RT.FUNDING_OPPORTUNITY,
+        OpportunityType.CONFERENCE: (
+            _RT.PUBLICATION_VENUE | _RT.NETWORKING_OPPORTUNITY | _RT.CAREER_BUILDING
+        ),
+        OpportunityType.WORKSHOP: _RT.CAREER_BUILDING,
+    }
+
+    # Position of each research stage in PhD order (adjacency = index distance 1)
+    _STAGE_IDX: Dict[ResearchStage, int] = {
+        ResearchStage.EARLY: 0,
+        ResearchStage.MID: 1,
+        ResearchStage.LATE: 2,
+        ResearchStage.POST_SUBMISSION: 3,
+    }
+
     # Keywords used to map a granular stage name string → coarse ResearchStage enum.
     # Each list entry is a substring that, if present in the lowercased stage name,
     # identifies the corresponding ResearchStage.
@@ -222,57 +394,108 @@ class OpportunityRelevanceEngine:
         """
         if current_date is None:
             current_date = date.today()
-        
-        reason_tags: List[ReasonTag] = []
-        
-        # 1. Score discipline alignment
-        discipline_score, discipline_tags = self._score_discipline(
-            opportunity.disciplines,
-            opportunity.keywords,
-            user_profile.discipline,
-            user_profile.subdisciplines,
-            user_profile.keywords
+        return self._score_prepared(
+            opportunity,
+            _lower_user(user_profile),
+            self._effective_stage(user_profile, timeline_context),
+            _lower_timeline(timeline_context),
+            _completion_ordinal(timeline_context),
+            current_date.toordinal(),
         )
-        reason_tags.extend(discipline_tags)
-        
-        # 2. Score research stage appropriateness.
-        # If a granular stage name is available via TimelineContext, derive the
-        # coarse ResearchStage from it so the two representations stay in sync.
-        effective_stage = user_profile.research_stage
+
+    def _effective_stage(
+        self,
+        user_profile: UserProfile,
+        timeline_context: Optional[TimelineContext]
+    ) -> ResearchStage:
+        """Coarse research stage used for stage scoring.
+
+        If a granular stage name is available via TimelineContext, derive the
+        coarse ResearchStage from it so the two representations stay in sync.
+        """
         if timeline_context and timeline_context.current_stage_name:
-            effective_stage = self._map_stage_name_to_research_stage(
-                timeline_context.current_stage_name
-            )
+            return self._map_stage_name_to_research_stage(timeline_context.current_stage_name)
+        return user_profile.research_stage
 
-        stage_score, stage_tags = self._score_stage(
-            opportunity.eligible_stages,
-            effective_stage
+    def _score_prepared(
+        self,
+        opportunity: Opportunity,
+        user_lower: _UserLower,
+        effective_stage: ResearchStage,
+        timeline_lower: Optional[_TimelineLower],
+        completion_ord: Optional[int],
+        today_ord: int,
+        min_score: Optional[float] = None,
+        discipline_memo: Optional[Dict[tuple, tuple]] = None,
+        stage_memo: Optional[Dict[tuple, tuple]] = None
+    ) -> Optional[RelevanceScore]:
+        """Score one opportunity against user/timeline state prepared once per call.
+
+        With ``min_score``, returns None as soon as the discipline, stage and deadline
+        scores show the overall score cannot reach it even with a perfect timeline score
+        (e.g. missed deadlines, discipline mismatches), skipping the remaining work; an
+        overall score below it also returns None before the explanation is built.
+        Reason tags are accumulated as _RT bits and expanded only for returned scores.
+
+        ``discipline_memo``/``stage_memo`` cache the discipline and stage results for
+        one ranking call, where the user side is fixed: keyed by the opportunity's
+        lowercased (disciplines, keywords) sets and eligible stages respectively.
+        """
+        opp_keywords_lower = opportunity._keywords_lower
+        
+        # 1. Score discipline alignment
+        discipline_key = (opportunity._disciplines_lower, opp_keywords_lower)
+        discipline_result = (
+            discipline_memo.get(discipline_key) if discipline_memo is not None else None
         )
-        reason_tags.extend(stage_tags)
-
-        # 3. Score timeline compatibility
-        timeline_score, timeline_tags = self._score_timeline(
+        if discipline_result is None:
+            discipline_result = self._score_discipline(
+                opportunity._disciplines_lower,
+                opp_keywords_lower,
+                user_lower
+            )
+            if discipline_memo is not None:
+                discipline_memo[discipline_key] = discipline_result
+        discipline_score, reason_bits = discipline_result
+        
+        # 2. Score research stage appropriateness
+        stage_key = tuple(opportunity.eligible_stages)
+        stage_result = stage_memo.get(stage_key) if stage_memo is not None else None
+        if stage_result is None:
+            stage_result = self._score_stage(
+                opportunity.eligible_stages,
+                effective_stage
+            )
+            if stage_memo is not None:
+                stage_memo[stage_key] = stage_result
+        stage_score, stage_bits = stage_result
+        reason_bits |= stage_bits
+
+        # 4. Score deadline suitability (before timeline: it bounds the overall score)
+        deadline_score, deadline_bits = self._score_deadline_ord(
+            opportunity.deadline.toordinal(),
+            today_ord,
             opportunity.opportunity_type,
-            opportunity.keywords,
-            timeline_context
+            completion_ord
         )
-        reason_tags.extend(timeline_tags)
 
-        # 4. Score deadline suitability
-        expected_completion = (
-            timeline_context.expected_completion_date if timeline_context else None
-        )
-        deadline_score, deadline_tags = self._score_deadline(
-            opportunity.deadline,
-            current_date,
+        if min_score is not None:
+            best_overall = (
+                discipline_score * self._weights["discipline"] +
+                stage_score * self._weights["stage"] +
+                100.0 * self._weights["timeline"] +
+                deadline_score * self._weights["deadline"]
+            )
+            # Rounding is monotonic, so this matches the final rounded comparison
+            if round(best_overall, 2) < min_score:
+                return None
+
+        # 3. Score timeline compatibility
+        timeline_score, timeline_bits = self._score_timeline(
             opportunity.opportunity_type,
-            expected_completion
+            opp_keywords_lower,
+            timeline_lower
         )
-        reason_tags.extend(deadline_tags)
-        
-        # Add characteristic tags
-        characteristic_tags = self._add_characteristic_tags(opportunity)
-        reason_tags.extend(characteristic_tags)
         
         # Calculate overall score
         overall_score = (
@@ -281,6 +504,11 @@ class OpportunityRelevanceEngine:
             timeline_score * self._weights["timeline"] +
             deadline_score * self._weights["deadline"]
         )
+        if min_score is not None and round(overall_score, 2) < min_score:
+            return None
+        
+        # Add characteristic tags
+        reason_bits |= timeline_bits | deadline_bits | self._add_characteristic_tags(opportunity)
         
         # Determine urgency and recommendation
         urgency_level = self._determine_urgency(deadline_score, overall_score)
@@ -293,7 +521,7 @@ class OpportunityRelevanceEngine:
             stage_score,
             timeline_score,
             deadline_score,
-            reason_tags
+            reason_bits
         )
         
         return RelevanceScore(
@@ -303,7 +531,7 @@ class OpportunityRelevanceEngine:
             stage_score=round(stage_score, 2),
             timeline_score=round(timeline_score, 2),
             deadline_score=round(deadline_score, 2),
-            reason_tags=reason_tags,
+            reason_tags=_expand_tags(reason_bits),
             explanation=explanation,
             urgency_level=urgency_level,
             recommended_action=recommended_action
@@ -315,7 +543,8 @@ class OpportunityRelevanceEngine:
         user_profile: UserProfile,
         timeline_context: Optional[TimelineContext] = None,
         current_date: Optional[date] = None,
-        min_score: float = 0.0
+        min_score: float = 0.0,
+        top_k: Optional[int] = None
     ) -> List[RelevanceScore]:
         """
         Rank multiple opportunities by relevance.
@@ -326,23 +555,42 @@ class OpportunityRelevanceEngine:
             timeline_context: Optional timeline context
             current_date: Optional current date
             min_score: Minimum score threshold (0-100)
+            top_k: Optional number of top scores to return (partial selection, no full sort)
             
         Returns:
             List of RelevanceScore objects, sorted by overall_score descending
         """
+        # User, timeline and date state is the same for every opportunity: prepare it once
+        today_ord = (current_date or date.today()).toordinal()
+        user_lower = _lower_user(user_profile)
+        effective_stage = self._effective_stage(user_profile, timeline_context)
+        timeline_lower = _lower_timeline(timeline_context)
+        completion_ord = _completion_ordinal(timeline_context)
+        # Many opportunities share disciplines/keywords/stages; memoize per call only
+        discipline_memo: Dict[tuple, tuple] = {}
+        stage_memo: Dict[tuple, tuple] = {}
         scores = []
         
         for opp in opportunities:
-            score = self.score_opportunity(
-                opportunity=opp,
-                user_profile=user_profile,
-                timeline_context=timeline_context,
-                current_date=current_date
+            score = self._score_prepared(
+                opp,
+                user_lower,
+                effective_stage,
+                timeline_lower,
+                completion_ord,
+                today_ord,
+                min_score,
+                discipline_memo,
+                stage_memo
             )
             
-            if score.overall_score >= min_score:
+            if score is not None:
                 scores.append(score)
         
+        # Top-k only: O(N log k) selection; equivalent to the stable sort below, sliced
+        if top_k is not None:
+            return heapq.nlargest(top_k, scores, key=lambda s: s.overall_score)
+
         # Sort by overall_score descending
         scores.sort(key=lambda s: s.overall_score, reverse=True)
         
@@ -394,40 +642,35 @@ class OpportunityRelevanceEngine:
 
     def _score_discipline(
         self,
-        opportunity_disciplines: List[str],
-        opportunity_keywords: List[str],
-        user_discipline: str,
-        user_subdisciplines: List[str],
-        user_keywords: List[str]
-    ) -> tuple[float, List[ReasonTag]]:
-        """Score discipline alignment."""
-        tags = []
-        
-        # Normalize for case-insensitive comparison
-        opp_disciplines_lower = [d.lower() for d in opportunity_disciplines]
-        user_discipline_lower = user_discipline.lower()
-        user_subdisciplines_lower = [s.lower() for s in user_subdisciplines]
+        opp_disciplines_lower: FrozenSet[str],
+        opportunity_keywords_lower: FrozenSet[str],
+        user_lower: _UserLower
+    ) -> tuple[float, _RT]:
+        """Score discipline alignment (all inputs already lowercased; set membership checks)."""
         
         # Exact match
-        if user_discipline_lower in opp_disciplines_lower:
-            tags.append(ReasonTag.EXACT_DISCIPLINE_MATCH)
+        if user_lower.discipline in opp_disciplines_lower:
+            tags = _RT.EXACT_DISCIPLINE_MATCH
             score = 100.0
         # Subdiscipline match
-        elif any(sub in opp_disciplines_lower for sub in user_subdisciplines_lower):
-            tags.append(ReasonTag.BROAD_DISCIPLINE_MATCH)
+        elif not user_lower.subdisciplines.isdisjoint(opp_disciplines_lower):
+            tags = _RT.BROAD_DISCIPLINE_MATCH
             score = 85.0
         # Broad category match
-        elif self._check_broad_category_match(user_discipline, opportunity_disciplines):
-            tags.append(ReasonTag.BROAD_DISCIPLINE_MATCH)
+        elif self._check_broad_category_match(user_lower.discipline, opp_disciplines_lower):
+            tags = _RT.BROAD_DISCIPLINE_MATCH
             score = 70.0
-        # Keyword overlap
-        elif self._check_keyword_overlap(opportunity_keywords, user_keywords, threshold=0.3):
-            tags.append(ReasonTag.INTERDISCIPLINARY_MATCH)
-            overlap_ratio = self._calculate_keyword_overlap(opportunity_keywords, user_keywords)
-            score = 50.0 + (overlap_ratio * 30.0)  # 50-80 based on overlap
         else:
-            tags.append(ReasonTag.DISCIPLINE_MISMATCH)
-            score = 20.0
+            # Keyword overlap: Jaccard ratio computed once, then thresholded
+            overlap_ratio = self._calculate_keyword_overlap(
+                opportunity_keywords_lower, user_lower.keywords
+            )
+            if overlap_ratio >= self.KEYWORD_OVERLAP_THRESHOLD:
+                tags = _RT.INTERDISCIPLINARY_MATCH
+                score = 50.0 + (overlap_ratio * 30.0)  # 50-80 based on overlap
+            else:
+                tags = _RT.DISCIPLINE_MISMATCH
+                score = 20.0
         
         return score, tags
     
@@ -435,24 +678,23 @@ class OpportunityRelevanceEngine:
         self,
         eligible_stages: List[ResearchStage],
         user_stage: ResearchStage
-    ) -> tuple[float, List[ReasonTag]]:
+    ) -> tuple[float, _RT]:
         """Score research stage appropriateness."""
-        tags = []
         
         # Perfect match
         if user_stage in eligible_stages:
-            tags.append(ReasonTag.STAGE_PERFECT_MATCH)
+            tags = _RT.STAGE_PERFECT_MATCH
             score = 100.0
         # Adjacent stage (off by one)
         elif self._is_adjacent_stage(user_stage, eligible_stages):
-            tags.append(ReasonTag.STAGE_GOOD_MATCH)
+            tags = _RT.STAGE_GOOD_MATCH
             score = 75.0
         # Any stage acceptable (e.g., all stages listed)
         elif len(eligible_stages) >= 3:
-            tags.append(ReasonTag.STAGE_ACCEPTABLE)
+            tags = _RT.STAGE_ACCEPTABLE
             score = 60.0
         else:
-            tags.append(ReasonTag.STAGE_MISMATCH)
+            tags = _RT.STAGE_MISMATCH
             score = 30.0
         
         return score, tags
@@ -460,9 +702,9 @@ class OpportunityRelevanceEngine:
     def _score_timeline(
         self,
         opportunity_type: OpportunityType,
-        opportunity_keywords: List[str],
-        timeline_context: Optional[TimelineContext]
-    ) -> tuple[float, List[ReasonTag]]:
+        opp_keywords_lower: FrozenSet[str],
+        timeline: Optional[_TimelineLower]
+    ) -> tuple[float, _RT]:
         """Score timeline compatibility, incorporating stage progress.
 
         Score is a normalized weighted combination of three keyword signals
@@ -476,37 +718,31 @@ class OpportunityRelevanceEngine:
         Without any keyword matches the score degrades to a low-neutral range
         (~20-44) derived from the type-alignment signal only.
         """
-        tags: List[ReasonTag] = []
+        tags = _NO_TAGS
 
-        if timeline_context is None:
+        if timeline is None:
             return 50.0, tags
 
-        opp_keywords_lower = [k.lower() for k in opportunity_keywords]
-        current_stage_lower = timeline_context.current_stage_name.lower()
-        # Clamp progress to [0, 1] in case callers supply out-of-range values
-        progress = max(0.0, min(1.0, timeline_context.current_stage_progress))
-        upcoming_stages_lower = [s.lower() for s in timeline_context.upcoming_stages]
-        milestones_lower = [m.lower() for m in timeline_context.critical_milestones]
+        current_stage_lower = timeline.current_stage
+        progress = timeline.progress
+        upcoming_text = timeline.upcoming_text
+        milestone_text = timeline.milestone_text
 
-        # --- Binary keyword match signals ---
+        # --- Binary keyword match signals (substring; one scan per keyword) ---
         current_match = any(kw in current_stage_lower for kw in opp_keywords_lower)
-        upcoming_match = any(
-            kw in stage
-            for kw in opp_keywords_lower
-            for stage in upcoming_stages_lower
+        upcoming_match = bool(upcoming_text) and any(
+            kw in upcoming_text for kw in opp_keywords_lower
         )
-        milestone_match = any(
-            kw in milestone
-            for kw in opp_keywords_lower
-            for milestone in milestones_lower
+        milestone_match = bool(milestone_text) and any(
+            kw in milestone_text for kw in opp_keywords_lower
         )
 
         if current_match:
-            tags.append(ReasonTag.ALIGNS_WITH_CURRENT_STAGE)
+            tags |= _RT.ALIGNS_WITH_CURRENT_STAGE
         if upcoming_match:
-            tags.append(ReasonTag.ALIGNS_WITH_UPCOMING_STAGE)
+            tags |= _RT.ALIGNS_WITH_UPCOMING_STAGE
         if milestone_match:
-            tags.append(ReasonTag.SUPPORTS_MILESTONE)
+            tags |= _RT.SUPPORTS_MILESTONE
 
         # --- Progress-aware weighting (current_weight + upcoming_weight == 1.0) ---
         current_weight = 0.80 - (progress * 0.60)   # 0.80 → 0.20
@@ -522,13 +758,9 @@ class OpportunityRelevanceEngine:
         keyword_component = keyword_raw / 1.5  # 0.0 to 1.0
 
         # --- Opportunity-type alignment component (0.0 to 1.0) ---
-        type_component = 0.5  # neutral default
-        if opportunity_type == OpportunityType.CONFERENCE:
-            if "writing" in current_stage_lower or "analysis" in current_stage_lower:
-                type_component = 0.8
-        elif opportunity_type == OpportunityType.GRANT:
-            if "data collection" in current_stage_lower or "methodology" in current_stage_lower:
-                type_component = 0.8
+        # Conferences suit writing/analysis stages, grants data collection/methodology
+        # (matched once per timeline context in _lower_timeline); otherwise neutral.
+        type_component = 0.8 if opportunity_type in timeline.boosted_types else 0.5
 
         # --- Final score: 70% keyword, 30% type alignment ---
         # Without any keyword match, deflate to near-neutral (20–44 range).
@@ -546,7 +778,7 @@ class OpportunityRelevanceEngine:
         current_date: date,
         opportunity_type: OpportunityType,
         expected_completion_date: Optional[date] = None
-    ) -> tuple[float, List[ReasonTag]]:
+    ) -> tuple[float, _RT]:
         """Score deadline suitability, accounting for expected completion date.
 
         After the base timing score is computed two optional adjustments apply:
@@ -555,125 +787,86 @@ class OpportunityRelevanceEngine:
         - If the deadline falls within 90 days *before* ``expected_completion_date``
           (final phase alignment) the score receives a 10% boost, capped at 100.
         """
-        tags = []
-        days_until_deadline = (deadline - current_date).days
+        return self._score_deadline_ord(
+            deadline.toordinal(),
+            current_date.toordinal(),
+            opportunity_type,
+            expected_completion_date.toordinal() if expected_completion_date is not None else None
+        )
+
+    def _score_deadline_ord(
+        self,
+        deadline_ord: int,
+        today_ord: int,
+        opportunity_type: OpportunityType,
+        completion_ord: Optional[int] = None
+    ) -> tuple[float, _RT]:
+        """
+        _score_deadline on proleptic ordinals (date.toordinal()): day gaps are int subtraction.
+        """
+        days_until_deadline = deadline_ord - today_ord
+        if opportunity_type in self._GRANT_LIKE_TYPES:
+            cuts, buckets = self._GRANT_DEADLINE_CUTS, self._GRANT_DEADLINE_BUCKETS
+        else:
+            cuts, buckets = self._OTHER_DEADLINE_CUTS, self._OTHER_DEADLINE_BUCKETS
+        score, tags = buckets[bisect_right(cuts, days_until_deadline)]
 
         # Missed deadline
-        if days_until_deadline < 0:
-            tags.append(ReasonTag.DEADLINE_MISSED)
-            return 0.0, tags
-
-        # Very tight (< 1 week)
-        if days_until_deadline < 7:
-            tags.append(ReasonTag.DEADLINE_VERY_TIGHT)
-            score = 40.0
-        # Tight (1–2 weeks)
-        elif days_until_deadline < 14:
-            tags.append(ReasonTag.DEADLINE_TIGHT)
-            score = 65.0
-        # Type-dependent optimal window
-        elif opportunity_type in [OpportunityType.GRANT, OpportunityType.FELLOWSHIP]:
-            # Grants need more prep time
-            if 30 <= days_until_deadline <= 90:
-                tags.append(ReasonTag.DEADLINE_OPTIMAL)
-                score = 100.0
-            elif 14 <= days_until_deadline < 30:
-                score = 80.0
-            elif 90 < days_until_deadline <= 180:
-                score = 90.0
-            else:  # > 180 days
-                tags.append(ReasonTag.DEADLINE_TOO_FAR)
-                score = 70.0
-        else:  # Conference, workshop, competition
-            if 14 <= days_until_deadline <= 60:
-                tags.append(ReasonTag.DEADLINE_OPTIMAL)
-                score = 100.0
-            elif 60 < days_until_deadline <= 120:
-                score = 85.0
-            else:  # > 120 days
-                tags.append(ReasonTag.DEADLINE_TOO_FAR)
-                score = 75.0
+        if tags == _RT.DEADLINE_MISSED:
+            return score, tags
 
         # Adjust for expected completion date when available
-        if expected_completion_date is not None:
-            if deadline > expected_completion_date:
+        if completion_ord is not None:
+            if deadline_ord > completion_ord:
                 # Opportunity falls after graduation — student unlikely to benefit
                 score *= 0.5
-            elif (expected_completion_date - deadline).days <= 90:
+            elif completion_ord - deadline_ord <= 90:
                 # Deadline aligns with the final phase of studies
                 score = min(score * 1.10, 100.0)
 
         return score, tags
     
-    def _add_characteristic_tags(self, opportunity: Opportunity) -> List[ReasonTag]:
+    def _add_characteristic_tags(self, opportunity: Opportunity) -> _RT:
         """Add tags based on opportunity characteristics."""
-        tags = []
-        
+        tags = self._TYPE_TAG_BITS.get(opportunity.opportunity_type, _NO_TAGS)
         if opportunity.prestige_level == "high":
-            tags.append(ReasonTag.HIGH_PRESTIGE)
-        
-        if opportunity.opportunity_type in [OpportunityType.GRANT, OpportunityType.FELLOWSHIP]:
-            tags.append(ReasonTag.FUNDING_OPPORTUNITY)
-        
-        if opportunity.opportunity_type == OpportunityType.CONFERENCE:
-            tags.append(ReasonTag.PUBLICATION_VENUE)
-            tags.append(ReasonTag.NETWORKING_OPPORTUNITY)
-        
-        if opportunity.opportunity_type in [OpportunityType.WORKSHOP, OpportunityType.CONFERENCE]:
-            tags.append(ReasonTag.CAREER_BUILDING)
-        
+            tags |= _RT.HIGH_PRESTIGE
         return tags
     
     # Helper methods
     
-    def _check_broad_category_match(
-        self,
-        user_discipline: str,
-        opportunity_disciplines: List[str]
-    ) -> bool:
-        """Check if disciplines match at broad category level."""
-        for broad_category, subcategories in self.DISCIPLINE_TAXONOMY.items():
-            user_in_category = (
-                user_discipline.lower() == broad_category.lower() or
-                any(user_discipline.lower() in sub.lower() for sub in subcategories)
+    def _categories_of(self, discipline_lower: str) -> FrozenSet[int]:
+        """Ids of the broad categories a lowercased discipline belongs to (memoized)."""
+        ids = self._discipline_categories.get(discipline_lower)
+        if ids is None:
+            ids = frozenset(
+                i for i, (broad, subs) in enumerate(self._TAXONOMY_LOWER)
+                if discipline_lower == broad or any(discipline_lower in sub for sub in subs)
             )
-            
-            opp_in_category = any(
-                opp_disc.lower() == broad_category.lower() or
-                any(opp_disc.lower() in sub.lower() for sub in subcategories)
-                for opp_disc in opportunity_disciplines
-            )
-            
-            if user_in_category and opp_in_category:
-                return True
-        
-        return False
-    
-    def _check_keyword_overlap(
+            if len(self._discipline_categories) < self._DISCIPLINE_CATEGORY_CACHE_MAX:
+                self._discipline_categories[discipline_lower] = ids
+        return ids
+
+    def _check_broad_category_match(
         self,
-        keywords1: List[str],
-        keywords2: List[str],
-        threshold: float = 0.3
+        user_lower: str,
+        opp_lower: FrozenSet[str]
     ) -> bool:
-        """Check if keyword overlap exceeds threshold."""
-        return self._calculate_keyword_overlap(keywords1, keywords2) >= threshold
+        """Check if (lowercased) disciplines share a broad category."""
+        user_categories = self._categories_of(user_lower)
+        return bool(user_categories) and any(
+            not user_categories.isdisjoint(self._categories_of(d)) for d in opp_lower
+        )
     
     def _calculate_keyword_overlap(
         self,
-        keywords1: List[str],
-        keywords2: List[str]
+        keywords1: FrozenSet[str],
+        keywords2: FrozenSet[str]
     ) -> float:
-        """Calculate keyword overlap ratio (Jaccard similarity)."""
+        """Calculate keyword overlap ratio (Jaccard similarity) of lowercased keyword sets."""
         if not keywords1 or not keywords2:
             return 0.0
-        
-        set1 = set(k.lower() for k in keywords1)
-        set2 = set(k.lower() for k in keywords2)
-        
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
-        
-        return intersection / union if union > 0 else 0.0
+        return len(keywords1 & keywords2) / len(keywords1 | keywords2)
     
     def _is_adjacent_stage(
         self,
@@ -681,24 +874,9 @@ class OpportunityRelevanceEngine:
         eligible_stages: List[ResearchStage]
     ) -> bool:
         """Check if user stage is adjacent to any eligible stage."""
-        stage_order = [
-            ResearchStage.EARLY,
-            ResearchStage.MID,
-            ResearchStage.LATE,
-            ResearchStage.POST_SUBMISSION
-        ]
-        
-        try:
-            user_idx = stage_order.index(user_stage)
-            
-            for eligible_stage in eligible_stages:
-                eligible_idx = stage_order.index(eligible_stage)
-                if abs(user_idx - eligible_idx) == 1:
-                    return True
-        except ValueError:
-            pass
-        
-        return False
+        stage_idx = self._STAGE_IDX
+        user_idx = stage_idx[user_stage]
+        return any(abs(user_idx - stage_idx[stage]) == 1 for stage in eligible_stages)
     
     def _determine_urgency(self, deadline_score: float, overall_score: float) -> str:
         """Determine urgency level."""
@@ -742,39 +920,13 @@ class OpportunityRelevanceEngine:
         stage_score: float,
         timeline_score: float,
         deadline_score: float,
-        reason_tags: List[ReasonTag]
+        reason_bits: _RT
     ) -> str:
         """Generate human-readable explanation."""
         parts = []
-        
-        # Discipline explanation
-        if ReasonTag.EXACT_DISCIPLINE_MATCH in reason_tags:
-            parts.append("Exact discipline match")
-        elif ReasonTag.BROAD_DISCIPLINE_MATCH in reason_tags:
-            parts.append("Broad discipline alignment")
-        elif ReasonTag.INTERDISCIPLINARY_MATCH in reason_tags:
-            parts.append("Interdisciplinary relevance")
-        else:
-            parts.append("Limited discipline match")
-        
-        # Stage explanation
-        if ReasonTag.STAGE_PERFECT_MATCH in reason_tags:
-            parts.append("perfect for your research stage")
-        elif ReasonTag.STAGE_GOOD_MATCH in reason_tags:
-            parts.append("suitable for your research stage")
-        
-        # Deadline explanation
-        if ReasonTag.DEADLINE_OPTIMAL in reason_tags:
-            parts.append("optimal deadline timing")
-        elif ReasonTag.DEADLINE_TIGHT in reason_tags:
-            parts.append("tight but achievable deadline")
-        elif ReasonTag.DEADLINE_VERY_TIGHT in reason_tags:
-            parts.append("very tight deadline")
-        elif ReasonTag.DEADLINE_MISSED in reason_tags:
-            parts.append("deadline has passed")
-        
-        # Timeline explanation
-        if ReasonTag.ALIGNS_WITH_CURRENT_STAGE in reason_tags:
-            parts.append("aligns with your current timeline stage")
-        
+        for group in _EXPLAIN_PHRASES:
+            for bit, phrase in group:
+                if reason_bits & bit:
+                    parts.append(phrase)
+                    break
         return "; ".join(parts).capitalize() + "."
@@ -1,9 +1,10 @@
 """Progress service for tracking milestone completion and timeline progress."""
+from bisect import bisect_left
 from datetime import date, datetime, timezone
 from typing import Optional, Dict, List
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import and_, func
 
 from app.models.timeline_milestone import TimelineMilestone
 from app.models.timeline_stage import TimelineStage
@@ -51,6 +52,20 @@ class ProgressService:
     IMPACT_LOW = "low"
     IMPACT_MEDIUM = "medium"
     IMPACT_HIGH = "high"
+
+    # Delay buckets: <=0, 1-7, 8-30, >30 days (bisect_left over the upper bounds)
+    DELAY_BUCKET_BOUNDS = (0, 7, 30)
+    # Impact level per (is_critical, delay bucket)
+    IMPACT_BY_DELAY = {
+        (True, 0): IMPACT_LOW,
+        (True, 1): IMPACT_MEDIUM,
+        (True, 2): IMPACT_HIGH,
+        (True, 3): IMPACT_HIGH,
+        (False, 0): IMPACT_LOW,
+        (False, 1): IMPACT_LOW,
+        (False, 2): IMPACT_MEDIUM,
+        (False, 3): IMPACT_HIGH,
+    }
     
     def __init__(self, db: Session):
         """
@@ -83,8 +98,8 @@ class ProgressService:
         Raises:
             ProgressServiceError: If validation fails
         """
-        # Verify user exists
-        user = self.db.query(User).filter(User.id == user_id).first()
+        # Verify user exists (identity-map lookup; reused by log_progress_event)
+        user = self.db.get(User, user_id)
         if not user:
             raise ProgressServiceError(f"User with ID {user_id} not found")
         
@@ -95,10 +110,8 @@ class ProgressService:
             user_id=user_id
         )
         
-        # Get milestone
-        milestone = self.db.query(TimelineMilestone).filter(
-            TimelineMilestone.id == milestone_id
-        ).first()
+        # Get milestone (already in the identity map from the invariant check)
+        milestone = self.db.get(TimelineMilestone, milestone_id)
         
         if not milestone:
             raise ProgressServiceError(f"Milestone with ID {milestone_id} not found")
@@ -218,7 +231,7 @@ class ProgressService:
             ProgressServiceError: If validation fails
         """
         # Verify user exists
-        user = self.db.query(User).filter(User.id == user_id).first()
+        user = self.db.get(User, user_id)
         if not user:
             raise ProgressServiceError(f"User with ID {user_id} not found")
         
@@ -315,6 +328,25 @@ class ProgressService:
         if not milestone:
             return None
         
+        return self._milestone_delay_info(milestone, date.today())
+    
+    def _milestone_delay_info(
+        self,
+        milestone,
+        today: date
+    ) -> Dict:
+        """
+        Delay information for an already-loaded milestone (see calculate_milestone_delay).
+        
+        Args:
+            milestone: TimelineMilestone, or a row with its id, title, is_completed,
+                is_critical, target_date and actual_completion_date columns
+            today: Comparison date for incomplete milestones
+            
+        Returns:
+            Dictionary with delay information
+        """
+        milestone_id = milestone.id
         if not milestone.target_date:
             return {
                 "milestone_id": milestone_id,
@@ -335,7 +367,7 @@ class ProgressService:
         else:
             delay_days = self._calculate_delay_days(
                 milestone.target_date,
-                date.today()
+                today
             )
             if delay_days > 0:
                 status = "overdue"
@@ -343,7 +375,7 @@ class ProgressService:
                 status = "due_today"
             else:
                 status = "on_track"
-            comparison_date = date.today()
+            comparison_date = today
         
         # Compute delay flags
         is_delayed = delay_days > 0
@@ -388,12 +420,10 @@ class ProgressService:
         if not stage:
             return None
         
-        # Get all milestones for this stage
-        milestones = self.db.query(TimelineMilestone).filter(
-            TimelineMilestone.timeline_stage_id == stage_id
-        ).all()
+        # Aggregate milestone metrics for this stage in SQL (one row)
+        totals = self._milestone_totals(date.today(), TimelineStage.id == stage_id)
         
-        if not milestones:
+        if not totals.total:
             return {
                 "stage_id": stage_id,
                 "stage_title": stage.title,
@@ -403,31 +433,13 @@ class ProgressService:
                 "has_milestones": False,
             }
         
-        total = len(milestones)
-        completed = sum(1 for m in milestones if m.is_completed)
+        total = totals.total
+        completed = totals.completed
         completion_percentage = (completed / total) * 100 if total > 0 else 0.0
+        overdue_count = totals.overdue
         
-        # Calculate average delay for completed milestones
-        delays = []
-        overdue_count = 0
-        
-        for milestone in milestones:
-            if milestone.target_date:
-                if milestone.is_completed and milestone.actual_completion_date:
-                    delay = self._calculate_delay_days(
-                        milestone.target_date,
-                        milestone.actual_completion_date
-                    )
-                    delays.append(delay)
-                elif not milestone.is_completed:
-                    delay = self._calculate_delay_days(
-                        milestone.target_date,
-                        date.today()
-                    )
-                    if delay > 0:
-                        overdue_count += 1
-        
-        avg_delay = sum(delays) / len(delays) if delays else 0.0
+        # Average delay for completed milestones
+        avg_delay = float(totals.avg_delay) if totals.avg_delay is not None else 0.0
         
         return {
             "stage_id": stage_id,
@@ -444,30 +456,35 @@ class ProgressService:
     
     def get_timeline_progress(
         self,
-        committed_timeline_id: UUID
+        committed_timeline_id: UUID,
+        today: Optional[date] = None
     ) -> Optional[Dict]:
         """
         Calculate overall progress for a committed timeline.
         
         Args:
             committed_timeline_id: Committed timeline ID
+            today: Comparison date for overdue/duration metrics (defaults to today)
             
         Returns:
             Dictionary with timeline progress metrics
         """
-        timeline = self.db.query(CommittedTimeline).filter(
-            CommittedTimeline.id == committed_timeline_id
-        ).first()
+        if today is None:
+            today = date.today()
+        timeline = self.db.get(CommittedTimeline, committed_timeline_id)
         
         if not timeline:
             return None
         
-        # Get all stages
-        stages = self.db.query(TimelineStage).filter(
+        # Stage counts in one aggregate row
+        total_stages, completed_stages = self.db.query(
+            func.count(TimelineStage.id),
+            func.count(TimelineStage.id).filter(TimelineStage.status == "completed"),
+        ).filter(
             TimelineStage.committed_timeline_id == committed_timeline_id
-        ).all()
+        ).one()
         
-        if not stages:
+        if not total_stages:
             return {
                 "timeline_id": committed_timeline_id,
                 "timeline_title": timeline.title,
@@ -475,19 +492,13 @@ class ProgressService:
                 "has_data": False,
             }
         
-        # Calculate stage-level metrics
-        total_stages = len(stages)
-        completed_stages = sum(1 for s in stages if s.status == "completed")
-        
-        # Get all milestones across all stages
-        all_milestones = []
-        for stage in stages:
-            milestones = self.db.query(TimelineMilestone).filter(
-                TimelineMilestone.timeline_stage_id == stage.id
-            ).all()
-            all_milestones.extend(milestones)
+        # Milestone metrics across all stages, aggregated in SQL (one row)
+        totals = self._milestone_totals(
+            today,
+            TimelineStage.committed_timeline_id == committed_timeline_id
+        )
         
-        if not all_milestones:
+        if not totals.total:
             return {
                 "timeline_id": committed_timeline_id,
                 "timeline_title": timeline.title,
@@ -497,51 +508,26 @@ class ProgressService:
                 "has_data": False,
             }
         
-        # Calculate milestone metrics
-        total_milestones = len(all_milestones)
-        completed_milestones = sum(1 for m in all_milestones if m.is_completed)
-        critical_milestones = sum(1 for m in all_milestones if m.is_critical)
-        completed_critical = sum(
-            1 for m in all_milestones 
-            if m.is_critical and m.is_completed
-        )
+        total_milestones = totals.total
+        completed_milestones = totals.completed
+        critical_milestones = totals.critical
+        completed_critical = totals.completed_critical
         
         completion_percentage = (
             (completed_milestones / total_milestones) * 100 
             if total_milestones > 0 else 0.0
         )
         
-        # Calculate delays
-        delays = []
-        overdue_count = 0
-        overdue_critical_count = 0
-        
-        for milestone in all_milestones:
-            if milestone.target_date:
-                if milestone.is_completed and milestone.actual_completion_date:
-                    delay = self._calculate_delay_days(
-                        milestone.target_date,
-                        milestone.actual_completion_date
-                    )
-                    delays.append(delay)
-                elif not milestone.is_completed:
-                    delay = self._calculate_delay_days(
-                        milestone.target_date,
-                        date.today()
-                    )
-                    if delay > 0:
-                        overdue_count += 1
-                        if milestone.is_critical:
-                            overdue_critical_count += 1
-        
-        avg_delay = sum(delays) / len(delays) if delays else 0.0
-        max_delay = max(delays) if delays else 0
+        overdue_count = totals.overdue
+        overdue_critical_count = totals.overdue_critical
+        avg_delay = float(totals.avg_delay) if totals.avg_delay is not None else 0.0
+        max_delay = totals.max_delay if totals.max_delay is not None else 0
         
         # Calculate timeline duration progress
         duration_progress = None
         if timeline.committed_date and timeline.target_completion_date:
             total_days = (timeline.target_completion_date - timeline.committed_date).days
-            elapsed_days = (date.today() - timeline.committed_date).days
+            elapsed_days = (today - timeline.committed_date).days
             
             if total_days > 0:
                 duration_progress = (elapsed_days / total_days) * 100
@@ -586,74 +572,116 @@ class ProgressService:
         Returns:
             List of ProgressEvent objects
         """
-        query = self.db.query(ProgressEvent).filter(
-            ProgressEvent.user_id == user_id
-        )
-        
-        if milestone_id:
-            query = query.filter(ProgressEvent.milestone_id == milestone_id)
-        
-        if event_type:
-            query = query.filter(ProgressEvent.event_type == event_type)
-        
-        return query.order_by(
-            ProgressEvent.event_date.desc()
+        return self._progress_events_query(
+            user_id, milestone_id, event_type
         ).limit(limit).all()
     
     def get_all_delayed_milestones(
         self,
         committed_timeline_id: UUID,
-        include_completed: bool = False
+        include_completed: bool = False,
+        today: Optional[date] = None
     ) -> List[Dict]:
         """
         Get all delayed milestones for a timeline using delay flag computation.
         
-        Uses compute_delay_flags() to determine which milestones are delayed.
+        Loads candidate milestones with their stages in one query (target date set;
+        completed ones only when requested) and computes the same delay flags as
+        compute_delay_flags() on the loaded rows, without re-querying each milestone.
         
         Args:
             committed_timeline_id: Committed timeline ID
             include_completed: Whether to include completed but delayed milestones
+            today: Comparison date for incomplete milestones (defaults to today)
             
         Returns:
             List of delayed milestone information dicts with delay flags
         """
-        # Get all stages
-        stages = self.db.query(TimelineStage).filter(
-            TimelineStage.committed_timeline_id == committed_timeline_id
-        ).all()
+        # Milestones with their stages in one query (not one query per stage), selecting
+        # only the columns the delay dicts use
+        query = self.db.query(
+            TimelineMilestone.id,
+            TimelineMilestone.title,
+            TimelineMilestone.is_completed,
+            TimelineMilestone.is_critical,
+            TimelineMilestone.target_date,
+            TimelineMilestone.actual_completion_date,
+            TimelineStage.id.label("stage_id"),
+            TimelineStage.title.label("stage_title"),
+            TimelineStage.stage_order,
+        ).join(
+            TimelineStage, TimelineMilestone.timeline_stage_id == TimelineStage.id
+        ).filter(
+            TimelineStage.committed_timeline_id == committed_timeline_id,
+            TimelineMilestone.target_date.isnot(None),
+        )
+        # Skip completed milestones unless requested
+        if not include_completed:
+            query = query.filter(TimelineMilestone.is_completed.is_(False))
         
+        if today is None:
+            today = date.today()
         delayed = []
         
-        for stage in stages:
-            milestones = self.db.query(TimelineMilestone).filter(
-                TimelineMilestone.timeline_stage_id == stage.id
-            ).all()
+        for row in query.all():
+            # Compute delay flags (planned vs actual)
+            delay_info = self._milestone_delay_info(row, today)
             
-            for milestone in milestones:
-                if not milestone.target_date:
-                    continue
-                
-                # Skip completed milestones unless requested
-                if milestone.is_completed and not include_completed:
-                    continue
-                
-                # Compute delay flags (planned vs actual)
-                delay_info = self.compute_delay_flags(milestone.id)
-                
-                # Only include milestones with is_delayed flag = True
-                if delay_info and delay_info.get("is_delayed", False):
-                    delayed.append({
-                        **delay_info,
-                        "stage_id": str(stage.id),
-                        "stage_title": stage.title,
-                        "stage_order": stage.stage_order
-                    })
+            # Only include milestones with is_delayed flag = True
+            if delay_info["is_delayed"]:
+                delayed.append({
+                    **delay_info,
+                    "stage_id": str(row.stage_id),
+                    "stage_title": row.stage_title,
+                    "stage_order": row.stage_order
+                })
         
         # Sort by delay (most delayed first)
         delayed.sort(key=lambda x: x["delay_days"], reverse=True)
         
         return delayed
     
+    def get_overdue_milestone_ids_by_timeline(
+        self,
+        committed_timeline_ids: List[UUID],
+        today: Optional[date] = None
+    ) -> Dict[UUID, List[UUID]]:
+        """
+        Overdue incomplete milestones for several timelines in one query.
+        
+        Same set as get_all_delayed_milestones(include_completed=False): incomplete
+        milestones whose target date is before today.
+        
+        Args:
+            committed_timeline_ids: Committed timeline IDs
+            today: Comparison date (defaults to today)
+            
+        Returns:
+            Dictionary of committed timeline ID to milestone IDs, most delayed first;
+            timelines without overdue milestones are absent
+        """
+        if not committed_timeline_ids:
+            return {}
+        if today is None:
+            today = date.today()
+        rows = self.db.query(
+            TimelineStage.committed_timeline_id,
+            TimelineMilestone.id,
+        ).join(
+            TimelineStage, TimelineMilestone.timeline_stage_id == TimelineStage.id
+        ).filter(
+            TimelineStage.committed_timeline_id.in_(committed_timeline_ids),
+            TimelineMilestone.is_completed.is_(False),
+            TimelineMilestone.target_date < today,
+        ).order_by(
+            TimelineMilestone.target_date, TimelineMilestone.id
+        )
+        
+        overdue: Dict[UUID, List[UUID]] = {}
+        for timeline_id, milestone_id in rows:
+            overdue.setdefault(timeline_id, []).append(milestone_id)
+        return overdue
+    
     def get_progress_summary(
         self,
         user_id: UUID,
@@ -671,7 +699,9 @@ class ProgressService:
         Returns:
             Dictionary with comprehensive progress data
         """
-        timeline_progress = self.get_timeline_progress(committed_timeline_id)
+        # One comparison date for every metric in the summary
+        today = date.today()
+        timeline_progress = self.get_timeline_progress(committed_timeline_id, today=today)
         
         if not timeline_progress or not timeline_progress.get("has_data"):
             return {
@@ -681,12 +711,8 @@ class ProgressService:
         
         delayed_milestones = self.get_all_delayed_milestones(
             committed_timeline_id,
-            include_completed=False
-        )
-        
-        recent_events = self.get_user_progress_events(
-            user_id=user_id,
-            limit=10
+            include_completed=False,
+            today=today
         )
         
         # Calculate health indicators
@@ -712,16 +738,7 @@ class ProgressService:
             "has_data": True,
             "timeline_progress": timeline_progress,
             "delayed_milestones": delayed_milestones[:5],  # Top 5 most delayed
-            "recent_events": [
-                {
-                    "id": str(e.id),
-                    "event_type": e.event_type,
-                    "title": e.title,
-                    "event_date": e.event_date.isoformat() if e.event_date else None,
-                    "impact_level": e.impact_level
-                }
-                for e in recent_events
-            ],
+            "recent_events": self.get_user_progress_events_projection(user_id, limit=10),
             "health_status": health_status,
             "risk_indicators": {
                 "overdue_milestones": overdue_count,
@@ -736,6 +753,113 @@ class ProgressService:
     
     # Private helper methods
     
+    def get_user_progress_events_projection(
+        self,
+        user_id: UUID,
+        limit: int = 10
+    ) -> List[Dict]:
+        """
+        Get a user's most recent progress events as summary dictionaries.
+        
+        Selects only the five summary columns (no ProgressEvent hydration) and
+        serializes rows as they are fetched.
+        
+        Args:
+            user_id: User ID
+            limit: Maximum number of events to return
+            
+        Returns:
+            List of event dictionaries, newest first
+        """
+        rows = self._progress_events_query(user_id).with_entities(
+            ProgressEvent.id,
+            ProgressEvent.event_type,
+            ProgressEvent.title,
+            ProgressEvent.event_date,
+            ProgressEvent.impact_level,
+        ).limit(limit)
+        return [
+            {
+                "id": str(event_id),
+                "event_type": event_type,
+                "title": title,
+                "event_date": event_date.isoformat() if event_date else None,
+                "impact_level": impact_level
+            }
+            for event_id, event_type, title, event_date, impact_level in rows
+        ]
+    
+    def _progress_events_query(
+        self,
+        user_id: UUID,
+        milestone_id: Optional[UUID] = None,
+        event_type: Optional[str] = None,
+    ):
+        """
+        Query for a user's progress events, newest first (see get_user_progress_events).
+        
+        Args:
+            user_id: User ID
+            milestone_id: Optional filter by milestone
+            event_type: Optional filter by event type
+            
+        Returns:
+            ProgressEvent query ordered by (event_date, id) descending, without a limit
+        """
+        query = self.db.query(ProgressEvent).filter(
+            ProgressEvent.user_id == user_id
+        )
+        
+        if milestone_id:
+            query = query.filter(ProgressEvent.milestone_id == milestone_id)
+        
+        if event_type:
+            query = query.filter(ProgressEvent.event_type == event_type)
+        
+        # id breaks event_date ties deterministically; the order matches
+        # ix_progress_events_user_date, so LIMIT reads the index in order
+        return query.order_by(ProgressEvent.event_date.desc(), ProgressEvent.id.desc())
+    
+    def _milestone_totals(self, today: date, *criteria):
+        """
+        Aggregate milestone metrics in one SQL row (no milestone rows loaded).
+        
+        Milestones are joined to their stage so ``criteria`` may filter on either
+        model. Same rules as _calculate_delay_days: delays (actual - target, in days)
+        cover completed milestones with both dates; overdue means incomplete with a
+        target date before ``today`` (bound as a parameter).
+        
+        Args:
+            today: Comparison date for overdue milestones
+            *criteria: Filter expressions selecting the milestones
+            
+        Returns:
+            Row with total, completed, critical, completed_critical, overdue,
+            overdue_critical, avg_delay and max_delay (the delays None if no data)
+        """
+        m = TimelineMilestone
+        completed_with_dates = and_(
+            m.is_completed.is_(True),
+            m.actual_completion_date.isnot(None),
+            m.target_date.isnot(None),
+        )
+        overdue = and_(m.is_completed.is_(False), m.target_date < today)
+        delay_days = m.actual_completion_date - m.target_date
+        return self.db.query(
+            func.count(m.id).label("total"),
+            func.count(m.id).filter(m.is_completed.is_(True)).label("completed"),
+            func.count(m.id).filter(m.is_critical.is_(True)).label("critical"),
+            func.count(m.id).filter(
+                m.is_critical.is_(True), m.is_completed.is_(True)
+            ).label("completed_critical"),
+            func.count(m.id).filter(overdue).label("overdue"),
+            func.count(m.id).filter(overdue, m.is_critical.is_(True)).label("overdue_critical"),
+            func.avg(delay_days).filter(completed_with_dates).label("avg_delay"),
+            func.max(delay_days).filter(completed_with_dates).label("max_delay"),
+        ).join(
+            TimelineStage, m.timeline_stage_id == TimelineStage.id
+        ).filter(*criteria).one()
+    
     def _calculate_delay_days(
         self,
         target_date: Optional[date],
@@ -776,17 +900,5 @@ class ProgressService:
         Returns:
             Impact level (low, medium, high)
         """
-        if is_critical:
-            if delay_days > 7:
-                return self.IMPACT_HIGH
-            elif delay_days > 0:
-                return self.IMPACT_MEDIUM
-            else:
-                return self.IMPACT_LOW
-        else:
-            if delay_days > 30:
-                return self.IMPACT_HIGH
-            elif delay_days > 7:
-                return self.IMPACT_MEDIUM
-            else:
-                return self.IMPACT_LOW
+        bucket = bisect_left(self.DELAY_BUCKET_BOUNDS, delay_days)
+        return self.IMPACT_BY_DELAY[(bool(is_critical), bucket)]
@@ -5,6 +5,7 @@ Returns a single suggested_stage, confidence_score, and reasoning_tokens (intern
 Uses TimelineIntelligenceEngine.detect_stages; picks the dominant/current stage.
 """
 
+import re
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 
@@ -13,6 +14,28 @@ from app.services.timeline_intelligence_engine import (
     DetectedStage,
 )
 
+# Shared across instances/requests: LLM client setup runs once per process. Built
+# without a db session, so it holds no per-request state beyond its bounded caches.
+_shared_engine: Optional[TimelineIntelligenceEngine] = None
+
+
+def _timeline_engine() -> TimelineIntelligenceEngine:
+    global _shared_engine
+    if _shared_engine is None:
+        _shared_engine = TimelineIntelligenceEngine()
+    return _shared_engine
+
+
+# PhD-stage vocabulary (case-insensitive word prefixes). A document containing none
+# of these cannot describe a stage, so it skips detection (an LLM call when available)
+# in a single regex scan.
+_STAGE_VOCABULARY = re.compile(
+    r"\b(?:coursework|literature|proposal|qualifying|method|data|field ?work|experiment"
+    r"|survey|interview|analy|writ|draft|chapter|thesis|dissertation|manuscript"
+    r"|submi|defen|viva|publi)",
+    re.IGNORECASE,
+)
+
 
 @dataclass
 class StageInferenceResult:
@@ -30,7 +53,7 @@ class StageClassificationEngine:
     """
 
     def __init__(self) -> None:
-        self._engine = TimelineIntelligenceEngine()
+        self._engine = _timeline_engine()
 
     def infer_from_document(
         self,
@@ -49,7 +72,7 @@ class StageClassificationEngine:
             confidence_score: 0.0 to 1.0
             reasoning_tokens: List of evidence strings (internal)
         """
-        if not (text or "").strip():
+        if not (text or "").strip() or not _STAGE_VOCABULARY.search(text):
             return StageInferenceResult(
                 suggested_stage="Other Activities",
                 confidence_score=0.0,
@@ -64,13 +87,15 @@ class StageClassificationEngine:
             )
         # Pick the "current" stage: highest order_hint among those with best confidence,
         # or single highest-confidence stage (assume most advanced detected = current)
-        best = max(
-            detected,
-            key=lambda s: (s.order_hint, s.confidence),
-        )
-        reasoning_tokens = []
-        for e in (best.evidence or [])[:10]:
-            reasoning_tokens.append(getattr(e, "text", str(e)))
+        # Single pass without per-item key tuples; ties keep the earliest stage, as max() did
+        best = detected[0]
+        for stage in detected[1:]:
+            if stage.order_hint > best.order_hint or (
+                stage.order_hint == best.order_hint and stage.confidence > best.confidence
+            ):
+                best = stage
+        # DetectedStage.evidence holds EvidenceSnippet objects, so .text is always present
+        reasoning_tokens = [e.text for e in best.evidence[:10]]
         return StageInferenceResult(
             suggested_stage=best.title,
             confidence_score=round(best.confidence, 4),
@@ -3,6 +3,8 @@ Stage suggestion service: accept/override and timeline regeneration.
 
 - Accept: set accepted_stage = suggested_stage.
 - Override: set override_stage, override_reason, system_suggested_stage; emit stage_override; trigger regen.
+  The API schedules regeneration as a background task (regenerate_timeline) so the
+  response returns once the override is committed.
 Historical classification data (suggested_stage, reasoning_tokens) is never deleted.
 """
 
@@ -10,6 +12,7 @@ from typing import Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 
+from app.database import SessionLocal
 from app.models.document_stage_suggestion import DocumentStageSuggestion
 from app.models.document_artifact import DocumentArtifact
 from app.models.user import User
@@ -23,21 +26,60 @@ class StageSuggestionServiceError(Exception):
     pass
 
 
+def _regenerate_from_latest_baseline(db: Session, user_id: UUID) -> None:
+    """
+    Create a new draft timeline from the user's latest baseline, if any.
+    Does not delete existing timelines; adds a new draft for user to commit.
+    """
+    baseline = (
+        db.query(Baseline)
+        .filter(Baseline.user_id == user_id)
+        .order_by(Baseline.created_at.desc())
+        .first()
+    )
+    if not baseline:
+        return
+    try:
+        orch = TimelineOrchestrator(db, user_id=user_id)
+        orch.create_draft_timeline(
+            baseline_id=baseline.id,
+            user_id=user_id,
+        )
+    except Exception:
+        # Log but do not fail override
+        pass
+
+
+def regenerate_timeline(user_id: UUID) -> None:
+    """
+    Background-task entry point for timeline regeneration after a stage override.
+    Runs outside the request, so it opens (and closes) its own session.
+    """
+    db = SessionLocal()
+    try:
+        _regenerate_from_latest_baseline(db, user_id)
+    finally:
+        db.close()
+
+
 class StageSuggestionService:
     def __init__(self, db: Session) -> None:
         self.db = db
 
     def get_suggestion(self, document_id: UUID, user_id: UUID) -> Optional[DocumentStageSuggestion]:
-        """Get stage suggestion for document; verify ownership."""
-        doc = self.db.query(DocumentArtifact).filter(
-            DocumentArtifact.id == document_id,
-            DocumentArtifact.user_id == user_id,
-        ).first()
-        if not doc:
-            return None
-        return self.db.query(DocumentStageSuggestion).filter(
-            DocumentStageSuggestion.document_artifact_id == document_id,
-        ).first()
+        """Get stage suggestion for document; verify ownership (one joined query)."""
+        return (
+            self.db.query(DocumentStageSuggestion)
+            .join(
+                DocumentArtifact,
+                DocumentArtifact.id == DocumentStageSuggestion.document_artifact_id,
+            )
+            .filter(
+                DocumentArtifact.id == document_id,
+                DocumentArtifact.user_id == user_id,
+            )
+            .first()
+        )
 
     def accept_stage(self, document_id: UUID, user_id: UUID) -> Optional[DocumentStageSuggestion]:
         """
@@ -59,16 +101,19 @@ class StageSuggestionService:
         user_id: UUID,
         override_stage: str,
         override_reason: str,
+        regenerate: bool = True,
     ) -> Optional[DocumentStageSuggestion]:
         """
         Override with user-chosen stage. Logs stage_override event, stores
         override_reason and system_suggested_stage, does not delete historical data.
-        Triggers timeline regeneration (new draft from user's baseline if any).
+        Triggers timeline regeneration (new draft from user's baseline if any) unless
+        regenerate is False, in which case the caller schedules regenerate_timeline.
         """
         suggestion = self.get_suggestion(document_id, user_id)
         if not suggestion:
             return None
-        user = self.db.query(User).filter(User.id == user_id).first()
+        # Identity-map hit when the request already loaded the current user
+        user = self.db.get(User, user_id)
         suggestion.override_stage = override_stage
         suggestion.override_reason = override_reason
         suggestion.system_suggested_stage = suggestion.suggested_stage
@@ -91,28 +136,10 @@ class StageSuggestionService:
         )
         self.db.commit()
         self.db.refresh(suggestion)
-        self._trigger_timeline_regeneration(user_id)
+        if regenerate:
+            self._trigger_timeline_regeneration(user_id)
         return suggestion
 
     def _trigger_timeline_regeneration(self, user_id: UUID) -> None:
-        """
-        Create a new draft timeline from the user's latest baseline, if any.
-        Does not delete existing timelines; adds a new draft for user to commit.
-        """
-        baseline = (
-            self.db.query(Baseline)
-            .filter(Baseline.user_id == user_id)
-            .order_by(Baseline.created_at.desc())
-            .first()
-        )
-        if not baseline:
-            return
-        try:
-            orch = TimelineOrchestrator(self.db, user_id=user_id)
-            orch.create_draft_timeline(
-                baseline_id=baseline.id,
-                user_id=user_id,
-            )
-        except Exception:
-            # Log but do not fail override
-            pass
+        """Regenerate the user's draft timeline in this service's session."""
+        _regenerate_from_latest_baseline(self.db, user_id)
@@ -1,20 +1,24 @@
 """
 State transition service: validate transitions, update entity state + timestamp, log to event store.
+
+transition_* apply the new state with a compare-and-set UPDATE (only while the row is
+still in the state that was validated), so concurrent transitions cannot both succeed.
 """
 
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional, Set, Tuple
 from uuid import UUID
 
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.core.event_taxonomy import EventType
 from app.services.event_store import EventStore, EventStoreError
 from app.core.state_machines import (
-    opportunity_can_transition,
-    supervision_session_can_transition,
-    milestone_can_transition,
-    writing_version_can_transition,
+    OPPORTUNITY_TRANSITIONS,
+    SUPERVISION_SESSION_TRANSITIONS,
+    MILESTONE_TRANSITIONS,
+    WRITING_VERSION_TRANSITIONS,
 )
 
 
@@ -27,16 +31,33 @@ class InvalidTransitionError(Exception):
     pass
 
 
-# Entity type to validator
-_TRANSITION_VALIDATORS: Dict[str, Callable[[str, str], bool]] = {
-    "opportunity": opportunity_can_transition,
-    "supervision_session": supervision_session_can_transition,
-    "milestone": milestone_can_transition,
-    "writing_version": writing_version_can_transition,
+def _edges(transitions: Dict[str, Set[str]]) -> FrozenSet[Tuple[str, str]]:
+    """Flatten a state machine's transition map into its (from_state, to_state) edges."""
+    return frozenset((src, dst) for src, targets in transitions.items() for dst in targets)
+
+
+# Entity type to allowed (from_state, to_state) edges, enumerated once at import;
+# validating a transition is a single set membership test
+_ALLOWED_TRANSITIONS: Dict[str, FrozenSet[Tuple[str, str]]] = {
+    "opportunity": _edges(OPPORTUNITY_TRANSITIONS),
+    "supervision_session": _edges(SUPERVISION_SESSION_TRANSITIONS),
+    "milestone": _edges(MILESTONE_TRANSITIONS),
+    "writing_version": _edges(WRITING_VERSION_TRANSITIONS),
 }
 
 
-def validate_and_log_transition(
+def _check_transition(entity_type: str, from_state: str, to_state: str) -> None:
+    """Raise InvalidTransitionError unless from_state -> to_state is allowed for entity_type."""
+    allowed = _ALLOWED_TRANSITIONS.get(entity_type)
+    if allowed is None:
+        raise InvalidTransitionError(f"Unknown entity_type for state machine: {entity_type}")
+    if (from_state, to_state) not in allowed:
+        raise InvalidTransitionError(
+            f"Invalid transition for {entity_type}: {from_state} -> {to_state}"
+        )
+
+
+def _log_transition(
     db: Session,
     *,
     entity_type: str,
@@ -46,20 +67,12 @@ def validate_and_log_transition(
     user_id: UUID,
     user_role: str,
     source_module: str,
+    ts: datetime,
     metadata: Optional[Dict[str, Any]] = None,
-) -> datetime:
+) -> None:
     """
-    Validate that the transition is allowed; emit state_transition event; return timestamp.
-    Does not update the entity (caller must set state and state_entered_at).
+    Emit the state_transition event (in the caller's transaction); logging failures are ignored.
     """
-    validator = _TRANSITION_VALIDATORS.get(entity_type)
-    if not validator:
-        raise InvalidTransitionError(f"Unknown entity_type for state machine: {entity_type}")
-    if not validator(from_state, to_state):
-        raise InvalidTransitionError(
-            f"Invalid transition for {entity_type}: {from_state} -> {to_state}"
-        )
-    ts = _utcnow()
     payload = dict(metadata or {})
     payload["from_state"] = from_state
     payload["to_state"] = to_state
@@ -79,9 +92,86 @@ def validate_and_log_transition(
         )
     except EventStoreError:
         pass  # do not fail transition if logging fails
+
+
+def validate_and_log_transition(
+    db: Session,
+    *,
+    entity_type: str,
+    entity_id: UUID,
+    from_state: str,
+    to_state: str,
+    user_id: UUID,
+    user_role: str,
+    source_module: str,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> datetime:
+    """
+    Validate that the transition is allowed; emit state_transition event; return timestamp.
+    Does not update the entity (caller must set state and state_entered_at).
+    """
+    _check_transition(entity_type, from_state, to_state)
+    ts = _utcnow()
+    _log_transition(
+        db,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        from_state=from_state,
+        to_state=to_state,
+        user_id=user_id,
+        user_role=user_role,
+        source_module=source_module,
+        ts=ts,
+        metadata=metadata,
+    )
     return ts
 
 
+def _apply_transition(
+    db: Session,
+    entity: Any,
+    *,
+    entity_type: str,
+    from_state: str,
+    to_state: str,
+    user_id: UUID,
+    user_role: str,
+    source_module: str,
+) -> Any:
+    """
+    Validate, then set state and state_entered_at with a single
+    UPDATE ... WHERE id = :id AND state = :from_state RETURNING id, and log the
+    transition in the same transaction. The session copy of entity is updated too.
+    Raises InvalidTransitionError if the row left from_state in the meantime.
+    """
+    _check_transition(entity_type, from_state, to_state)
+    model = type(entity)
+    ts = _utcnow()
+    applied = db.execute(
+        update(model)
+        .where(model.id == entity.id, model.state == from_state)
+        .values(state=to_state, state_entered_at=ts)
+        .returning(model.id)
+    ).first()
+    if applied is None:
+        raise InvalidTransitionError(
+            f"{entity_type} {entity.id} is no longer in state {from_state}; "
+            f"transition to {to_state} not applied"
+        )
+    _log_transition(
+        db,
+        entity_type=entity_type,
+        entity_id=entity.id,
+        from_state=from_state,
+        to_state=to_state,
+        user_id=user_id,
+        user_role=user_role,
+        source_module=source_module,
+        ts=ts,
+    )
+    return entity
+
+
 def transition_opportunity(
     db: Session,
     user_opportunity_id: UUID,
@@ -92,23 +182,19 @@ def transition_opportunity(
 ) -> "UserOpportunity":
     """Validate, log, and apply opportunity state transition. Returns updated entity."""
     from app.models.user_opportunity import UserOpportunity
-    uo = db.query(UserOpportunity).filter(UserOpportunity.id == user_opportunity_id).first()
+    uo = db.get(UserOpportunity, user_opportunity_id)
     if not uo:
         raise InvalidTransitionError("UserOpportunity not found")
-    ts = validate_and_log_transition(
+    return _apply_transition(
         db,
+        uo,
         entity_type="opportunity",
-        entity_id=uo.id,
         from_state=uo.state,
         to_state=to_state,
         user_id=user_id,
         user_role=user_role,
         source_module=source_module,
     )
-    uo.state = to_state
-    uo.state_entered_at = ts
-    db.add(uo)
-    return uo
 
 
 def transition_supervision_session(
@@ -121,23 +207,19 @@ def transition_supervision_session(
 ) -> "SupervisionSession":
     """Validate, log, and apply supervision session state transition."""
     from app.models.supervision_session import SupervisionSession
-    session = db.query(SupervisionSession).filter(SupervisionSession.id == session_id).first()
+    session = db.get(SupervisionSession, session_id)
     if not session:
         raise InvalidTransitionError("SupervisionSession not found")
-    ts = validate_and_log_transition(
+    return _apply_transition(
         db,
+        session,
         entity_type="supervision_session",
-        entity_id=session.id,
         from_state=session.state,
         to_state=to_state,
         user_id=user_id,
         user_role=user_role,
         source_module=source_module,
     )
-    session.state = to_state
-    session.state_entered_at = ts
-    db.add(session)
-    return session
 
 
 def transition_milestone(
@@ -150,24 +232,19 @@ def transition_milestone(
 ) -> "TimelineMilestone":
     """Validate, log, and apply milestone state transition."""
     from app.models.timeline_milestone import TimelineMilestone
-    m = db.query(TimelineMilestone).filter(TimelineMilestone.id == milestone_id).first()
+    m = db.get(TimelineMilestone, milestone_id)
     if not m:
         raise InvalidTransitionError("TimelineMilestone not found")
-    from_state = getattr(m, "state", "upcoming") or "upcoming"
-    ts = validate_and_log_transition(
+    return _apply_transition(
         db,
+        m,
         entity_type="milestone",
-        entity_id=m.id,
-        from_state=from_state,
+        from_state=getattr(m, "state", "upcoming") or "upcoming",
         to_state=to_state,
         user_id=user_id,
         user_role=user_role,
         source_module=source_module,
     )
-    m.state = to_state
-    m.state_entered_at = ts
-    db.add(m)
-    return m
 
 
 def transition_writing_version(
@@ -180,20 +257,16 @@ def transition_writing_version(
 ) -> "WritingVersion":
     """Validate, log, and apply writing version state transition."""
     from app.models.writing_version import WritingVersion
-    wv = db.query(WritingVersion).filter(WritingVersion.id == writing_version_id).first()
+    wv = db.get(WritingVersion, writing_version_id)
     if not wv:
         raise InvalidTransitionError("WritingVersion not found")
-    ts = validate_and_log_transition(
+    return _apply_transition(
         db,
+        wv,
         entity_type="writing_version",
-        entity_id=wv.id,
         from_state=wv.state,
         to_state=to_state,
         user_id=user_id,
         user_role=user_role,
         source_module=source_module,
     )
-    wv.state = to_state
-    wv.state_entered_at = ts
-    db.add(wv)
-    return wv
@@ -6,10 +6,11 @@ the system generates a suggestion. User can accept or reject; milestones are nev
 Logs: suggestion_event, acceptance_event, rejection_event.
 """
 
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 from uuid import UUID
 
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from app.models.timeline_adjustment_suggestion import (
@@ -24,7 +25,7 @@ from app.models.timeline_adjustment_suggestion import (
 from app.models.committed_timeline import CommittedTimeline
 from app.models.user import User
 from app.core.event_taxonomy import EventType
-from app.services.event_store import emit_event
+from app.services.event_store import EventBuffer, emit_event
 from app.services.engagement_engine import EngagementEngine
 from app.services.progress_service import ProgressService
 
@@ -33,6 +34,15 @@ def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# Pending suggestion owned by the user (accept/reject). Built once at import and
+# executed with bound parameters, so each call reuses the same compiled statement.
+_PENDING_SUGGESTION_FOR_USER = select(TimelineAdjustmentSuggestion).where(
+    TimelineAdjustmentSuggestion.id == bindparam("suggestion_id"),
+    TimelineAdjustmentSuggestion.user_id == bindparam("user_id"),
+    TimelineAdjustmentSuggestion.status == STATUS_PENDING,
+)
+
+
 class TimelineFeedbackServiceError(Exception):
     pass
 
@@ -50,23 +60,165 @@ class TimelineFeedbackService:
         self.db = db
         self.engagement_engine = EngagementEngine(db)
         self.progress_service = ProgressService(db)
+        # (user_id, committed_timeline_id) -> reasons suggested within the cooldown
+        self._recent_reasons: Dict[Tuple[UUID, UUID], FrozenSet[str]] = {}
 
-    def _has_recent_suggestion(
+    def _recent_suggestion_pairs(
+        self,
+        user_ids: List[UUID],
+        committed_timeline_ids: List[UUID],
+    ) -> Set[Tuple[UUID, str]]:
+        """(committed_timeline_id, reason) pairs with a suggestion created within the cooldown."""
+        cutoff = _utcnow() - timedelta(days=self.SUGGESTION_COOLDOWN_DAYS)
+        return set(
+            self.db.query(
+                TimelineAdjustmentSuggestion.committed_timeline_id,
+                TimelineAdjustmentSuggestion.reason,
+            )
+            .filter(
+                TimelineAdjustmentSuggestion.user_id.in_(user_ids),
+                TimelineAdjustmentSuggestion.committed_timeline_id.in_(committed_timeline_ids),
+                TimelineAdjustmentSuggestion.created_at >= cutoff,
+            )
+            .distinct()
+        )
+
+    def _recent_suggestion_reasons(
         self,
         user_id: UUID,
         committed_timeline_id: UUID,
-        reason: str,
-    ) -> bool:
-        """True if a pending or recently responded suggestion exists for this reason."""
-        from datetime import timedelta
-        cutoff = _utcnow() - timedelta(days=self.SUGGESTION_COOLDOWN_DAYS)
-        q = self.db.query(TimelineAdjustmentSuggestion).filter(
-            TimelineAdjustmentSuggestion.user_id == user_id,
-            TimelineAdjustmentSuggestion.committed_timeline_id == committed_timeline_id,
-            TimelineAdjustmentSuggestion.reason == reason,
-            TimelineAdjustmentSuggestion.created_at >= cutoff,
+    ) -> FrozenSet[str]:
+        """
+        Reasons with a pending or recently responded suggestion for this timeline.
+        One query per (user, timeline), memoized until suggestions are saved for it.
+        """
+        key = (user_id, committed_timeline_id)
+        reasons = self._recent_reasons.get(key)
+        if reasons is None:
+            reasons = frozenset(
+                reason
+                for _, reason in self._recent_suggestion_pairs([user_id], [committed_timeline_id])
+            )
+            self._recent_reasons[key] = reasons
+        return reasons
+
+    def _milestone_delay_suggestion(
+        self,
+        user_id: UUID,
+        committed_timeline_id: UUID,
+        delayed_milestone_ids: List[UUID],
+    ) -> Tuple[TimelineAdjustmentSuggestion, Dict[str, Any]]:
+        """Suggestion and event metadata for delayed milestones (ids most delayed first)."""
+        suggestion = TimelineAdjustmentSuggestion(
+            user_id=user_id,
+            committed_timeline_id=committed_timeline_id,
+            reason=REASON_MILESTONE_DELAY,
+            title="Milestone delay detected",
+            message=(
+                f"You have {len(delayed_milestone_ids)} delayed milestone(s). "
+                "Consider reviewing target dates or marking progress. "
+                "The timeline has not been changed."
+            ),
+            suggestion_payload={
+                "delayed_milestone_count": len(delayed_milestone_ids),
+                "delayed_milestone_ids": [str(mid) for mid in delayed_milestone_ids[:20]],
+                "recommended_action": (
+                    "Review timeline and update target dates or log completion as appropriate."
+                ),
+            },
+            status=STATUS_PENDING,
         )
-        return q.first() is not None
+        return suggestion, {
+            "reason": REASON_MILESTONE_DELAY,
+            "committed_timeline_id": str(committed_timeline_id),
+            "delayed_count": len(delayed_milestone_ids),
+        }
+
+    def _supervision_inactivity_suggestion(
+        self,
+        user_id: UUID,
+        committed_timeline_id: UUID,
+        signals: Dict[str, Any],
+    ) -> Tuple[TimelineAdjustmentSuggestion, Dict[str, Any]]:
+        """Suggestion and event metadata for a supervision gap."""
+        suggestion = TimelineAdjustmentSuggestion(
+            user_id=user_id,
+            committed_timeline_id=committed_timeline_id,
+            reason=REASON_SUPERVISION_INACTIVITY,
+            title="Supervision gap",
+            message=(
+                "No recent supervision meeting or feedback has been logged. "
+                "Consider scheduling a meeting and logging it. Your timeline has not been changed."
+            ),
+            suggestion_payload={
+                "days_since_supervision": signals.get("days_since_supervision"),
+                "recommended_action": "Schedule a supervision meeting and log it in the system.",
+            },
+            status=STATUS_PENDING,
+        )
+        return suggestion, {
+            "reason": REASON_SUPERVISION_INACTIVITY,
+            "committed_timeline_id": str(committed_timeline_id),
+        }
+
+    def _writing_stagnation_suggestion(
+        self,
+        user_id: UUID,
+        committed_timeline_id: UUID,
+        signals: Dict[str, Any],
+    ) -> Tuple[TimelineAdjustmentSuggestion, Dict[str, Any]]:
+        """Suggestion and event metadata for prolonged writing inactivity."""
+        suggestion = TimelineAdjustmentSuggestion(
+            user_id=user_id,
+            committed_timeline_id=committed_timeline_id,
+            reason=REASON_WRITING_STAGNATION,
+            title="Prolonged writing inactivity",
+            message=(
+                "No document upload or writing-related activity has been recorded recently. "
+                "Consider uploading a draft or logging writing progress. "
+                "Your timeline has not been changed."
+            ),
+            suggestion_payload={
+                "days_since_writing": signals.get("days_since_writing"),
+                "recommended_action": (
+                    "Upload a document or log writing progress to keep your timeline aligned."
+                ),
+            },
+            status=STATUS_PENDING,
+        )
+        return suggestion, {
+            "reason": REASON_WRITING_STAGNATION,
+            "committed_timeline_id": str(committed_timeline_id),
+        }
+
+    def _save_suggestions(
+        self,
+        pending: List[Tuple[TimelineAdjustmentSuggestion, Dict[str, Any]]],
+        roles: Dict[UUID, str],
+    ) -> List[TimelineAdjustmentSuggestion]:
+        """
+        Insert suggestions with one flush and their suggestion_events with one INSERT
+        (caller commits). roles maps user_id to actor role (default researcher).
+        """
+        if not pending:
+            return []
+        self.db.add_all([suggestion for suggestion, _ in pending])
+        self.db.flush()
+        for suggestion, _ in pending:
+            self._recent_reasons.pop((suggestion.user_id, suggestion.committed_timeline_id), None)
+        events = EventBuffer(self.db)
+        for suggestion, metadata in pending:
+            events.enqueue(
+                user_id=suggestion.user_id,
+                role=roles.get(suggestion.user_id) or "researcher",
+                event_type=EventType.TIMELINE_ADJUSTMENT_SUGGESTION.value,
+                source_module="timeline_feedback",
+                entity_type="timeline_adjustment_suggestion",
+                entity_id=suggestion.id,
+                metadata=metadata,
+            )
+        events.flush()
+        return [suggestion for suggestion, _ in pending]
 
     def generate_suggestions_for_user(
         self,
@@ -90,116 +242,90 @@ class TimelineFeedbackService:
         if not timeline:
             return []
 
-        user = self.db.query(User).filter(User.id == user_id).first()
+        user = self.db.get(User, user_id)
         role = getattr(user, "role", "researcher") if user else "researcher"
-        created: List[TimelineAdjustmentSuggestion] = []
+        pending: List[Tuple[TimelineAdjustmentSuggestion, Dict[str, Any]]] = []
+
+        # Reasons already suggested within the cooldown (one query)
+        recent = self._recent_suggestion_reasons(user_id, timeline.id)
 
         # 1) Milestone delay
-        delayed = self.progress_service.get_all_delayed_milestones(timeline.id, include_completed=False)
-        if delayed and not self._has_recent_suggestion(user_id, timeline.id, REASON_MILESTONE_DELAY):
-            suggestion = TimelineAdjustmentSuggestion(
-                user_id=user_id,
-                committed_timeline_id=timeline.id,
-                reason=REASON_MILESTONE_DELAY,
-                title="Milestone delay detected",
-                message=(
-                    f"You have {len(delayed)} delayed milestone(s). "
-                    "Consider reviewing target dates or marking progress. The timeline has not been changed."
-                ),
-                suggestion_payload={
-                    "delayed_milestone_count": len(delayed),
-                    "delayed_milestone_ids": [str(m["milestone_id"]) for m in delayed[:20] if m.get("milestone_id")],
-                    "recommended_action": "Review timeline and update target dates or log completion as appropriate.",
-                },
-                status=STATUS_PENDING,
-            )
-            self.db.add(suggestion)
-            self.db.flush()
-            emit_event(
-                self.db,
-                user_id=user_id,
-                role=role,
-                event_type=EventType.TIMELINE_ADJUSTMENT_SUGGESTION.value,
-                source_module="timeline_feedback",
-                entity_type="timeline_adjustment_suggestion",
-                entity_id=suggestion.id,
-                metadata={
-                    "reason": REASON_MILESTONE_DELAY,
-                    "committed_timeline_id": str(timeline.id),
-                    "delayed_count": len(delayed),
-                },
-            )
-            created.append(suggestion)
+        delayed = self.progress_service.get_all_delayed_milestones(
+            timeline.id, include_completed=False
+        )
+        if delayed and REASON_MILESTONE_DELAY not in recent:
+            pending.append(self._milestone_delay_suggestion(
+                user_id, timeline.id, [m["milestone_id"] for m in delayed if m.get("milestone_id")],
+            ))
 
         # 2) Supervision inactivity
         signals = self.engagement_engine.get_engagement_signals(user_id)
-        if signals.get("supervision_drift") and not self._has_recent_suggestion(user_id, timeline.id, REASON_SUPERVISION_INACTIVITY):
-            suggestion = TimelineAdjustmentSuggestion(
-                user_id=user_id,
-                committed_timeline_id=timeline.id,
-                reason=REASON_SUPERVISION_INACTIVITY,
-                title="Supervision gap",
-                message=(
-                    "No recent supervision meeting or feedback has been logged. "
-                    "Consider scheduling a meeting and logging it. Your timeline has not been changed."
-                ),
-                suggestion_payload={
-                    "days_since_supervision": signals.get("days_since_supervision"),
-                    "recommended_action": "Schedule a supervision meeting and log it in the system.",
-                },
-                status=STATUS_PENDING,
-            )
-            self.db.add(suggestion)
-            self.db.flush()
-            emit_event(
-                self.db,
-                user_id=user_id,
-                role=role,
-                event_type=EventType.TIMELINE_ADJUSTMENT_SUGGESTION.value,
-                source_module="timeline_feedback",
-                entity_type="timeline_adjustment_suggestion",
-                entity_id=suggestion.id,
-                metadata={
-                    "reason": REASON_SUPERVISION_INACTIVITY,
-                    "committed_timeline_id": str(timeline.id),
-                },
-            )
-            created.append(suggestion)
+        if signals.get("supervision_drift") and REASON_SUPERVISION_INACTIVITY not in recent:
+            pending.append(self._supervision_inactivity_suggestion(user_id, timeline.id, signals))
 
         # 3) Writing stagnation
-        if signals.get("writing_inactivity") and not self._has_recent_suggestion(user_id, timeline.id, REASON_WRITING_STAGNATION):
-            suggestion = TimelineAdjustmentSuggestion(
-                user_id=user_id,
-                committed_timeline_id=timeline.id,
-                reason=REASON_WRITING_STAGNATION,
-                title="Prolonged writing inactivity",
-                message=(
-                    "No document upload or writing-related activity has been recorded recently. "
-                    "Consider uploading a draft or logging writing progress. Your timeline has not been changed."
-                ),
-                suggestion_payload={
-                    "days_since_writing": signals.get("days_since_writing"),
-                    "recommended_action": "Upload a document or log writing progress to keep your timeline aligned.",
-                },
-                status=STATUS_PENDING,
-            )
-            self.db.add(suggestion)
-            self.db.flush()
-            emit_event(
-                self.db,
-                user_id=user_id,
-                role=role,
-                event_type=EventType.TIMELINE_ADJUSTMENT_SUGGESTION.value,
-                source_module="timeline_feedback",
-                entity_type="timeline_adjustment_suggestion",
-                entity_id=suggestion.id,
-                metadata={
-                    "reason": REASON_WRITING_STAGNATION,
-                    "committed_timeline_id": str(timeline.id),
-                },
-            )
-            created.append(suggestion)
+        if signals.get("writing_inactivity") and REASON_WRITING_STAGNATION not in recent:
+            pending.append(self._writing_stagnation_suggestion(user_id, timeline.id, signals))
+
+        return self._save_suggestions(pending, {user_id: role})
+
+    def generate_suggestions_for_users(
+        self,
+        user_ids: List[UUID],
+    ) -> Dict[UUID, List[TimelineAdjustmentSuggestion]]:
+        """
+        Batch variant of generate_suggestions_for_user (each user's latest committed
+        timeline) for periodic jobs. Timelines, roles, delayed milestones, engagement
+        signals and recent suggestions are each read with one query for all users;
+        suggestions and their events are written with one flush and one event INSERT.
+        Caller commits. Users without a committed timeline are absent from the result.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return {}
+
+        # Latest committed timeline per user (same ordering as the single-user path)
+        timeline_by_user: Dict[UUID, UUID] = dict(
+            self.db.query(CommittedTimeline.user_id, CommittedTimeline.id)
+            .filter(CommittedTimeline.user_id.in_(user_ids))
+            .order_by(CommittedTimeline.user_id, CommittedTimeline.committed_date.desc())
+            .distinct(CommittedTimeline.user_id)
+        )
+        if not timeline_by_user:
+            return {}
+
+        roles: Dict[UUID, str] = dict(
+            self.db.query(User.id, User.role).filter(User.id.in_(list(timeline_by_user)))
+        )
+        delayed_by_timeline = self.progress_service.get_overdue_milestone_ids_by_timeline(
+            list(timeline_by_user.values())
+        )
+        signals_by_user = self.engagement_engine.get_engagement_signals_bulk(list(timeline_by_user))
+        recent_by_timeline: Dict[UUID, Set[str]] = {}
+        for timeline_id, reason in self._recent_suggestion_pairs(
+            list(timeline_by_user), list(timeline_by_user.values())
+        ):
+            recent_by_timeline.setdefault(timeline_id, set()).add(reason)
+
+        pending: List[Tuple[TimelineAdjustmentSuggestion, Dict[str, Any]]] = []
+        for user_id, timeline_id in timeline_by_user.items():
+            recent = recent_by_timeline.get(timeline_id, set())
+            delayed_ids = delayed_by_timeline.get(timeline_id)
+            if delayed_ids and REASON_MILESTONE_DELAY not in recent:
+                pending.append(self._milestone_delay_suggestion(user_id, timeline_id, delayed_ids))
+            signals = signals_by_user[user_id]
+            if signals.get("supervision_drift") and REASON_SUPERVISION_INACTIVITY not in recent:
+                pending.append(
+                    self._supervision_inactivity_suggestion(user_id, timeline_id, signals)
+                )
+            if signals.get("writing_inactivity") and REASON_WRITING_STAGNATION not in recent:
+                pending.append(self._writing_stagnation_suggestion(user_id, timeline_id, signals))
 
+        created: Dict[UUID, List[TimelineAdjustmentSuggestion]] = {
+            uid: [] for uid in timeline_by_user
+        }
+        for suggestion in self._save_suggestions(pending, roles):
+            created[suggestion.user_id].append(suggestion)
         return created
 
     def accept_suggestion(
@@ -211,14 +337,13 @@ class TimelineFeedbackService:
         Mark suggestion as accepted. Does not auto-modify milestones; timeline remains user-controlled.
         Logs acceptance_event.
         """
-        suggestion = self.db.query(TimelineAdjustmentSuggestion).filter(
-            TimelineAdjustmentSuggestion.id == suggestion_id,
-            TimelineAdjustmentSuggestion.user_id == user_id,
-            TimelineAdjustmentSuggestion.status == STATUS_PENDING,
-        ).first()
+        suggestion = self.db.execute(
+            _PENDING_SUGGESTION_FOR_USER,
+            {"suggestion_id": suggestion_id, "user_id": user_id},
+        ).scalar_one_or_none()
         if not suggestion:
             return None
-        user = self.db.query(User).filter(User.id == user_id).first()
+        user = self.db.get(User, user_id)
         role = getattr(user, "role", "researcher") if user else "researcher"
         suggestion.status = STATUS_ACCEPTED
         suggestion.responded_at = _utcnow()
@@ -248,14 +373,13 @@ class TimelineFeedbackService:
         user_id: UUID,
     ) -> Optional[TimelineAdjustmentSuggestion]:
         """Mark suggestion as rejected. Logs rejection_event."""
-        suggestion = self.db.query(TimelineAdjustmentSuggestion).filter(
-            TimelineAdjustmentSuggestion.id == suggestion_id,
-            TimelineAdjustmentSuggestion.user_id == user_id,
-            TimelineAdjustmentSuggestion.status == STATUS_PENDING,
-        ).first()
+        suggestion = self.db.execute(
+            _PENDING_SUGGESTION_FOR_USER,
+            {"suggestion_id": suggestion_id, "user_id": user_id},
+        ).scalar_one_or_none()
         if not suggestion:
             return None
-        user = self.db.query(User).filter(User.id == user_id).first()
+        user = self.db.get(User, user_id)
         role = getattr(user, "role", "researcher") if user else "researcher"
         suggestion.status = STATUS_REJECTED
         suggestion.responded_at = _utcnow()
@@ -5,6 +5,7 @@ Uses Claude via the Anthropic API for intelligent extraction.
 """
 import hashlib
 import logging
+import threading
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 from enum import Enum
@@ -144,6 +145,10 @@ class TimelineIntelligenceEngine:
     - Feedback Engine applies learned corrections to duration estimates
     """
 
+    # Maximum entries per result cache; oldest entries are evicted first so a long-lived
+    # (shared) engine does not grow without bound
+    RESULT_CACHE_MAX_ENTRIES = 256
+
     def __init__(self, db: Optional[Any] = None, apply_feedback_adjustments: bool = True):
         """
         Initialize the timeline intelligence engine with LLM client.
@@ -161,6 +166,7 @@ class TimelineIntelligenceEngine:
         # Cache for LLM results to avoid duplicate calls
         self._stages_milestones_cache: Dict[str, Tuple[List[DetectedStage], List[ExtractedMilestone]]] = {}
         self._durations_dependencies_cache: Dict[str, Tuple[List[DurationEstimate], List[Dependency]]] = {}
+        self._cache_lock = threading.Lock()
 
         # Try to initialize LLM client
         try:
@@ -181,6 +187,13 @@ class TimelineIntelligenceEngine:
                 logger.warning(f"Feedback engine initialization failed: {e}")
                 self._feedback_engine = None
 
+    def _cache_put(self, cache: Dict[str, Any], key: str, value: Any) -> None:
+        """Store a result, evicting the oldest entry once RESULT_CACHE_MAX_ENTRIES is reached."""
+        with self._cache_lock:
+            if key not in cache and len(cache) >= self.RESULT_CACHE_MAX_ENTRIES:
+                del cache[next(iter(cache))]
+            cache[key] = value
+
     def _get_cache_key(self, text: str, section_map: Optional[Dict] = None) -> str:
         """Generate a cache key from text and section_map."""
         content = text + str(section_map or {})
@@ -207,8 +220,9 @@ class TimelineIntelligenceEngine:
         cache_key = self._get_cache_key(text, section_map)
 
         # Check cache first
-        if cache_key in self._stages_milestones_cache:
-            stages, _ = self._stages_milestones_cache[cache_key]
+        cached = self._stages_milestones_cache.get(cache_key)
+        if cached is not None:
+            stages, _ = cached
             logger.debug("Returning cached stages")
             return stages
 
@@ -216,14 +230,14 @@ class TimelineIntelligenceEngine:
         if self._llm_available and self._llm_client:
             try:
                 stages, milestones = self._extract_stages_and_milestones_llm(text, section_map)
-                self._stages_milestones_cache[cache_key] = (stages, milestones)
+                self._cache_put(self._stages_milestones_cache, cache_key, (stages, milestones))
                 return stages
             except Exception as e:
                 logger.error(f"LLM extraction failed, using fallback: {e}")
 
         # Fallback to generic PhD stages
         stages, milestones = self._get_fallback_stages_and_milestones()
-        self._stages_milestones_cache[cache_key] = (stages, milestones)
+        self._cache_put(self._stages_milestones_cache, cache_key, (stages, milestones))
         return stages
 
     def extract_milestones(
@@ -327,7 +341,7 @@ class TimelineIntelligenceEngine:
             except Exception as e:
                 logger.warning(f"Failed to apply feedback adjustments: {e}")
 
-        self._durations_dependencies_cache[cache_key] = (durations, dependencies)
+        self._cache_put(self._durations_dependencies_cache, cache_key, (durations, dependencies))
         return durations
 
     def map_dependencies(
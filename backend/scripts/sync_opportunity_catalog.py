@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Sync the static opportunities catalog into the opportunities_catalog table.
+
+Intended to run nightly (e.g. from cron) so feed generation never has to
+create catalog rows on the request path.
+
+Usage:
+    python backend/scripts/sync_opportunity_catalog.py
+
+Requires DATABASE_URL to point at the PostgreSQL database.
+"""
+import sys
+import os
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.database import SessionLocal
+from app.orchestrators.opportunity_feed_orchestrator import OpportunityFeedOrchestrator
+
+
+def main() -> int:
+    db = SessionLocal()
+    try:
+        synced = OpportunityFeedOrchestrator.sync_catalog(db)
+    finally:
+        db.close()
+    print(f"Synced {synced} opportunity catalog entries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Tests for EngagementEngine signals read from the activity summary."""
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.event_taxonomy import EventType
+from app.models.longitudinal_event import LongitudinalEvent
+from app.models.user_last_activity import UserLastActivity
+from app.models.user_week_event_count import UserWeekEventCount
+from app.services.engagement_engine import DAYS_ANY_ACTIVITY, EngagementEngine
+from app.services.event_store import EventStore
+
+
+# PostgreSQL-only column types (UUID); skipped unless DATABASE_URL points at PostgreSQL
+TEST_DATABASE_URL = os.environ.get("DATABASE_URL", "")
+requires_postgres = pytest.mark.skipif(
+    not TEST_DATABASE_URL.startswith("postgresql"),
+    reason="PostgreSQL DATABASE_URL required",
+)
+EVENT_TABLES = [
+    LongitudinalEvent.__table__,
+    UserLastActivity.__table__,
+    UserWeekEventCount.__table__,
+]
+
+
+@pytest.fixture
+def engine():
+    """Engine with the event log and its rollup tables."""
+    engine = create_engine(TEST_DATABASE_URL)
+    LongitudinalEvent.metadata.create_all(bind=engine, tables=EVENT_TABLES)
+    try:
+        yield engine
+    finally:
+        LongitudinalEvent.metadata.drop_all(bind=engine, tables=EVENT_TABLES)
+        engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    """Create test database session."""
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@requires_postgres
+def test_signals_reflect_activity_committed_by_another_session(engine, db):
+    """Signals are read from the summary on every call, so other writers are seen at once."""
+    user_id = uuid.uuid4()
+    engagement = EngagementEngine(db)
+    assert engagement.get_engagement_signals(user_id)["low_engagement"] is True
+    db.commit()
+
+    other = sessionmaker(bind=engine)()
+    try:
+        EventStore(other).emit(
+            user_id, "researcher", EventType.DOCUMENT_UPLOADED.value, "tests",
+            timestamp=datetime.now(timezone.utc) - timedelta(days=1),
+        )
+        other.commit()
+    finally:
+        other.close()
+
+    signals = engagement.get_engagement_signals(user_id)
+    assert signals["low_engagement"] is False
+    assert signals["writing_inactivity"] is False
+    assert signals["supervision_drift"] is True
+    assert signals["days_since_any"] == 1
+
+
+@requires_postgres
+def test_bulk_signals_match_single_user_signals(db):
+    """get_engagement_signals_bulk applies the same rules, including users without events."""
+    now = datetime.now(timezone.utc)
+    active, stale, unseen = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    store = EventStore(db)
+    store.emit(active, "researcher", EventType.SUPERVISION_LOGGED.value, "tests",
+               timestamp=now - timedelta(days=2))
+    store.emit(stale, "researcher", EventType.MILESTONE_UPDATED.value, "tests",
+               timestamp=now - timedelta(days=DAYS_ANY_ACTIVITY + 1))
+    db.commit()
+
+    engagement = EngagementEngine(db)
+    bulk = engagement.get_engagement_signals_bulk([active, stale, unseen])
+
+    assert set(bulk) == {active, stale, unseen}
+    for uid in (active, stale, unseen):
+        assert bulk[uid] == engagement.get_engagement_signals(uid)
+    assert bulk[active]["low_engagement"] is False
+    assert bulk[stale]["low_engagement"] is True
+    assert bulk[unseen]["days_since_any"] is None
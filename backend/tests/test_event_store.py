@@ -0,0 +1,152 @@
+"""Tests for event store rollups."""
+import os
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.event_taxonomy import EventType
+from app.models.longitudinal_event import LongitudinalEvent
+from app.models.user_last_activity import UserLastActivity
+from app.models.user_week_event_count import UserWeekEventCount
+from app.services.event_store import EventBuffer, EventStore
+
+
+# Rollup upserts are PostgreSQL-only (ON CONFLICT, GREATEST, UUID columns)
+PG_DATABASE_URL = os.environ.get("DATABASE_URL", "")
+requires_postgres = pytest.mark.skipif(
+    not PG_DATABASE_URL.startswith("postgresql"),
+    reason="PostgreSQL DATABASE_URL required",
+)
+ROLLUP_TABLES = [
+    LongitudinalEvent.__table__,
+    UserLastActivity.__table__,
+    UserWeekEventCount.__table__,
+]
+
+# A Wednesday, so +/- a day stays in the same Monday-based week
+WEDNESDAY = datetime(2024, 5, 15, 12, 0, tzinfo=timezone.utc)
+MONDAY = date(2024, 5, 13)
+
+
+@pytest.fixture
+def pg_db():
+    """PostgreSQL session with the event log and its rollup tables."""
+    pg_engine = create_engine(PG_DATABASE_URL)
+    LongitudinalEvent.metadata.create_all(bind=pg_engine, tables=ROLLUP_TABLES)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=pg_engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        LongitudinalEvent.metadata.drop_all(bind=pg_engine, tables=ROLLUP_TABLES)
+        pg_engine.dispose()
+
+
+def _event(user_id, event_type, timestamp):
+    return {
+        "user_id": user_id,
+        "role": "researcher",
+        "event_type": event_type,
+        "source_module": "tests",
+        "timestamp": timestamp,
+    }
+
+
+def _week_counts(db, user_id):
+    rows = db.query(UserWeekEventCount.week_start, UserWeekEventCount.event_count).filter(
+        UserWeekEventCount.user_id == user_id,
+    )
+    return dict(rows)
+
+
+@requires_postgres
+def test_emit_increments_week_rows(pg_db):
+    """Each emit adds one to the event's week row; other weeks get their own row."""
+    user_id = uuid.uuid4()
+    store = EventStore(pg_db)
+    store.emit(user_id, "researcher", EventType.MILESTONE_UPDATED.value, "tests",
+               timestamp=WEDNESDAY)
+    store.emit(user_id, "researcher", EventType.MILESTONE_UPDATED.value, "tests",
+               timestamp=WEDNESDAY + timedelta(days=1))
+    store.emit(user_id, "researcher", EventType.MILESTONE_UPDATED.value, "tests",
+               timestamp=WEDNESDAY + timedelta(days=7))
+    pg_db.commit()
+
+    assert _week_counts(pg_db, user_id) == {MONDAY: 2, MONDAY + timedelta(days=7): 1}
+
+
+@requires_postgres
+def test_emit_many_folds_same_week_events_into_one_row(pg_db):
+    """Several events in one batch for the same week add up, on top of existing counts."""
+    user_id, other_id = uuid.uuid4(), uuid.uuid4()
+    store = EventStore(pg_db)
+    store.emit(user_id, "researcher", EventType.MILESTONE_UPDATED.value, "tests",
+               timestamp=WEDNESDAY)
+    store.emit_many([
+        _event(user_id, EventType.MILESTONE_UPDATED.value, WEDNESDAY - timedelta(days=2)),
+        _event(user_id, EventType.DOCUMENT_UPLOADED.value, WEDNESDAY),
+        _event(user_id, EventType.SUPERVISION_LOGGED.value, WEDNESDAY + timedelta(days=4)),
+        _event(user_id, EventType.MILESTONE_UPDATED.value, WEDNESDAY - timedelta(days=7)),
+        _event(other_id, EventType.MILESTONE_UPDATED.value, WEDNESDAY),
+    ])
+    pg_db.commit()
+
+    assert _week_counts(pg_db, user_id) == {MONDAY: 4, MONDAY - timedelta(days=7): 1}
+    assert _week_counts(pg_db, other_id) == {MONDAY: 1}
+
+
+@requires_postgres
+def test_older_events_never_move_last_activity_backwards(pg_db):
+    """last_any/last_writing/last_supervision only advance; older events leave them as is."""
+    user_id = uuid.uuid4()
+    store = EventStore(pg_db)
+    store.emit(user_id, "researcher", EventType.DOCUMENT_UPLOADED.value, "tests",
+               timestamp=WEDNESDAY)
+    store.emit(user_id, "researcher", EventType.SUPERVISION_LOGGED.value, "tests",
+               timestamp=WEDNESDAY - timedelta(days=1))
+    # Older events of every kind, singly and in a batch
+    store.emit(user_id, "researcher", EventType.DOCUMENT_UPLOADED.value, "tests",
+               timestamp=WEDNESDAY - timedelta(days=30))
+    store.emit_many([
+        _event(user_id, EventType.SUPERVISION_LOGGED.value, WEDNESDAY - timedelta(days=10)),
+        _event(user_id, EventType.MILESTONE_UPDATED.value, WEDNESDAY - timedelta(days=5)),
+    ])
+    pg_db.commit()
+
+    summary = pg_db.get(UserLastActivity, user_id)
+    assert summary.last_any == WEDNESDAY
+    assert summary.last_writing == WEDNESDAY
+    assert summary.last_supervision == WEDNESDAY - timedelta(days=1)
+
+    # A newer non-writing event advances last_any only
+    store.emit(user_id, "researcher", EventType.MILESTONE_UPDATED.value, "tests",
+               timestamp=WEDNESDAY + timedelta(days=1))
+    pg_db.commit()
+    pg_db.refresh(summary)
+    assert summary.last_any == WEDNESDAY + timedelta(days=1)
+    assert summary.last_writing == WEDNESDAY
+    assert summary.last_supervision == WEDNESDAY - timedelta(days=1)
+
+
+@requires_postgres
+def test_event_buffer_flush_updates_rollups(pg_db):
+    """EventBuffer.flush goes through emit_many, so the rollups see its events."""
+    user_id = uuid.uuid4()
+    buffer = EventBuffer(pg_db)
+    buffer.enqueue(user_id, "researcher", EventType.DOCUMENT_UPLOADED.value, "tests",
+                   timestamp=WEDNESDAY)
+    buffer.enqueue(user_id, "researcher", EventType.MILESTONE_UPDATED.value, "tests",
+                   timestamp=WEDNESDAY + timedelta(days=1))
+    assert pg_db.get(UserLastActivity, user_id) is None
+
+    assert len(buffer.flush()) == 2
+    pg_db.commit()
+
+    assert _week_counts(pg_db, user_id) == {MONDAY: 2}
+    summary = pg_db.get(UserLastActivity, user_id)
+    assert summary.last_any == WEDNESDAY + timedelta(days=1)
+    assert summary.last_writing == WEDNESDAY
+    assert summary.last_supervision is None
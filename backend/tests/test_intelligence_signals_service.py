@@ -0,0 +1,251 @@
+"""Tests for IntelligenceSignalsService against seeded longitudinal events."""
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.event_taxonomy import EventType
+from app.models.longitudinal_event import LongitudinalEvent
+from app.models.user_last_activity import UserLastActivity
+from app.models.user_week_event_count import UserWeekEventCount
+from app.services.event_store import EventStore, utc_weeks_spanned
+from app.services.institutional_analytics_service import _continuity_by_user
+from app.services.intelligence_signals_service import (
+    EVIDENCE_EVENT_ID_LIMIT,
+    IntelligenceSignalsService,
+)
+
+
+# Counts, rollups and evidence queries are PostgreSQL-only (FILTER, ON CONFLICT, UUID)
+TEST_DATABASE_URL = os.environ.get("DATABASE_URL", "")
+requires_postgres = pytest.mark.skipif(
+    not TEST_DATABASE_URL.startswith("postgresql"),
+    reason="PostgreSQL DATABASE_URL required",
+)
+EVENT_TABLES = [
+    LongitudinalEvent.__table__,
+    UserLastActivity.__table__,
+    UserWeekEventCount.__table__,
+]
+
+# Fixed "now": a Wednesday. The default 90-day window then starts on a Thursday
+# (2024-02-15) and overlaps 14 UTC calendar weeks (Mondays 2024-02-12 .. 2024-05-13).
+NOW = datetime(2024, 5, 15, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db():
+    """PostgreSQL session with the event log and its rollup tables."""
+    engine = create_engine(TEST_DATABASE_URL)
+    LongitudinalEvent.metadata.create_all(bind=engine, tables=EVENT_TABLES)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        LongitudinalEvent.metadata.drop_all(bind=engine, tables=EVENT_TABLES)
+        engine.dispose()
+
+
+def _seed(db, user_id, event_type, timestamps):
+    """Emit one event per timestamp; returns their event_ids as strings, in order."""
+    event_ids = EventStore(db).emit_many([
+        {
+            "user_id": user_id,
+            "role": "researcher",
+            "event_type": event_type,
+            "source_module": "tests",
+            "timestamp": ts,
+        }
+        for ts in timestamps
+    ])
+    db.commit()
+    return [str(event_id) for event_id in event_ids]
+
+
+def _service(db, now=NOW):
+    service = IntelligenceSignalsService(db)
+    service._now = now
+    return service
+
+
+@requires_postgres
+def test_continuity_counts_calendar_weeks_overlapping_window(db):
+    """Every calendar week of a 90-day window active: 14 of 14 weeks, not 14 of 12."""
+    user_id = uuid.uuid4()
+    window_start = NOW - timedelta(days=90)
+    # One event per week from the window's first day (weeks of 02-12 .. 05-06), plus now
+    _seed(db, user_id, EventType.MILESTONE_UPDATED.value,
+          [window_start + timedelta(days=7 * k) for k in range(13)] + [NOW])
+
+    signal = _service(db).continuity_index(user_id)
+
+    assert signal.value == 1.0
+    assert "Activity on 14 of the last 14 weeks (14 events total)" in (
+        signal.explanation_payload.explanation
+    )
+
+
+@requires_postgres
+def test_continuity_partial_weeks(db):
+    """Active weeks are divided by the weeks the window spans."""
+    user_id = uuid.uuid4()
+    _seed(db, user_id, EventType.MILESTONE_UPDATED.value,
+          [NOW - timedelta(days=7 * k) for k in range(7)])
+
+    signal = _service(db).continuity_index(user_id)
+
+    assert signal.value == round(7 / 14, 4)
+    assert "Activity on 7 of the last 14 weeks" in signal.explanation_payload.explanation
+
+
+@requires_postgres
+def test_cohort_continuity_matches_signal(db):
+    """Cohort continuity uses the same week definition as the per-user signal."""
+    now = datetime.now(timezone.utc)
+    regular, sparse, lapsed = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    _seed(db, regular, EventType.MILESTONE_UPDATED.value,
+          [now - timedelta(days=7 * k) for k in range(13)])
+    _seed(db, sparse, EventType.DOCUMENT_UPLOADED.value,
+          [now - timedelta(days=3), now - timedelta(days=60)])
+    _seed(db, lapsed, EventType.MILESTONE_UPDATED.value, [now - timedelta(days=200)])
+
+    cohort = _continuity_by_user(db, select(UserLastActivity.user_id), 90)
+
+    assert set(cohort) == {regular, sparse}
+    service = IntelligenceSignalsService(db)
+    for user_id in (regular, sparse):
+        assert cohort[user_id] == pytest.approx(
+            service.continuity_index(user_id).value, abs=1e-4
+        )
+    assert service.continuity_index(lapsed).value == 0.0
+
+
+def _by_type(signals):
+    return {signal["signal_type"]: signal for signal in signals}
+
+
+@requires_postgres
+def test_get_all_signals_counts_and_evidence(db):
+    """Each signal counts and cites exactly the events in its own window and type filter."""
+    now = datetime.now(timezone.utc)
+    user_id, other_id = uuid.uuid4(), uuid.uuid4()
+    seeded = [
+        (EventType.SUPERVISION_FEEDBACK_RECEIVED.value, now - timedelta(days=60)),
+        (EventType.SUPERVISION_LOGGED.value, now - timedelta(days=30)),
+        (EventType.DOCUMENT_UPLOADED.value, now - timedelta(days=20)),
+        (EventType.MILESTONE_UPDATED.value, now - timedelta(days=10)),
+        (EventType.QUESTIONNAIRE_COMPLETED.value, now - timedelta(days=5)),
+        (EventType.MILESTONE_UPDATED.value, now - timedelta(days=1)),
+    ]
+    ids = [_seed(db, user_id, event_type, [ts])[0] for event_type, ts in seeded]
+    # Outside the 90-day window, and another user's events: never counted
+    _seed(db, user_id, EventType.MILESTONE_UPDATED.value, [now - timedelta(days=120)])
+    _seed(db, other_id, EventType.SUPERVISION_LOGGED.value, [now - timedelta(days=2)])
+
+    service = IntelligenceSignalsService(db)
+    signals = _by_type(service.get_all_signals(user_id))
+
+    assert set(signals) == {
+        "continuity_index",
+        "dropout_risk_signal",
+        "supervisor_engagement_alert",
+        "opportunity_match_score",
+    }
+    for signal_type in ("continuity_index", "dropout_risk_signal"):
+        evidence = signals[signal_type]["evidence"]
+        assert evidence["contributing_event_ids"] == ids
+        assert evidence["total_event_count"] == 6
+        assert evidence["truncated"] is False
+
+    supervision = signals["supervisor_engagement_alert"]
+    assert supervision["value"] == {"alert": False, "supervision_event_count": 1}
+    assert supervision["evidence"]["contributing_event_ids"] == [ids[1]]
+
+    opportunity = signals["opportunity_match_score"]
+    assert opportunity["value"]["context_events_in_window"] == 3
+    assert opportunity["evidence"]["contributing_event_ids"] == [ids[2], ids[3], ids[5]]
+
+    # Batched continuity agrees with the standalone signal, denominator included
+    window = signals["continuity_index"]["evidence"]["time_window"]
+    weeks = utc_weeks_spanned(
+        datetime.fromisoformat(window["start"]), datetime.fromisoformat(window["end"])
+    )
+    assert f"of the last {weeks} weeks (6 events total)" in (
+        signals["continuity_index"]["explanation"]
+    )
+    assert signals["continuity_index"]["value"] == service.continuity_index(user_id).value
+
+
+@requires_postgres
+def test_evidence_truncated_at_limit(db):
+    """Evidence keeps the most recent EVIDENCE_EVENT_ID_LIMIT ids, oldest first."""
+    now = datetime.now(timezone.utc)
+    user_id = uuid.uuid4()
+    total = EVIDENCE_EVENT_ID_LIMIT + 5
+    ids = _seed(db, user_id, EventType.MILESTONE_UPDATED.value,
+                [now - timedelta(hours=total - i) for i in range(total)])
+
+    signals = _by_type(IntelligenceSignalsService(db).get_all_signals(user_id))
+
+    for signal_type in ("continuity_index", "dropout_risk_signal", "opportunity_match_score"):
+        evidence = signals[signal_type]["evidence"]
+        assert evidence["contributing_event_ids"] == ids[-EVIDENCE_EVENT_ID_LIMIT:]
+        assert evidence["total_event_count"] == total
+        assert evidence["truncated"] is True
+    supervision = signals["supervisor_engagement_alert"]["evidence"]
+    assert supervision["contributing_event_ids"] == []
+    assert supervision["truncated"] is False
+
+
+@requires_postgres
+def test_continuity_without_recent_activity_skips_event_queries(db):
+    """Users with no activity since the window's first week are answered from the summary."""
+    user_id, unseen = uuid.uuid4(), uuid.uuid4()
+    _seed(db, user_id, EventType.MILESTONE_UPDATED.value, [NOW - timedelta(days=200)])
+    service = _service(db)
+
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        signals = [service.continuity_index(uid) for uid in (user_id, unseen)]
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert statements
+    assert not any("longitudinal_events" in s or "user_week_event_counts" in s
+                   for s in statements)
+    for signal in signals:
+        assert signal.value == 0.0
+        assert signal.explanation_payload.evidence.contributing_event_ids == []
+
+
+@requires_postgres
+def test_get_all_signals_on_database_errors(db, monkeypatch):
+    """A failed event fetch yields no signals; a failed signal is skipped on its own."""
+    user_id = uuid.uuid4()
+    _seed(db, user_id, EventType.MILESTONE_UPDATED.value, [datetime.now(timezone.utc)])
+    error = OperationalError("SELECT 1", {}, Exception("connection lost"))
+
+    def _raise(*args, **kwargs):
+        raise error
+
+    service = IntelligenceSignalsService(db)
+    monkeypatch.setattr(service.engagement, "get_engagement_signals", _raise)
+    assert set(_by_type(service.get_all_signals(user_id))) == {
+        "continuity_index",
+        "supervisor_engagement_alert",
+        "opportunity_match_score",
+    }
+
+    monkeypatch.setattr(service, "_signal_counts", _raise)
+    assert service.get_all_signals(user_id) == []
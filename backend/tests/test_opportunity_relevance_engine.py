@@ -104,6 +104,22 @@ class TestDisciplineScoring:
         assert score.discipline_score == 85.0
         assert ReasonTag.BROAD_DISCIPLINE_MATCH in score.reason_tags
     
+    def test_broad_category_match(self, engine, cs_early_stage_user):
+        """Test broad taxonomy category match (case-insensitive) scores 70."""
+        opportunity = Opportunity(
+            opportunity_id="opp_2b",
+            title="Informatics Fellowship",
+            opportunity_type=OpportunityType.FELLOWSHIP,
+            disciplines=["informatics"],
+            eligible_stages=[ResearchStage.EARLY],
+            deadline=date.today() + timedelta(days=60)
+        )
+        
+        score = engine.score_opportunity(opportunity, cs_early_stage_user)
+        
+        assert score.discipline_score == 70.0
+        assert ReasonTag.BROAD_DISCIPLINE_MATCH in score.reason_tags
+    
     def test_keyword_overlap(self, engine, cs_early_stage_user):
         """Test keyword overlap scoring."""
         opportunity = Opportunity(
@@ -373,6 +389,26 @@ class TestDeadlineScoring:
         
         assert score.deadline_score == 70.0
         assert ReasonTag.DEADLINE_TOO_FAR in score.reason_tags
+    
+    def test_deadline_bucket_boundaries(self, engine):
+        """Test deadline scores on both sides of every bucket boundary."""
+        today = date(2026, 1, 1)
+        expected = {
+            OpportunityType.GRANT: [
+                (-1, 0.0), (0, 40.0), (6, 40.0), (7, 65.0), (13, 65.0), (14, 80.0), (29, 80.0),
+                (30, 100.0), (90, 100.0), (91, 90.0), (180, 90.0), (181, 70.0),
+            ],
+            OpportunityType.CONFERENCE: [
+                (-1, 0.0), (0, 40.0), (6, 40.0), (7, 65.0), (13, 65.0), (14, 100.0),
+                (60, 100.0), (61, 85.0), (120, 85.0), (121, 75.0),
+            ],
+        }
+        for opportunity_type, cases in expected.items():
+            for days, deadline_score in cases:
+                score, _tags = engine._score_deadline(
+                    today + timedelta(days=days), today, opportunity_type
+                )
+                assert score == deadline_score, (opportunity_type, days)
 
 
 class TestOverallScoring:
@@ -515,6 +551,61 @@ class TestRanking:
         # Should filter out low-relevance opportunity
         assert len(ranked) == 1
         assert ranked[0].opportunity_id == "opp_24"
+    
+    def test_rank_with_min_score_matches_full_scoring(
+        self, engine, cs_early_stage_user, timeline_data_collection
+    ):
+        """Test early exit under min_score keeps exactly the opportunities full scoring keeps."""
+        opportunities = [
+            Opportunity(
+                opportunity_id=f"opp_min_{days}_{discipline}",
+                title="Candidate",
+                opportunity_type=OpportunityType.GRANT,
+                disciplines=[discipline],
+                eligible_stages=[ResearchStage.MID],
+                deadline=date.today() + timedelta(days=days),
+                keywords=["data collection"]
+            )
+            for days in (-5, 3, 45, 400)
+            for discipline in ("Computer Science", "History")
+        ]
+        
+        for min_score in (0.0, 40.0, 60.0, 80.0):
+            ranked = engine.rank_opportunities(
+                opportunities,
+                cs_early_stage_user,
+                timeline_context=timeline_data_collection,
+                min_score=min_score
+            )
+            expected = [
+                engine.score_opportunity(opp, cs_early_stage_user, timeline_data_collection)
+                for opp in opportunities
+            ]
+            expected = [s for s in expected if s.overall_score >= min_score]
+            assert sorted(s.opportunity_id for s in ranked) == sorted(
+                s.opportunity_id for s in expected
+            )
+    
+    def test_rank_top_k_matches_full_ranking_prefix(self, engine, cs_early_stage_user):
+        """Test top_k returns the same prefix (including tie order) as the full ranking."""
+        opportunities = [
+            Opportunity(
+                opportunity_id=f"opp_top_{i}",
+                title="Candidate",
+                opportunity_type=OpportunityType.CONFERENCE,
+                disciplines=[discipline],
+                eligible_stages=[ResearchStage.EARLY],
+                deadline=date.today() + timedelta(days=days)
+            )
+            for i, (discipline, days) in enumerate(
+                (d, n) for d in ("Computer Science", "History", "AI") for n in (3, 30, 30, 200)
+            )
+        ]
+        
+        full = engine.rank_opportunities(opportunities, cs_early_stage_user)
+        for top_k in (0, 1, 5, len(opportunities) + 1):
+            ranked = engine.rank_opportunities(opportunities, cs_early_stage_user, top_k=top_k)
+            assert [s.opportunity_id for s in ranked] == [s.opportunity_id for s in full[:top_k]]
 
 
 class TestReasonTags:
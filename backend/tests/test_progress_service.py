@@ -194,6 +194,27 @@ def test_log_progress_event(db, test_user):
     assert event_id is not None
 
 
+@pytest.mark.parametrize(
+    "delay_days,is_critical,expected",
+    [
+        (-3, True, "low"),
+        (0, True, "low"),
+        (1, True, "medium"),
+        (7, True, "medium"),
+        (8, True, "high"),
+        (0, False, "low"),
+        (7, False, "low"),
+        (8, False, "medium"),
+        (30, False, "medium"),
+        (31, False, "high"),
+    ],
+)
+def test_determine_impact_level(delay_days, is_critical, expected):
+    """Impact level boundaries for critical and non-critical milestones."""
+    service = ProgressService(db=None)
+    assert service._determine_impact_level(delay_days, is_critical) == expected
+
+
 def test_calculate_milestone_delay_overdue(db, test_user, test_timeline):
     """Test calculating delay for overdue milestone."""
     service = ProgressService(db)
@@ -309,6 +330,21 @@ def test_get_timeline_progress(db, test_user, test_timeline):
     assert progress["completion_percentage"] > 0
 
 
+def test_get_timeline_progress_reflects_completion(db, test_user, test_timeline):
+    """Cached timeline progress is recomputed after a milestone is completed."""
+    service = ProgressService(db)
+    timeline = test_timeline["timeline"]
+    
+    before = service.get_timeline_progress(timeline.id)
+    assert service.get_timeline_progress(timeline.id) == before
+    
+    pending = next(m for m in test_timeline["milestones"] if not m.is_completed)
+    service.mark_milestone_completed(pending.id, test_user.id)
+    
+    after = service.get_timeline_progress(timeline.id)
+    assert after["completed_milestones"] == before["completed_milestones"] + 1
+
+
 def test_get_timeline_progress_critical_milestones(db, test_user, test_timeline):
     """Test critical milestone tracking in timeline progress."""
     service = ProgressService(db)
@@ -0,0 +1,161 @@
+"""Tests for TimelineFeedbackService suggestion generation."""
+import os
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.baseline import Baseline
+from app.models.committed_timeline import CommittedTimeline
+from app.models.timeline_adjustment_suggestion import (
+    REASON_MILESTONE_DELAY,
+    REASON_SUPERVISION_INACTIVITY,
+    REASON_WRITING_STAGNATION,
+    TimelineAdjustmentSuggestion,
+)
+from app.models.timeline_milestone import TimelineMilestone
+from app.models.timeline_stage import TimelineStage
+from app.models.user import User
+from app.services.timeline_feedback_service import TimelineFeedbackService
+
+
+# The batch path uses DISTINCT ON and the models use PostgreSQL UUID/JSONB columns
+TEST_DATABASE_URL = os.environ.get("DATABASE_URL", "")
+requires_postgres = pytest.mark.skipif(
+    not TEST_DATABASE_URL.startswith("postgresql"),
+    reason="PostgreSQL DATABASE_URL required",
+)
+
+
+@pytest.fixture
+def db():
+    """PostgreSQL session with the full schema."""
+    engine = create_engine(TEST_DATABASE_URL)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+def _user(db):
+    user = User(
+        email=f"{uuid.uuid4()}@example.com",
+        hashed_password="hashed",
+        full_name="Test User",
+        is_active=True,
+    )
+    db.add(user)
+    db.flush()
+    return user
+
+
+def _timeline(db, user, committed_days_ago, overdue_days=()):
+    """Committed timeline with one incomplete milestone per entry in overdue_days."""
+    today = date.today()
+    baseline = Baseline(
+        user_id=user.id,
+        program_name="PhD",
+        institution="Test University",
+        field_of_study="Computer Science",
+        start_date=today - timedelta(days=365),
+    )
+    db.add(baseline)
+    db.flush()
+    timeline = CommittedTimeline(
+        user_id=user.id,
+        baseline_id=baseline.id,
+        title="Timeline",
+        committed_date=today - timedelta(days=committed_days_ago),
+        target_completion_date=today + timedelta(days=365),
+    )
+    db.add(timeline)
+    db.flush()
+    stage = TimelineStage(
+        committed_timeline_id=timeline.id, title="Stage", stage_order=1, status="in_progress"
+    )
+    db.add(stage)
+    db.flush()
+    for order, days in enumerate(overdue_days, start=1):
+        db.add(TimelineMilestone(
+            timeline_stage_id=stage.id,
+            title=f"Milestone {order}",
+            milestone_order=order,
+            target_date=today - timedelta(days=days),
+            is_critical=False,
+            is_completed=False,
+        ))
+    db.flush()
+    return timeline
+
+
+def _suggestion(db, user, timeline, reason, days_ago):
+    db.add(TimelineAdjustmentSuggestion(
+        user_id=user.id,
+        committed_timeline_id=timeline.id,
+        reason=reason,
+        title="Earlier suggestion",
+        message="Earlier suggestion",
+        suggestion_payload={},
+        created_at=datetime.now(timezone.utc) - timedelta(days=days_ago),
+    ))
+    db.flush()
+
+
+def _summary(suggestions):
+    return sorted(
+        (str(s.user_id), str(s.committed_timeline_id), s.reason, s.title, s.message,
+         s.suggestion_payload)
+        for s in suggestions
+    )
+
+
+@requires_postgres
+def test_batch_suggestions_match_single_user_path(db):
+    """Latest timeline only, per-reason cooldown, same suggestions as the per-user path."""
+    cooldown = TimelineFeedbackService.SUGGESTION_COOLDOWN_DAYS
+    # No events, so every signal fires; the older timeline's overdue milestone is ignored
+    idle = _user(db)
+    idle_older = _timeline(db, idle, committed_days_ago=200, overdue_days=[90])
+    idle_latest = _timeline(db, idle, committed_days_ago=20, overdue_days=[3, 10])
+    # Supervision suggested within the cooldown; milestone delay only before it; writing
+    # suggested recently, but for the older timeline
+    writer = _user(db)
+    writer_older = _timeline(db, writer, committed_days_ago=100)
+    writer_latest = _timeline(db, writer, committed_days_ago=10, overdue_days=[5])
+    _suggestion(db, writer, writer_latest, REASON_SUPERVISION_INACTIVITY, days_ago=1)
+    _suggestion(db, writer, writer_latest, REASON_MILESTONE_DELAY, days_ago=cooldown + 1)
+    _suggestion(db, writer, writer_older, REASON_WRITING_STAGNATION, days_ago=1)
+    no_timeline = _user(db)
+    db.commit()
+    user_ids = [idle.id, writer.id, no_timeline.id]
+
+    batch = TimelineFeedbackService(db).generate_suggestions_for_users(user_ids)
+    batch_summary = _summary(s for created in batch.values() for s in created)
+    db.rollback()
+    single = TimelineFeedbackService(db)
+    single_summary = _summary(
+        s for uid in user_ids for s in single.generate_suggestions_for_user(uid)
+    )
+    db.rollback()
+
+    assert set(batch) == {idle.id, writer.id}
+    assert {(s.committed_timeline_id, s.reason) for s in batch[idle.id]} == {
+        (idle_latest.id, REASON_MILESTONE_DELAY),
+        (idle_latest.id, REASON_SUPERVISION_INACTIVITY),
+        (idle_latest.id, REASON_WRITING_STAGNATION),
+    }
+    assert idle_older.id not in {s.committed_timeline_id for s in batch[idle.id]}
+    assert {(s.committed_timeline_id, s.reason) for s in batch[writer.id]} == {
+        (writer_latest.id, REASON_MILESTONE_DELAY),
+        (writer_latest.id, REASON_WRITING_STAGNATION),
+    }
+    delay = next(s for s in batch[idle.id] if s.reason == REASON_MILESTONE_DELAY)
+    assert delay.suggestion_payload["delayed_milestone_count"] == 2
+    assert batch_summary == single_summary
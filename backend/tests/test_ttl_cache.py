@@ -0,0 +1,44 @@
+"""Tests for the in-process TTL cache."""
+
+import time
+
+from app.utils.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+    
+    def test_get_returns_stored_value(self):
+        cache = TTLCache(ttl_seconds=60)
+        cache.set(("user", "req"), {"snapshot_id": "abc"})
+        assert cache.get(("user", "req")) == {"snapshot_id": "abc"}
+    
+    def test_missing_key_returns_none(self):
+        cache = TTLCache(ttl_seconds=60)
+        assert cache.get("missing") is None
+    
+    def test_entries_expire(self):
+        cache = TTLCache(ttl_seconds=0.01)
+        cache.set("key", 1)
+        time.sleep(0.02)
+        assert cache.get("key") is None
+        assert len(cache) == 0
+    
+    def test_least_recently_used_entry_evicted(self):
+        cache = TTLCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+    
+    def test_invalidate_and_clear(self):
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0